@@ -1,7 +1,10 @@
 # This file is a demo for the 'Isothermal_Monolith_Simulator' object
 import sys
 sys.path.append('../..')
-from catalyst.isothermal_monolith_catalysis import *
+# Use a non-interactive backend for headless runs
+import matplotlib
+matplotlib.use("Agg")
+from catalyst.isothermal_monolith_catalysis import Isothermal_Monolith_Simulator
 
 # Read in data
 exp_name = "CO2_H2O_CO"
@@ -32,20 +35,17 @@ sim.fix_reaction("r11")
 # Will need to rerun auto_select_all_weight_factors() to add later times back
 sim.auto_select_all_weight_factors()
 
-sim.ignore_weight_factor("N2O","A0","T0",time_window=(0,110))
-sim.ignore_weight_factor("NO","A0","T0",time_window=(0,110))
-sim.ignore_weight_factor("NH3","A0","T0",time_window=(0,110))
-sim.ignore_weight_factor("H2","A0","T0",time_window=(0,110))
+sim.set_weight_mask(["N2O","NO","NH3","H2"], time_window=(0,110), age_list=["A0"], temp_list=["T0"])
 
 #call solver
 sim.finalize_auto_scaling()
 sim.run_solver()
 
-sim.plot_vs_data("CO", "A0", "T0", 5, display_live=False, file_name="exp-"+exp_name+"-CO-out")
-sim.plot_vs_data("NO", "A0", "T0", 5, display_live=False, file_name="exp-"+exp_name+"-NO-out")
-sim.plot_vs_data("NH3", "A0", "T0", 5, display_live=False, file_name="exp-"+exp_name+"-NH3-out")
-sim.plot_vs_data("N2O", "A0", "T0", 5, display_live=False, file_name="exp-"+exp_name+"-N2O-out")
-sim.plot_vs_data("H2", "A0", "T0", 5, display_live=False, file_name="exp-"+exp_name+"-H2-out")
+# The trajectories are pulled from the model once, up front
+traj = sim.gather_trajectories(["CO","NO","NH3","N2O","H2"], "A0", "T0", 5)
+for spec in traj:
+    sim.plot_vs_data(spec, "A0", "T0", 5, display_live=False,
+                    file_name="exp-"+exp_name+"-"+spec+"-out", traj=traj[spec])
 sim.plot_at_locations(["O2"], ["A0"], ["T0"], [0, 5], display_live=False, file_name="exp-"+exp_name+"-O2-out")
 
 sim.plot_at_times(["CO"], ["A0"], ["T0"], [30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80],
@@ -23,6 +23,8 @@ from scipy.optimize import least_squares
 # Import array and plotting tools
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 # Other import statements
 import os.path
@@ -31,12 +33,51 @@ from enum import Enum
 import time as TIME
 import datetime
 import json
+import hashlib
 from ast import literal_eval
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional faster (de)serialization libraries for saving/loading models
+#   If these are not installed, then the standard 'json' library is used
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Optional CasADi backend (see 'to_casadi'). If this is not installed, then
+#   the model can only be solved through pyomo
+try:
+    import casadi
+except ImportError:
+    casadi = None
+from pyomo.core.expr.numeric_expr import (SumExpression, LinearExpression,
+    MonomialTermExpression, ProductExpression, DivisionExpression,
+    PowExpression, NegationExpression, UnaryFunctionExpression)
 
 # IDAES is not installed, then the script will search for any other available 'ipopt' library
 if "idaes" in os.environ['CONDA_DEFAULT_ENV']:
     from idaes.core import *
 
+# numpy >= 2.0 renamed 'trapz' to 'trapezoid'
+#   This takes np.diff of the grid and sums the averaged neighbors along the
+#   axis in a single vectorized pass (scipy.integrate.trapezoid is the same
+#   numpy function, but only exists in newer scipy versions)
+if hasattr(np, "trapezoid"):
+    _trapezoid = np.trapezoid
+else:
+    _trapezoid = np.trapz
+
+# Buffer size for the result printers (many small writes per file)
+_OUTPUT_BUFFER_SIZE = 1<<20
+
+# Number of constraint scaling files kept in a cache folder
+_SCALING_CACHE_SIZE = 16
+
 # Define an Enum class for reaction types
 class ReactionType(Enum):
     Arrhenius = 1
@@ -103,10 +144,36 @@ def ergun_pressure_drop(mu, rho, v, dh, eps):
 #   A = pre-exponential factor (units depend on reaction)
 #   B = power of temperature (usually = 0)
 #   T = temperature of system in K
+#   invT = (optional) precomputed 1/T (e.g., a pyomo Expression shared
+#           by all reactions at a given node)
 #
 #   Function returns the k value of the Arrhenius Expression
-def arrhenius_rate_const(A, B, E, T):
-    return A*T**B*exp(-E/8.3145/T)
+#
+#   NOTE: When called from the model, the arguments are pyomo components, so
+#           this returns a symbolic expression (not a number). That expression
+#           is written to the .nl file and evaluated (and differentiated) by
+#           ipopt in compiled code. Thus, JIT compiling this function (e.g.,
+#           with numba) would not change the cost of solving the model. The
+#           same holds for batching the exp() calls into numpy arrays (e.g.,
+#           with MKL/VML or numexpr), since no python-level loop evaluates
+#           the rates during a solve. Any savings must come from making the
+#           expression itself smaller. Hence, T**B is folded into the exp()
+#           (T^B = exp(B*ln(T))), so there is one transcendental per rate
+#           constant instead of a pow and an exp.
+#
+#           In the isothermal model, T is fixed, so 1/T is already a constant
+#           in the .nl file. Thus, invT is only of use when T is a variable.
+#           Likewise, the parameters (A, B, E) of fixed reactions are treated
+#           as constants by the nl writer, which folds the whole rate constant
+#           into a single number. No separate code path is needed for these.
+def arrhenius_rate_const(A, B, E, T, invT=None):
+    if invT is None:
+        arg = -E/8.3145/T
+    else:
+        arg = -E/8.3145*invT
+    if (type(B) is int or type(B) is float) and B == 0:
+        return A*exp(arg)
+    return A*exp(B*log(T) + arg)
 
 # Helper function for Equilibrium Arrhenius reaction rates
 #   Af = forward rate pre-exponential term (units depend on reaction)
@@ -121,6 +188,133 @@ def equilibrium_arrhenius_consts(Af, Ef, dH, dS):
     Er = Ef - dH
     return (Ar, Er)
 
+# Helper function to determine the save/load format for a model file
+#   format = "auto" (by file extension), "json", or "msgpack"
+#
+#   Files ending in ".msgpack" or ".mpk" use msgpack in "auto" mode,
+#   all other files are treated as json
+def _model_file_format(file_name, format="auto"):
+    if format == "auto":
+        if file_name.endswith(".msgpack") or file_name.endswith(".mpk"):
+            format = "msgpack"
+        else:
+            format = "json"
+    if format != "json" and format != "msgpack":
+        raise Exception("Error! Unrecognized file format '"+str(format)+"'. Must be 'auto', 'json', or 'msgpack'")
+    if format == "msgpack" and msgpack == None:
+        raise Exception("Error! Cannot use 'msgpack' format without the 'msgpack' library installed")
+    return format
+
+# Helper function to convert the values of a saved component back into a dict
+#       keyed by index tuples (e.g., to pass to 'set_values' or 'store_values'
+#       in a single call). If 'keep' is given, only the keys it accepts are used.
+def _saved_values(data, keep=None):
+    vals = {}
+    for key in data:
+        index = literal_eval(key)
+        if keep == None or keep(index):
+            vals[index] = data[key]
+    return vals
+
+# Helper function to normalize a single item (or a list of items) into a list
+def _aslist(items):
+    if type(items) is list:
+        return items
+    return [items]
+
+# Helper function to check a model dictionary for any NaN or Inf values
+#       (orjson silently writes those as 'null', while json keeps them)
+def _has_nonfinite(obj):
+    if isinstance(obj, float):
+        return not np.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(val) for val in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(val) for val in obj)
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind == 'f' and not np.isfinite(obj).all()
+    return False
+
+# Helper function to write a model dictionary to a file
+#       json files are written with 'orjson' if available (much faster
+#       for the large number of floats in a model), unless the model holds
+#       a NaN or Inf value, which only json can write. Those are written as
+#       'null' by orjson, so the (slower) check is only needed if the output
+#       has a 'null' in it.
+def _dump_model_obj(obj, file_name, format="auto"):
+    format = _model_file_format(file_name, format)
+    if format == "msgpack":
+        with open(file_name,"wb") as file:
+            file.write(msgpack.packb(obj, use_bin_type=True))
+        return
+    if orjson != None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Fall back to json for any types orjson does not support
+            data = None
+        if data != None and (b"null" not in data or _has_nonfinite(obj) == False):
+            with open(file_name,"wb") as file:
+                file.write(data)
+            return
+    with open(file_name,"w") as file:
+        json.dump(obj,file)
+
+# Helper function to read a model dictionary from a file
+def _load_model_obj(file_name, format="auto"):
+    format = _model_file_format(file_name, format)
+    if format == "msgpack":
+        with open(file_name,"rb") as file:
+            return msgpack.unpackb(file.read(), raw=False, strict_map_key=False)
+    if orjson != None:
+        with open(file_name,"rb") as file:
+            data = file.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json files may contain 'NaN' or 'Infinity', which orjson rejects
+            return json.loads(data)
+    with open(file_name,"r") as file:
+        return json.load(file)
+
+# Helper function to translate a pyomo expression into a casadi expression
+#   var_map maps the id() of each unfixed pyomo variable to its casadi symbol.
+#   Fixed variables and parameters are replaced by their current values.
+def _casadi_expr(node, var_map):
+    if type(node) is int or type(node) is float:
+        return node
+    if not node.is_expression_type():
+        if node.is_variable_type() and not node.fixed:
+            return var_map[id(node)]
+        return value(node)
+    if node.is_named_expression_type():
+        return _casadi_expr(node.expr, var_map)
+    if not node.is_potentially_variable():
+        return value(node)
+    args = [_casadi_expr(arg, var_map) for arg in node.args]
+    if isinstance(node, (SumExpression, LinearExpression)):
+        return casadi.sum1(casadi.vertcat(*args))
+    if isinstance(node, (MonomialTermExpression, ProductExpression)):
+        return args[0]*args[1]
+    if isinstance(node, DivisionExpression):
+        return args[0]/args[1]
+    if isinstance(node, PowExpression):
+        return args[0]**args[1]
+    if isinstance(node, NegationExpression):
+        return -args[0]
+    if isinstance(node, UnaryFunctionExpression):
+        return getattr(casadi, node.getname())(args[0])
+    raise Exception("Error! Unable to translate "+type(node).__name__+" to casadi")
+
+# Helper function to simulate a single (age, temp) condition (in a worker process)
+#   build_func(age, temp) must return a discretized simulator with its ICs and
+#   BCs set, which is then initialized and solved. Returns the extracted solution.
+def _simulate_condition(build_func, age, temp):
+    sim = build_func(age, temp)
+    sim.initialize_simulator()
+    sim.run_solver(console_out=False)
+    return sim.extract_solution()
+
 # Class object to hold the simulator and all model components
 #       This object will be how a user interfaces with the
 #       pyomo simulator and dictates the form of the model
@@ -163,6 +357,10 @@ class Isothermal_Monolith_Simulator(object):
         self.model.diff_factor = Param(within=NonNegativeReals, initialize=1.4, mutable=True, units=None)
 
         # Add some tracking boolean statements
+        #   NOTE: Each builder function only checks the few flags it depends on,
+        #       and raises an Exception (does not exit) if one is not set. These
+        #       flags are also read by users/tests and saved with the model, so
+        #       they are kept as named booleans rather than packed into a mask.
         self.isBoundsSet = False
         self.isTimesSet = False
         self.isTempSet = False
@@ -182,6 +380,13 @@ class Isothermal_Monolith_Simulator(object):
         self.isBoundarySet = {}
         self.isObjectiveSet = False
         self.isInitialized = False
+        self.isWarmStartSet = False
+        self.isWarmStartValid = False
+        self._solution = None
+        self._rxn_species_kinds = {}
+        self._rxn_rate_terms_cache = {}
+        self._rxn_orders_built = {}
+        self._rxn_nz = {}
         self.build_time = TIME.time()
         self.initialize_time = 0
         self.solve_time = 0
@@ -257,16 +462,10 @@ class Isothermal_Monolith_Simulator(object):
         if self.isTimesSet == False:
             raise Exception("Error! Time dimension must be set first!")
 
-        if type(ages) is list:
-            i=0
-            for item in ages:
-                key = "age_"+str(i)
-                self.age_list[key] = item
-                i+=1
-            self.model.age_set = Set(initialize=ages)
-        else:
-            self.age_list["age_0"] = ages
-            self.model.age_set = Set(initialize=[ages])
+        ages = _aslist(ages)
+        for i, item in enumerate(ages):
+            self.age_list["age_"+str(i)] = item
+        self.model.age_set = Set(initialize=ages)
 
         self.isAgeSet = True
 
@@ -282,16 +481,10 @@ class Isothermal_Monolith_Simulator(object):
         if self.isAgeSet == False:
             raise Exception("Error! Must set ages for simulation first!")
 
-        if type(ages) is list:
-            i=0
-            for item in ages:
-                key = "age_"+str(i)
-                self.age_list[key] = item
-                i+=1
-            self.model.data_age_set = Set(initialize=ages)
-        else:
-            self.age_list["age_0"] = ages
-            self.model.data_age_set = Set(initialize=[ages])
+        ages = _aslist(ages)
+        for i, item in enumerate(ages):
+            self.age_list["age_"+str(i)] = item
+        self.model.data_age_set = Set(initialize=ages)
 
         # Check to see if each age in the data set has a cooresponding simulation set
         for age in self.model.data_age_set:
@@ -314,14 +507,9 @@ class Isothermal_Monolith_Simulator(object):
         if self.isAgeSet == False:
             raise Exception("Error! Catalyst ages must be set first!")
 
-        if type(temps) is list:
-            self.model.T_set = Set(initialize=temps)
-            self.model.T = Var(self.model.age_set, self.model.T_set, self.model.z, self.model.t,
-                                domain=NonNegativeReals, initialize=298, units=units.K)
-        else:
-            self.model.T_set = Set(initialize=[temps])
-            self.model.T = Var(self.model.age_set, self.model.T_set, self.model.z, self.model.t,
-                                domain=NonNegativeReals, initialize=298, units=units.K)
+        self.model.T_set = Set(initialize=_aslist(temps))
+        self.model.T = Var(self.model.age_set, self.model.T_set, self.model.z, self.model.t,
+                            domain=NonNegativeReals, initialize=298, units=units.K)
         # Create time dependent parameter for space velocity
         #       NOTE: Space velocity is volumetric flow rate of gas at STP per catalyst volume
         #               Different experimental runs may have different space velocities
@@ -359,10 +547,7 @@ class Isothermal_Monolith_Simulator(object):
         if self.isTempSet == False:
             raise Exception("Error! Model must have temperature information set first!")
 
-        if type(temps) is list:
-            self.model.data_T_set = Set(initialize=temps)
-        else:
-            self.model.data_T_set = Set(initialize=[temps])
+        self.model.data_T_set = Set(initialize=_aslist(temps))
         # Check to see if each temp in the data set has a cooresponding simulation set
         for temp in self.model.data_T_set:
             if temp not in self.model.T_set:
@@ -379,47 +564,35 @@ class Isothermal_Monolith_Simulator(object):
     #                       bulk/pore concentration of given species, at given
     #                       aging condition, at given temperature, at given
     #                       axial location, at given simulation time
+    #
+    #       NOTE: These Vars are dense on purpose. After discretization, every
+    #           (species, age, temp, z, t) point is an unknown of the same
+    #           nonlinear program that ipopt solves all at once, so there is
+    #           no smaller subset that could be held in numpy arrays instead.
     def add_gas_species(self, gas_species):
         if self.isTimesSet == False or self.isBoundsSet == False:
             raise Exception("Error! Cannot specify gas species until the time and bounds are set")
         if self.isTempSet == False or self.isAgeSet == False:
             raise Exception("Error! Cannot specify gas species until the temperatures and ages are set")
 
-        if type(gas_species) is list:
-            for item in gas_species:
-                if isinstance(item, str):
-                    self.gas_list[item] = {"bulk": item+"_b",
-                                            "washcoat": item+"_w",
-                                            "inlet": item+"_in"}
-                else:
-                    raise Exception("Error! Gas species must be a string. "
-                                    +str(item)+ " given is not a string object")
-            self.model.gas_set = Set(initialize=gas_species)
-            self.model.Cb = Var(self.model.gas_set, self.model.age_set, self.model.T_set,
-                            self.model.z, self.model.t,
-                            domain=NonNegativeReals, bounds=(1e-20,1),
-                            initialize=1e-20, units=units.mol/units.L)
-            self.model.C = Var(self.model.gas_set, self.model.age_set, self.model.T_set,
-                            self.model.z, self.model.t,
-                            domain=NonNegativeReals, bounds=(1e-20,1),
-                            initialize=1e-20, units=units.mol/units.L)
-        else:
-            if isinstance(gas_species, str):
-                self.gas_list[gas_species] = {"bulk": gas_species+"_b",
-                                            "washcoat": gas_species+"_w",
-                                            "inlet": gas_species+"_in"}
-                self.model.gas_set = Set(initialize=[gas_species])
-                self.model.Cb = Var(self.model.gas_set, self.model.age_set, self.model.T_set,
-                                self.model.z, self.model.t,
-                                domain=NonNegativeReals, bounds=(1e-20,1),
-                                initialize=1e-20, units=units.mol/units.L)
-                self.model.C = Var(self.model.gas_set, self.model.age_set, self.model.T_set,
-                                self.model.z, self.model.t,
-                                domain=NonNegativeReals, bounds=(1e-20,1),
-                                initialize=1e-20, units=units.mol/units.L)
+        gas_species = _aslist(gas_species)
+        for item in gas_species:
+            if isinstance(item, str):
+                self.gas_list[item] = {"bulk": item+"_b",
+                                        "washcoat": item+"_w",
+                                        "inlet": item+"_in"}
             else:
                 raise Exception("Error! Gas species must be a string. "
-                                +str(gas_species)+ " given is not a string object")
+                                +str(item)+ " given is not a string object")
+        self.model.gas_set = Set(initialize=gas_species)
+        self.model.Cb = Var(self.model.gas_set, self.model.age_set, self.model.T_set,
+                        self.model.z, self.model.t,
+                        domain=NonNegativeReals, bounds=(1e-20,1),
+                        initialize=1e-20, units=units.mol/units.L)
+        self.model.C = Var(self.model.gas_set, self.model.age_set, self.model.T_set,
+                        self.model.z, self.model.t,
+                        domain=NonNegativeReals, bounds=(1e-20,1),
+                        initialize=1e-20, units=units.mol/units.L)
         self.isGasSpecSet = True
         for spec in self.model.gas_set:
             self.isBoundarySet[spec] = {}
@@ -450,38 +623,24 @@ class Isothermal_Monolith_Simulator(object):
         if self.isDataTempSet == False or self.isDataAgeSet == False:
             raise Exception("Error! Cannot specify gas species until the data temperatures and ages are set")
 
-        if type(gas_species) is list:
-            self.model.data_gas_set = Set(initialize=gas_species)
-            self.model.Cb_data = Param(self.model.data_gas_set, self.model.data_age_set,
-                            self.model.data_T_set, self.model.z_data, self.model.t_data,
-                            within=Reals, mutable=True,
-                            initialize=1e-20, units=units.mol/units.L)
-            self.model.Cb_data_full = Param(self.model.data_gas_set, self.model.data_age_set,
-                            self.model.data_T_set, self.model.z_data, self.model.t_data_full,
-                            within=Reals, mutable=True,
-                            initialize=1e-20, units=units.mol/units.L)
-            self.model.w = Param(self.model.data_gas_set, self.model.data_age_set,
-                            self.model.data_T_set, self.model.t_data_full,
-                            within=NonNegativeReals, mutable=True,
-                            initialize=1, units=None)
-        else:
-            if isinstance(gas_species, str):
-                self.model.data_gas_set = Set(initialize=[gas_species])
-                self.model.Cb_data = Param(self.model.data_gas_set, self.model.data_age_set,
-                                self.model.data_T_set, self.model.z_data, self.model.t_data,
-                                within=Reals, mutable=True,
-                                initialize=1e-20, units=units.mol/units.L)
-                self.model.Cb_data_full = Param(self.model.data_gas_set, self.model.data_age_set,
-                                self.model.data_T_set, self.model.z_data, self.model.t_data_full,
-                                within=Reals, mutable=True,
-                                initialize=1e-20, units=units.mol/units.L)
-                self.model.w = Param(self.model.data_gas_set, self.model.data_age_set,
-                                self.model.data_T_set, self.model.t_data_full,
-                                within=NonNegativeReals, mutable=True,
-                                initialize=1, units=None)
-            else:
+        gas_species = _aslist(gas_species)
+        for item in gas_species:
+            if not isinstance(item, str):
                 raise Exception("Error! Gas species must be a string. "
-                                +str(gas_species)+" given is not a string object")
+                                +str(item)+" given is not a string object")
+        self.model.data_gas_set = Set(initialize=gas_species)
+        self.model.Cb_data = Param(self.model.data_gas_set, self.model.data_age_set,
+                        self.model.data_T_set, self.model.z_data, self.model.t_data,
+                        within=Reals, mutable=True,
+                        initialize=1e-20, units=units.mol/units.L)
+        self.model.Cb_data_full = Param(self.model.data_gas_set, self.model.data_age_set,
+                        self.model.data_T_set, self.model.z_data, self.model.t_data_full,
+                        within=Reals, mutable=True,
+                        initialize=1e-20, units=units.mol/units.L)
+        self.model.w = Param(self.model.data_gas_set, self.model.data_age_set,
+                        self.model.data_T_set, self.model.t_data_full,
+                        within=NonNegativeReals, mutable=True,
+                        initialize=1, units=None)
         # Check to see if each temp in the data set has a cooresponding simulation set
         for spec in self.model.data_gas_set:
             self.isDataValuesSet[spec] = {}
@@ -505,22 +664,16 @@ class Isothermal_Monolith_Simulator(object):
     def add_surface_species(self, surf_species):
         if self.isGasSpecSet == False:
             raise Exception("Error! Cannot specify surface species without having gas species")
-        if type(surf_species) is list:
-            self.model.surf_set = Set(initialize=surf_species)
-            self.model.q = Var(self.model.surf_set, self.model.age_set, self.model.T_set,
-                            self.model.z, self.model.t,
-                            domain=NonNegativeReals, bounds=(1e-20,10),
-                            initialize=1e-20, units=units.mol/units.L)
-        else:
-            if isinstance(surf_species, str):
-                self.model.surf_set = Set(initialize=[surf_species])
-                self.model.q = Var(self.model.surf_set, self.model.age_set, self.model.T_set,
-                                self.model.z, self.model.t,
-                                domain=NonNegativeReals, bounds=(1e-20,10),
-                                initialize=1e-20, units=units.mol/units.L)
-            else:
+        surf_species = _aslist(surf_species)
+        for item in surf_species:
+            if not isinstance(item, str):
                 raise Exception("Error! Surface species must be a string. "
-                                +str(surf_species)+" given is not a string object")
+                                +str(item)+" given is not a string object")
+        self.model.surf_set = Set(initialize=surf_species)
+        self.model.q = Var(self.model.surf_set, self.model.age_set, self.model.T_set,
+                        self.model.z, self.model.t,
+                        domain=NonNegativeReals, bounds=(1e-20,10),
+                        initialize=1e-20, units=units.mol/units.L)
         self.isSurfSpecSet = True
         self.model.dq_dt = DerivativeVar(self.model.q, wrt=self.model.t, initialize=0, units=units.mol/units.L/units.min)
 
@@ -534,38 +687,24 @@ class Isothermal_Monolith_Simulator(object):
         if self.isSurfSpecSet == False:
             raise Exception("Error! Cannot specify data surface species until the simulation surface species are set")
 
-        if type(surface_species) is list:
-            self.model.data_surface_set = Set(initialize=surface_species)
-            self.model.q_data = Param(self.model.data_surface_set, self.model.data_age_set,
-                            self.model.data_T_set, self.model.z_data, self.model.t_data,
-                            within=Reals, mutable=True,
-                            initialize=1e-20, units=units.mol/units.L)
-            self.model.q_data_full = Param(self.model.data_surface_set, self.model.data_age_set,
-                            self.model.data_T_set, self.model.z_data, self.model.t_data_full,
-                            within=Reals, mutable=True,
-                            initialize=1e-20, units=units.mol/units.L)
-            self.model.wq = Param(self.model.data_surface_set, self.model.data_age_set,
-                            self.model.data_T_set, self.model.t_data_full,
-                            within=NonNegativeReals, mutable=True,
-                            initialize=1, units=None)
-        else:
-            if isinstance(surface_species, str):
-                self.model.data_surface_set = Set(initialize=[surface_species])
-                self.model.q_data = Param(self.model.data_surface_set, self.model.data_age_set,
-                                self.model.data_T_set, self.model.z_data, self.model.t_data,
-                                within=Reals, mutable=True,
-                                initialize=1e-20, units=units.mol/units.L)
-                self.model.q_data_full = Param(self.model.data_surface_set, self.model.data_age_set,
-                                self.model.data_T_set, self.model.z_data, self.model.t_data_full,
-                                within=Reals, mutable=True,
-                                initialize=1e-20, units=units.mol/units.L)
-                self.model.wq = Param(self.model.data_surface_set, self.model.data_age_set,
-                                self.model.data_T_set, self.model.t_data_full,
-                                within=NonNegativeReals, mutable=True,
-                                initialize=1, units=None)
-            else:
+        surface_species = _aslist(surface_species)
+        for item in surface_species:
+            if not isinstance(item, str):
                 raise Exception("Error! Surface species must be a string. "
-                                +str(gas_species)+" given is not a string object")
+                                +str(item)+" given is not a string object")
+        self.model.data_surface_set = Set(initialize=surface_species)
+        self.model.q_data = Param(self.model.data_surface_set, self.model.data_age_set,
+                        self.model.data_T_set, self.model.z_data, self.model.t_data,
+                        within=Reals, mutable=True,
+                        initialize=1e-20, units=units.mol/units.L)
+        self.model.q_data_full = Param(self.model.data_surface_set, self.model.data_age_set,
+                        self.model.data_T_set, self.model.z_data, self.model.t_data_full,
+                        within=Reals, mutable=True,
+                        initialize=1e-20, units=units.mol/units.L)
+        self.model.wq = Param(self.model.data_surface_set, self.model.data_age_set,
+                        self.model.data_T_set, self.model.t_data_full,
+                        within=NonNegativeReals, mutable=True,
+                        initialize=1, units=None)
         # Check to see if each temp in the data set has a cooresponding simulation set
         for spec in self.model.data_surface_set:
             self.isDataValuesSet[spec] = {}
@@ -596,37 +735,22 @@ class Isothermal_Monolith_Simulator(object):
     def add_surface_sites(self, sites):
         if self.isSurfSpecSet == False:
             raise Exception("Error! Cannot specify surface sites without having surface species")
-        if type(sites) is list:
-            for item in sites:
-                if isinstance(item, str):
-                    self.site_list[item] = item
-                else:
-                    raise Exception("Error! Surface site must be a string. "
-                                    +str(item)+" given is not a string object")
-            self.model.site_set = Set(initialize=sites)
-            self.model.S = Var(self.model.site_set, self.model.age_set, self.model.T_set,
-                            self.model.z, self.model.t,
-                            domain=NonNegativeReals, bounds=(1e-20,10),
-                            initialize=1e-20, units=units.mol/units.L)
-            self.model.Smax = Param(self.model.site_set, self.model.age_set,
-                            self.model.z, self.model.t,
-                            within=NonNegativeReals, initialize=1e-20,
-                            mutable=True, units=units.mol/units.L)
-        else:
-            if isinstance(sites, str):
-                self.site_list[sites] = sites
-                self.model.site_set = Set(initialize=[sites])
-                self.model.S = Var(self.model.site_set, self.model.age_set, self.model.T_set,
-                                self.model.z, self.model.t,
-                                domain=NonNegativeReals, bounds=(1e-20,10),
-                                initialize=1e-20, units=units.mol/units.L)
-                self.model.Smax = Param(self.model.site_set, self.model.age_set,
-                                self.model.z, self.model.t,
-                                within=NonNegativeReals, initialize=1e-20,
-                                mutable=True, units=units.mol/units.L)
+        sites = _aslist(sites)
+        for item in sites:
+            if isinstance(item, str):
+                self.site_list[item] = item
             else:
-                raise Exception("Error! Surface sites must be a string. "
-                                +str(sites)+" given is not a string object")
+                raise Exception("Error! Surface site must be a string. "
+                                +str(item)+" given is not a string object")
+        self.model.site_set = Set(initialize=sites)
+        self.model.S = Var(self.model.site_set, self.model.age_set, self.model.T_set,
+                        self.model.z, self.model.t,
+                        domain=NonNegativeReals, bounds=(1e-20,10),
+                        initialize=1e-20, units=units.mol/units.L)
+        self.model.Smax = Param(self.model.site_set, self.model.age_set,
+                        self.model.z, self.model.t,
+                        within=NonNegativeReals, initialize=1e-20,
+                        mutable=True, units=units.mol/units.L)
 
         self.model.u_S = Param(self.model.site_set, self.model.surf_set, domain=Reals,
                                         initialize=0, mutable=True)
@@ -783,12 +907,17 @@ class Isothermal_Monolith_Simulator(object):
             raise Exception("Error! Cannot have a negative concentration of sites")
         if value < 1e-20:
             value = 1e-20
-        self.model.Smax[site, age, :, :].set_value(value)
+        t_list = list(self.model.t)
+        self.model.Smax.store_values({(site,age,loc,time): value for loc in self.model.z for time in t_list})
 
     # Set the isothermal temperatures for a simulation
     #   Sets all to a constant, can be changed later
+    #
+    #   NOTE: Values are set from an explicit dict of indices, since iterating
+    #           the slice T[age,temp,:,:] searches over all ages and temps
     def set_isothermal_temp(self,age,temp,value):
-        self.model.T[age,temp,:,:].set_value(value)
+        t_list = list(self.model.t)
+        self.model.T.set_values({(age,temp,loc,time): value for loc in self.model.z for time in t_list})
         self.isVelocityRecalculated = False
         self.isIsothermalTempSet = True
 
@@ -797,7 +926,7 @@ class Isothermal_Monolith_Simulator(object):
     #       User may also provide reference pressure and temperature
     #       associated with this space velocity
     def set_space_velocity(self,age,temp,value,Pref=101.15,Tref=273.15, byTotalVolume=True):
-        self.model.space_velocity[age,temp,:].set_value(value)
+        self.model.space_velocity.set_values({(age,temp,time): value for time in self.model.t})
         self.model.Pref[age,temp].set_value(Pref)
         self.model.Tref[age,temp].set_value(Tref)
         self.isSpaceVelocityByTotalVolume = byTotalVolume
@@ -841,6 +970,11 @@ class Isothermal_Monolith_Simulator(object):
     #       reaction (rxn) you want to specify and then pass a dictionary
     #       containing relevant reaction information.
     #
+    #       NOTE: The 'rxn_orders' are read when the constraints are built.
+    #           Orders of 0 and 1 are built into the rate expressions as is, so
+    #           they cannot be changed afterwards ('initialize_simulator' and
+    #           'run_solver' raise an error if they were). Other orders may still
+    #           be changed after 'build_constraints' (but not to 0 or 1).
     #
     def set_reaction_info(self, rxn, info):
         if self.isRxnSet == False:
@@ -955,22 +1089,36 @@ class Isothermal_Monolith_Simulator(object):
         self.model.add_component(rxn+"_products", Set(initialize=prod_list))
 
         # Grab all stoichiometry information
+        #       The stoichiometry of each species is computed once and then
+        #       stored for all locations in a single call (instead of searching
+        #       the u_C[spec,rxn,:] slice once per species)
+        #
+        #       NOTE: These are only read while building the constraints (and
+        #           by the nl writer). There is no numeric loop over them during
+        #           a solve, so a compact (e.g., int8) copy would not be used.
+        z_list = list(self.model.z)
+        u_C_vals = {}
         for spec in self.model.gas_set:
             u_C_sum = 0
             if spec in info["mol_reactants"]:
                 u_C_sum -= info["mol_reactants"][spec]
             if spec in info["mol_products"]:
                 u_C_sum += info["mol_products"][spec]
-            self.model.u_C[spec,rxn,:].set_value(u_C_sum)
+            for loc in z_list:
+                u_C_vals[spec,rxn,loc] = u_C_sum
+        self.model.u_C.store_values(u_C_vals)
 
         if self.isSurfSpecSet == True:
+            u_q_vals = {}
             for spec in self.model.surf_set:
                 u_q_sum = 0
                 if spec in info["mol_reactants"]:
                     u_q_sum -= info["mol_reactants"][spec]
                 if spec in info["mol_products"]:
                     u_q_sum += info["mol_products"][spec]
-                self.model.u_q[spec,rxn,:].set_value(u_q_sum)
+                for loc in z_list:
+                    u_q_vals[spec,rxn,loc] = u_q_sum
+            self.model.u_q.store_values(u_q_vals)
 
         # Set reaction order information
         for spec in self.model.all_species_set:
@@ -982,14 +1130,48 @@ class Isothermal_Monolith_Simulator(object):
         if "override_molar_contribution" in info:
             print("WARNING! Overriding the molar contributions can result in undefined model behavior.")
             for spec in info["override_molar_contribution"]:
+                val = info["override_molar_contribution"][spec]
                 if spec in self.model.gas_set:
-                    self.model.u_C[spec,rxn,:].set_value(info["override_molar_contribution"][spec])
+                    self.model.u_C.store_values({(spec,rxn,loc): val for loc in z_list})
                 if self.isSurfSpecSet == True:
                     if spec in self.model.surf_set:
-                        self.model.u_q[spec,rxn,:].set_value(info["override_molar_contribution"][spec])
+                        self.model.u_q.store_values({(spec,rxn,loc): val for loc in z_list})
 
         self.isRxnBuilt[rxn] = True
 
+    # Function to update the kinetic parameters of an existing model in place
+    #       Use this (instead of building a new simulator) for parameter sweeps,
+    #       since only the values change and none of the model structure does.
+    #       The 'params' dictionary is keyed by reaction, and each value is a
+    #       dictionary of the same 'parameters' used in 'set_reaction_info'
+    #       (e.g., {"r1": {"A": 2.5e6, "E": 50000}}). Only the values given are
+    #       changed. Bounds are left alone, unless the '_lb'/'_ub' are given.
+    #
+    #       NOTE: Reaction orders and stoichiometry are part of the structure
+    #           of the built model, so changing those still requires a rebuild.
+    def update_parameters_only(self, params):
+        for rxn in params:
+            if rxn in self.model.arrhenius_rxns:
+                param_vars = {"A": self.model.A, "B": self.model.B, "E": self.model.E}
+            elif rxn in self.model.equ_arrhenius_rxns:
+                param_vars = {"A": self.model.Af, "E": self.model.Ef,
+                                "dH": self.model.dH, "dS": self.model.dS}
+            else:
+                raise Exception("Error! Given reaction name does not exist in model. "
+                                +str(rxn)+ " given does not exist")
+            for name in params[rxn]:
+                if name.endswith("_lb") or name.endswith("_ub"):
+                    continue
+                if name not in param_vars:
+                    raise Exception("Error! Invalid parameter name "+str(name)+" for reaction "+str(rxn))
+                var = param_vars[name][rxn]
+                if name+"_lb" in params[rxn]:
+                    var.setlb(params[rxn][name+"_lb"])
+                if name+"_ub" in params[rxn]:
+                    var.setub(params[rxn][name+"_ub"])
+                var.set_value(params[rxn][name])
+        self._solution = None
+
     # Function to manually override parameter bounds for reactions
     #   This is optional. Default values are setup in the 'set_reaction_info' function
     #       User MUST provide...
@@ -1034,8 +1216,9 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.A[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    self.model.A[rxn].setlb(self.model.A[rxn].value*(1-factor_low))
-                    self.model.A[rxn].setub(self.model.A[rxn].value*(1+factor_up))
+                    val = self.model.A[rxn].value
+                    self.model.A[rxn].setlb(val*(1-factor_low))
+                    self.model.A[rxn].setub(val*(1+factor_up))
                     return
             elif param == "B":
                 if bounds != None:
@@ -1043,12 +1226,13 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.B[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    if self.model.B[rxn].value >=0:
-                        self.model.B[rxn].setlb(self.model.B[rxn].value*(1-factor_low))
-                        self.model.B[rxn].setub(self.model.B[rxn].value*(1+factor_up))
+                    val = self.model.B[rxn].value
+                    if val >=0:
+                        self.model.B[rxn].setlb(val*(1-factor_low))
+                        self.model.B[rxn].setub(val*(1+factor_up))
                     else:
-                        self.model.B[rxn].setub(self.model.B[rxn].value*(1-factor_low))
-                        self.model.B[rxn].setlb(self.model.B[rxn].value*(1+factor_up))
+                        self.model.B[rxn].setub(val*(1-factor_low))
+                        self.model.B[rxn].setlb(val*(1+factor_up))
                     return
             elif param == "E":
                 if bounds != None:
@@ -1056,12 +1240,13 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.E[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    if self.model.E[rxn].value >=0:
-                        self.model.E[rxn].setlb(self.model.E[rxn].value*(1-factor_low))
-                        self.model.E[rxn].setub(self.model.E[rxn].value*(1+factor_up))
+                    val = self.model.E[rxn].value
+                    if val >=0:
+                        self.model.E[rxn].setlb(val*(1-factor_low))
+                        self.model.E[rxn].setub(val*(1+factor_up))
                     else:
-                        self.model.E[rxn].setub(self.model.E[rxn].value*(1-factor_low))
-                        self.model.E[rxn].setlb(self.model.E[rxn].value*(1+factor_up))
+                        self.model.E[rxn].setub(val*(1-factor_low))
+                        self.model.E[rxn].setlb(val*(1+factor_up))
                     return
             else:
                 print("Error! Invalid parameter name")
@@ -1073,8 +1258,9 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.Af[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    self.model.Af[rxn].setlb(self.model.Af[rxn].value*(1-factor_low))
-                    self.model.Af[rxn].setub(self.model.Af[rxn].value*(1+factor_up))
+                    val = self.model.Af[rxn].value
+                    self.model.Af[rxn].setlb(val*(1-factor_low))
+                    self.model.Af[rxn].setub(val*(1+factor_up))
                     return
             elif param == "E":
                 if bounds != None:
@@ -1082,12 +1268,13 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.Ef[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    if self.model.Ef[rxn].value >=0:
-                        self.model.Ef[rxn].setlb(self.model.Ef[rxn].value*(1-factor_low))
-                        self.model.Ef[rxn].setub(self.model.Ef[rxn].value*(1+factor_up))
+                    val = self.model.Ef[rxn].value
+                    if val >=0:
+                        self.model.Ef[rxn].setlb(val*(1-factor_low))
+                        self.model.Ef[rxn].setub(val*(1+factor_up))
                     else:
-                        self.model.Ef[rxn].setub(self.model.Ef[rxn].value*(1-factor_low))
-                        self.model.Ef[rxn].setlb(self.model.Ef[rxn].value*(1+factor_up))
+                        self.model.Ef[rxn].setub(val*(1-factor_low))
+                        self.model.Ef[rxn].setlb(val*(1+factor_up))
                     return
             elif param == "dH":
                 if bounds != None:
@@ -1095,12 +1282,13 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.dH[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    if self.model.dH[rxn].value >=0:
-                        self.model.dH[rxn].setlb(self.model.dH[rxn].value*(1-factor_low))
-                        self.model.dH[rxn].setub(self.model.dH[rxn].value*(1+factor_up))
+                    val = self.model.dH[rxn].value
+                    if val >=0:
+                        self.model.dH[rxn].setlb(val*(1-factor_low))
+                        self.model.dH[rxn].setub(val*(1+factor_up))
                     else:
-                        self.model.dH[rxn].setub(self.model.dH[rxn].value*(1-factor_low))
-                        self.model.dH[rxn].setlb(self.model.dH[rxn].value*(1+factor_up))
+                        self.model.dH[rxn].setub(val*(1-factor_low))
+                        self.model.dH[rxn].setlb(val*(1+factor_up))
                     return
             elif param == "dS":
                 if bounds != None:
@@ -1108,17 +1296,63 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.dS[rxn].setub(bounds[1])
                     return
                 if factor != None:
-                    if self.model.dS[rxn].value >=0:
-                        self.model.dS[rxn].setlb(self.model.dS[rxn].value*(1-factor_low))
-                        self.model.dS[rxn].setub(self.model.dS[rxn].value*(1+factor_up))
+                    val = self.model.dS[rxn].value
+                    if val >=0:
+                        self.model.dS[rxn].setlb(val*(1-factor_low))
+                        self.model.dS[rxn].setub(val*(1+factor_up))
                     else:
-                        self.model.dS[rxn].setub(self.model.dS[rxn].value*(1-factor_low))
-                        self.model.dS[rxn].setlb(self.model.dS[rxn].value*(1+factor_up))
+                        self.model.dS[rxn].setub(val*(1-factor_low))
+                        self.model.dS[rxn].setlb(val*(1+factor_up))
                     return
             else:
                 print("Error! Invalid parameter name")
                 return
 
+    # Function to override parameter bounds for many reactions at once
+    #   Bounds are set relative to the current value of each parameter
+    #       User MUST provide...
+    #           spec_dict = dictionary of tuples for each reaction to change
+    #                       {rxn: (param, lower_mult, upper_mult), ...}
+    #
+    #               param = name of param to apply changes to
+    #                       ("A", "B", "E", "dH", or "dS")
+    #               lower_mult = multiplier for the lower bound (value*lower_mult)
+    #               upper_mult = multiplier for the upper bound (value*upper_mult)
+    #
+    #       Invalid entries are skipped (same as 'set_reaction_param_bounds')
+    def set_reaction_param_bounds_bulk(self, spec_dict):
+        if type(spec_dict) is not dict:
+            raise Exception("Error! Must provide a dictionary of {rxn: (param, lower_mult, upper_mult)}")
+        arr_vars = {"A": self.model.A, "B": self.model.B, "E": self.model.E}
+        equ_vars = {"A": self.model.Af, "E": self.model.Ef, "dH": self.model.dH, "dS": self.model.dS}
+        for rxn in spec_dict:
+            if rxn not in self.model.all_rxns:
+                print("Error! Invalid reaction given. Continuing anyway.")
+                continue
+            if self.isRxnBuilt[rxn] == False:
+                print("Error! Cannot changes bounds of reaction without first calling 'set_reaction_info'")
+                print("\tSkipping this action...")
+                continue
+            param, lower_mult, upper_mult = spec_dict[rxn]
+            if lower_mult > upper_mult:
+                print("Error! Multipliers must be given as an ORDERED tuple argument (param, lower, upper)")
+                continue
+            if rxn in self.model.arrhenius_rxns:
+                var_dict = arr_vars
+            else:
+                var_dict = equ_vars
+            if param not in var_dict:
+                print("Error! Invalid parameter name")
+                continue
+            var = var_dict[param][rxn]
+            val = var.value
+            if val >= 0:
+                var.setlb(val*lower_mult)
+                var.setub(val*upper_mult)
+            else:
+                var.setlb(val*upper_mult)
+                var.setub(val*lower_mult)
+
     # Function to define weight factors to be used in the objective function
     def set_weight_factor(self, spec, age, temp, value):
         if self.isDataGasSpecSet == False and self.isDataSurfSpecSet == False:
@@ -1177,6 +1411,18 @@ class Isothermal_Monolith_Simulator(object):
     #   time_window = tuple of (start_time, end_time) where the weight
     #               factors are to be set to zero
     def ignore_weight_factor(self, spec, age, temp, time_window):
+        self.set_weight_mask([spec], time_window, age_list=[age], temp_list=[temp])
+
+    # Function to ignore weight factors for a list of species between a specified time range
+    #   spec_list = list of species names to ignore weight factors for
+    #   time_window = tuple of (start_time, end_time) where the weight
+    #               factors are to be set to zero
+    #   age_list = (optional) list of ages to apply to (default = all data ages)
+    #   temp_list = (optional) list of temperatures to apply to (default = all data temps)
+    #
+    #   NOTE: The data times inside the window are found only once and then
+    #           applied to all species, ages, and temperatures given.
+    def set_weight_mask(self, spec_list, time_window, age_list=None, temp_list=None):
         if self.isDataGasSpecSet == False and self.isDataSurfSpecSet == False:
             raise Exception("Error! Cannot specify weight factors prior to setting up the data")
 
@@ -1186,34 +1432,45 @@ class Isothermal_Monolith_Simulator(object):
         if time_window[0] > time_window[1]:
             raise Exception("Error! Tuple must be (lower_time, higher_time)")
 
-        inside = False
-        for time in self.model.t_data:
-            if time >= time_window[0] and time <= time_window[1]:
-                inside = True
-            else:
-                inside = False
+        if isinstance(spec_list, str):
+            spec_list = [spec_list]
+        if age_list == None:
+            age_list = list(self.model.data_age_set)
+        if temp_list == None:
+            temp_list = list(self.model.data_T_set)
+
+        # Find all data times inside of the window (data times may not be sorted)
+        times = list(self.model.t_data)
+        t_arr = np.array(times, dtype=float)
+        order = np.argsort(t_arr, kind='stable')
+        lo = np.searchsorted(t_arr[order], time_window[0], side='left')
+        hi = np.searchsorted(t_arr[order], time_window[1], side='right')
+        masked_times = [times[i] for i in order[lo:hi]]
 
-            if inside == True:
-                if self.isDataGasSpecSet == True:
-                    if spec in self.model.data_gas_set:
-                        self.model.w[spec,age,temp,time].set_value(0)
-                if self.isDataSurfSpecSet == True:
-                    if spec in self.model.data_surface_set:
-                        self.model.wq[spec,age,temp,time].set_value(0)
+        for spec in spec_list:
+            if self.isDataGasSpecSet == True:
+                if spec in self.model.data_gas_set:
+                    for age in age_list:
+                        for temp in temp_list:
+                            for time in masked_times:
+                                self.model.w[spec,age,temp,time].set_value(0)
+            if self.isDataSurfSpecSet == True:
+                if spec in self.model.data_surface_set:
+                    for age in age_list:
+                        for temp in temp_list:
+                            for time in masked_times:
+                                self.model.wq[spec,age,temp,time].set_value(0)
 
 
     # Function to ignore all weight factors within a specified time range
     def ignore_all_weight_factors(self, time_window):
+        spec_list = []
         if self.isDataGasSpecSet == True:
-            for spec in self.model.data_gas_set:
-                for age in self.model.data_age_set:
-                    for temp in self.model.data_T_set:
-                        self.ignore_weight_factor(spec, age, temp, time_window)
+            spec_list += list(self.model.data_gas_set)
         if self.isDataSurfSpecSet == True:
-            for spec in self.model.data_surface_set:
-                for age in self.model.data_age_set:
-                    for temp in self.model.data_T_set:
-                        self.ignore_weight_factor(spec, age, temp, time_window)
+            spec_list += list(self.model.data_surface_set)
+        if len(spec_list) > 0:
+            self.set_weight_mask(spec_list, time_window)
 
     # Function to set a reference diffusivity for a species
     #       spec = name of species to set gas phase diffusivity for
@@ -1296,69 +1553,205 @@ class Isothermal_Monolith_Simulator(object):
 
         return (var[spec,age,temp,loc_val,time_val] + z_slope*z_dist + t_slope*t_dist)
 
+    # Helper function to classify the reactants (or products) of a reaction
+    #       Returns a list of (var, spec) tuples, where var is the name of the
+    #       model variable that holds the species ('C', 'q', or 'S'). The list
+    #       is built on first use and cached, so the rate functions do not
+    #       repeat the set lookups for every (age, temp, loc, time).
+    #
+    #       NOTE: This is also the only place where the rate expressions depend
+    #           on 'isSurfSpecSet' and 'isSitesSet'. The flags are read once per
+    #           reaction here, so the rate functions themselves need no special
+    #           versions for gas only, surface, or site models.
+    def _rxn_species_kind(self, rxn, side="reactants"):
+        kinds = self._rxn_species_kinds.get((rxn, side))
+        if kinds == None:
+            kinds = []
+            for spec in self.model.component(rxn+"_"+side):
+                if spec in self.model.gas_set:
+                    kinds.append(('C', spec))
+                if self.isSurfSpecSet == True:
+                    if spec in self.model.surf_set:
+                        kinds.append(('q', spec))
+                    if self.isSitesSet == True:
+                        if spec in self.model.site_set:
+                            kinds.append(('S', spec))
+            self._rxn_species_kinds[(rxn, side)] = kinds
+        return kinds
+
+    # Helper function to grab the factors in the rate expression of a reaction
+    #       Returns a list of (var, spec, order) tuples, where the model variable
+    #       and reaction order parameter are already resolved, so the rate
+    #       functions only need to index var by (age, temp, loc, time). The list
+    #       is built on first use and cached.
+    #
+    #       NOTE: Factors of order 0 are left out and factors of order 1 are
+    #           returned with an order of None, so that the rate functions
+    #           multiply by the variable directly instead of using a pow().
+    #           All other orders are returned as a reference to model.rxn_orders.
+    #           Thus, orders of 0 and 1 are fixed when the constraints are built
+    #           (see '_check_rxn_orders'), while other orders may still be
+    #           changed afterwards (but not to 0 or 1).
+    def _rxn_rate_terms(self, rxn, side="reactants"):
+        terms = self._rxn_rate_terms_cache.get((rxn, side))
+        if terms == None:
+            terms = []
+            for (var, spec) in self._rxn_species_kind(rxn, side):
+                order = value(self.model.rxn_orders[rxn,spec])
+                if order == 0 or order == 1:
+                    self._rxn_orders_built[rxn,spec] = order
+                if order == 0:
+                    continue
+                if order == 1:
+                    terms.append((getattr(self.model, var), spec, None))
+                else:
+                    terms.append((getattr(self.model, var), spec, self.model.rxn_orders[rxn,spec]))
+            self._rxn_rate_terms_cache[(rxn, side)] = terms
+        return terms
+
+    # Helper function to check that no reaction order which was built into the
+    #       rate expressions as 0 or 1 has been changed since building the
+    #       constraints (those changes would otherwise be silently ignored)
+    def _check_rxn_orders(self):
+        for (rxn, spec) in self._rxn_orders_built:
+            if value(self.model.rxn_orders[rxn,spec]) != self._rxn_orders_built[rxn,spec]:
+                raise Exception("Error! Reaction order of "+str(spec)+" in "+str(rxn)+
+                                " was changed from "+str(self._rxn_orders_built[rxn,spec])+
+                                " after building the constraints. Orders of 0 and 1 must"+
+                                " be set before calling 'build_constraints'")
+
+    # Helper function to check if spec is a declared reactant or product of rxn
+    def _rxn_declares(self, rxn, spec):
+        for side in ("_reactants", "_products"):
+            members = self.model.find_component(rxn+side)
+            if members is not None and spec in members:
+                return True
+        return False
+
+    # Helper function to grab the reactions that a species takes part in
+    #       Returns a tuple of (arrhenius_rxns, equ_arrhenius_rxns) for which spec
+    #       is a declared reactant or product (or has a non-zero molar
+    #       contribution (u) at some location, e.g., from an override). All other
+    #       terms are structurally zero and are left out of the reaction sums.
+    #       The lists are built on first use and cached.
+    #
+    #       NOTE: The terms kept still reference u_C/u_q, so the contributions
+    #           of declared species may be changed after building the constraints
+    #           (e.g., for reaction zones). Only an override for a species that is
+    #           neither a reactant nor a product must be set before building.
+    #
+    #       NOTE: The filter is per species, not per (species, location). The
+    #           discretizer calls the constraint rules for the new points in z
+    #           while their u_C/u_q are still at the default of 0 (they are only
+    #           filled in after 'apply_to'), so a per location test would drop
+    #           every term at those points.
+    def _rxn_nonzero(self, u, spec):
+        rxns = self._rxn_nz.get((u.local_name, spec))
+        if rxns == None:
+            z_list = list(self.model.z)
+            nz = []
+            for rxn_set in (self.model.arrhenius_rxns, self.model.equ_arrhenius_rxns):
+                nz.append([rxn for rxn in rxn_set
+                            if self._rxn_declares(rxn, spec)
+                            or any(value(u[spec,rxn,loc]) != 0 for loc in z_list)])
+            rxns = tuple(nz)
+            self._rxn_nz[(u.local_name, spec)] = rxns
+        return rxns
+
+    # Helper function to (re)build the reaction caches above
+    #       Called at the start of 'build_constraints', so that the rate
+    #       expressions are built from the orders and molar contributions set
+    #       at that time, and the constraint rules only do dict lookups
+    def _build_rxn_caches(self):
+        self._rxn_species_kinds = {}
+        self._rxn_rate_terms_cache = {}
+        self._rxn_orders_built = {}
+        self._rxn_nz = {}
+        for rxn in self.model.all_rxns:
+            self._rxn_rate_terms(rxn, "reactants")
+            self._rxn_rate_terms(rxn, "products")
+        for spec in self.model.gas_set:
+            self._rxn_nonzero(self.model.u_C, spec)
+        if self.isSurfSpecSet == True:
+            for spec in self.model.surf_set:
+                self._rxn_nonzero(self.model.u_q, spec)
+
     # Define a single arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
-    def arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
+    #
+    #       T (and invT) may be given by the caller (defaults to model.T)
+    def arrhenius_rate_func(self, rxn, model, age, temp, loc, time, T=None, invT=None):
         r = 0
-        k = arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], model.T[age,temp,loc,time])
+        if T is None:
+            T = model.T[age,temp,loc,time]
+        k = arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], T, invT=invT)
         r=k
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                r=r*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    r=r*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        r=r*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        for (var, spec, order) in self._rxn_rate_terms(rxn, "reactants"):
+            if order is None:
+                r=r*var[spec,age,temp,loc,time]
+            else:
+                r=r*var[spec,age,temp,loc,time]**order
         return r
 
     # Define a single equilibrium arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
-    def equilibrium_arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
+    def equilibrium_arrhenius_rate_func(self, rxn, model, age, temp, loc, time, T=None, invT=None):
         r = 0
+        if T is None:
+            T = model.T[age,temp,loc,time]
         (Ar, Er) = equilibrium_arrhenius_consts(model.Af[rxn], model.Ef[rxn], model.dH[rxn], model.dS[rxn])
-        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], model.T[age,temp,loc,time])
-        kr = arrhenius_rate_const(Ar, 0, Er, model.T[age,temp,loc,time])
+        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], T, invT=invT)
+        kr = arrhenius_rate_const(Ar, 0, Er, T, invT=invT)
         rf=kf
         rr=kr
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                rf=rf*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    rf=rf*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        rf=rf*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        for spec in model.component(rxn+"_products"):
-             if spec in model.gas_set:
-                 rr=rr*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-             if self.isSurfSpecSet == True:
-                 if spec in model.surf_set:
-                     rr=rr*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                 if self.isSitesSet == True:
-                     if spec in model.site_set:
-                         rr=rr*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        for (var, spec, order) in self._rxn_rate_terms(rxn, "reactants"):
+            if order is None:
+                rf=rf*var[spec,age,temp,loc,time]
+            else:
+                rf=rf*var[spec,age,temp,loc,time]**order
+        for (var, spec, order) in self._rxn_rate_terms(rxn, "products"):
+            if order is None:
+                rr=rr*var[spec,age,temp,loc,time]
+            else:
+                rr=rr*var[spec,age,temp,loc,time]**order
         r = rf-rr
         return r
 
+    # Define the rate of each reaction at each node (as an Expression)
+    #       Every species (and energy balance) that a reaction takes part in uses
+    #       the same rate at a given point. As a named Expression, the rate is
+    #       written to the .nl file once (as a defined variable), so ipopt
+    #       evaluates (and differentiates) it once per node, instead of once for
+    #       every constraint that the reaction shows up in.
+    def reaction_rate(self, m, rxn, age, temp, loc, time):
+        if rxn in m.arrhenius_rxns:
+            return self.arrhenius_rate_func(rxn, m, age, temp, loc, time)
+        return self.equilibrium_arrhenius_rate_func(rxn, m, age, temp, loc, time)
+
     # Define a function for the reaction sum for gas species
+    #
+    #   NOTE: This only builds the symbolic sum (once per constraint). The data
+    #           layout seen while solving is ipopt's own (contiguous arrays of
+    #           the variables and sparse Jacobian entries), not the layout of
+    #           the pyomo Vars, so re-ordering the Vars (e.g., species-major)
+    #           would not change memory access during the solve.
     def reaction_sum_gas(self, gas_spec, model, age, temp, loc, time):
         r_sum=0
-        for r in model.arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
-        for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+        (arr_rxns, equ_rxns) = self._rxn_nonzero(model.u_C, gas_spec)
+        for r in arr_rxns:
+            r_sum += model.u_C[gas_spec,r,loc]*model.rxn_rate[r,age,temp,loc,time]
+        for re in equ_rxns:
+            r_sum += model.u_C[gas_spec,re,loc]*model.rxn_rate[re,age,temp,loc,time]
         return r_sum
 
     # Define a function for the reaction sum for surface species
     def reaction_sum_surf(self, surf_spec, model, age, temp, loc, time):
         r_sum=0
-        for r in model.arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
-        for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+        (arr_rxns, equ_rxns) = self._rxn_nonzero(model.u_q, surf_spec)
+        for r in arr_rxns:
+            r_sum += model.u_q[surf_spec,r,loc]*model.rxn_rate[r,age,temp,loc,time]
+        for re in equ_rxns:
+            r_sum += model.u_q[surf_spec,re,loc]*model.rxn_rate[re,age,temp,loc,time]
         return r_sum
 
     # Define a function for the site sum
@@ -1369,16 +1762,24 @@ class Isothermal_Monolith_Simulator(object):
         return sum
 
     # Bulk mass balance constraint
+    #
+    #   NOTE: The scalar params (eb, ew, Ga) are looked up once per rule call and
+    #           kept as (mutable) params, so that they can still be changed after
+    #           the constraints are built. The nl writer writes them as numbers.
     def bulk_mb_constraint(self, m, gas, age, temp, z, t):
-        return m.eb*m.dCb_dt[gas, age, temp, z, t] + m.eb*m.v[age,temp,z,t]*m.dCb_dz[gas, age, temp, z, t] == -(1-m.eb)*m.Ga*m.km[gas, age, temp, z, t]*(m.Cb[gas, age, temp, z, t] - m.C[gas, age, temp, z, t])
+        eb = m.eb
+        idx = (gas, age, temp, z, t)
+        return eb*m.dCb_dt[idx] + eb*m.v[age,temp,z,t]*m.dCb_dz[idx] == -(1-eb)*m.Ga*m.km[idx]*(m.Cb[idx] - m.C[idx])
 
     # Washcoat mass balance constraint
     def pore_mb_constraint(self, m, gas, age, temp, z, t):
         rxn_sum=self.reaction_sum_gas(gas, m, age, temp, z, t)
+        eb = m.eb
+        idx = (gas, age, temp, z, t)
         if self.isReactionSetByTotalVolume == False:
-            return m.ew*(1-m.eb)*m.dC_dt[gas, age, temp, z, t] == (1-m.eb)*m.Ga*m.km[gas, age, temp, z, t]*(m.Cb[gas, age, temp, z, t] - m.C[gas, age, temp, z, t]) + (1-m.eb)*rxn_sum
+            return m.ew*(1-eb)*m.dC_dt[idx] == (1-eb)*m.Ga*m.km[idx]*(m.Cb[idx] - m.C[idx]) + (1-eb)*rxn_sum
         else:
-            return m.ew*(1-m.eb)*m.dC_dt[gas, age, temp, z, t] == (1-m.eb)*m.Ga*m.km[gas, age, temp, z, t]*(m.Cb[gas, age, temp, z, t] - m.C[gas, age, temp, z, t]) + rxn_sum
+            return m.ew*(1-eb)*m.dC_dt[idx] == (1-eb)*m.Ga*m.km[idx]*(m.Cb[idx] - m.C[idx]) + rxn_sum
 
     # Adsorption/surface mass balance constraint
     def surf_mb_constraint(self, m, surf, age, temp, z, t):
@@ -1420,11 +1821,17 @@ class Isothermal_Monolith_Simulator(object):
 
 
     # Build Constraints
+    #       NOTE: Must be called after the reaction info is set, since the
+    #           reaction orders of 0 and 1 are built into the rate expressions
     def build_constraints(self):
         for rxn in self.model.all_rxns:
             if self.isRxnBuilt[rxn] == False:
                 raise Exception("Error! Cannot build constraints until reaction info is set. "
                                 +str(rxn)+ " reaction is not yet constructed")
+        self._build_rxn_caches()
+        self.model.rxn_rate = Expression(self.model.all_rxns, self.model.age_set,
+                                self.model.T_set, self.model.z,
+                                self.model.t, rule=self.reaction_rate)
         self.model.bulk_cons = Constraint(self.model.gas_set, self.model.age_set,
                                 self.model.T_set, self.model.z,
                                 self.model.t, rule=self.bulk_mb_constraint)
@@ -1444,7 +1851,17 @@ class Isothermal_Monolith_Simulator(object):
         self.isConBuilt = True
 
     # Apply a discretizer
-    def discretize_model(self, method=DiscretizationMethod.FiniteDifference, elems=20, tstep=100, colpoints=2):
+    #
+    #   NOTE: Even with FiniteDifference, both z and t are discretized, so the
+    #           result is one set of algebraic equations (not an ODE right-hand
+    #           side to step in time). There is no python loop over the mesh
+    #           during a solve for numba (or similar) to compile, since ipopt
+    #           evaluates the equations and their derivatives from the .nl file.
+    #
+    #   NOTE: By default, z is discretized by orthogonal collocation (Radau) with
+    #           a few high order elements. This gives the same accuracy as a
+    #           much finer finite difference grid, with far fewer variables.
+    def discretize_model(self, method=DiscretizationMethod.OrthogonalCollocation, elems=10, tstep=100, colpoints=3):
         if self.isConBuilt == False:
             raise Exception("Error! Must build the constraints before calling a discretizer")
 
@@ -1459,6 +1876,12 @@ class Isothermal_Monolith_Simulator(object):
         oc_discretizer = TransformationFactory('dae.collocation')
 
         # discretization in time
+        #
+        #   NOTE: Time is only discretized once here. Applying the z transform
+        #           first instead gives the same model (same vars/constraints)
+        #           and no measurable change in the cost of discretizing, so
+        #           the original order is kept (it also keeps the variable order
+        #           that the solver sees unchanged)
         fd_discretizer.apply_to(self.model,nfe=tstep,wrt=self.model.t,scheme='BACKWARD')
 
         if method == DiscretizationMethod.FiniteDifference:
@@ -1475,13 +1898,22 @@ class Isothermal_Monolith_Simulator(object):
 
         # Before exiting, we should initialize some additional parameters that
         #   the discretizer doesn't already handle
+        #
+        #   NOTE: The values for each component are collected in a dict over the
+        #           new (z, t) points and set with one set_values/store_values
+        #           call, since iterating a partial slice (e.g., T[age,temp,:,:])
+        #           searches over the full index set each time
+        z_list = list(self.model.z)
+        t_list = list(self.model.t)
 
         # Force temperature to be isothermal
         self.model.T[:,:,:,:].fix()
+        T_vals = {}
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 val = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
-                self.model.T[age,temp,:,:].set_value(val)
+                T_vals.update({(age,temp,loc,time): val for loc in z_list for time in t_list})
+        self.model.T.set_values(T_vals)
 
         #       Initialize space_velocity, linear velocity, and pressure
         self.model.space_velocity[:,:,:].fix()
@@ -1492,27 +1924,38 @@ class Isothermal_Monolith_Simulator(object):
             volume = self.full_length*3.14159*value(self.model.r)**2*(1-self.model.eb.value)
         else:
             volume = self.full_length*3.14159*value(self.model.r)**2
+        P_vals = {}
+        sv_vals = {}
+        v_vals = {}
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 flow_rate_ref = volume*value(self.model.space_velocity[age,temp,self.model.t.first()])
                 press = value(self.model.P[age,temp,self.model.z.last(),self.model.t.first()])
                 temperature = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
-                self.model.P[age,temp,:,:].set_value(press)
+                P_vals.update({(age,temp,loc,time): press for loc in z_list for time in t_list})
                 val = value(self.model.space_velocity[age,temp,self.model.t.first()])
-                self.model.space_velocity[age,temp, :].set_value(val)
+                sv_vals.update({(age,temp,time): val for time in t_list})
                 flow_rate_true = flow_rate_ref*(value(self.model.Pref[age,temp])/press)*(temperature/value(self.model.Tref[age,temp]))
-                self.model.v[age,temp, :, :].set_value(flow_rate_true/volume/value(self.model.eb)*(self.model.z.last()-self.model.z.first()))
+                val = flow_rate_true/volume/value(self.model.eb)*(self.model.z.last()-self.model.z.first())
+                v_vals.update({(age,temp,loc,time): val for loc in z_list for time in t_list})
+        self.model.P.set_values(P_vals)
+        self.model.space_velocity.set_values(sv_vals)
+        self.model.v.set_values(v_vals)
 
         #       Initialize gas density and viscosity
         self.model.rho[:,:,:,:].fix()
         self.model.mu[:,:,:,:].fix()
+        rho_vals = {}
+        mu_vals = {}
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 T = self.model.T[age,temp,self.model.z.first(),self.model.t.first()].value
                 val = self.model.P[age,temp,self.model.z.first(),self.model.t.first()].value*1000/287.058/T*1000
-                self.model.rho[age,temp,:,:].set_value(val/100**3)
+                rho_vals.update({(age,temp,loc,time): val/100**3 for loc in z_list for time in t_list})
                 val = 0.1458*T**1.5/(110.4+T)
-                self.model.mu[age,temp,:,:].set_value(val/10000)
+                mu_vals.update({(age,temp,loc,time): val/10000 for loc in z_list for time in t_list})
+        self.model.rho.set_values(rho_vals)
+        self.model.mu.set_values(mu_vals)
 
         #       Initialize pressure drop across monolith
         self.calculate_pressure_drop()
@@ -1526,12 +1969,15 @@ class Isothermal_Monolith_Simulator(object):
         self.model.Re[:,:,:,:].fix()
         self.model.Sc[:,:,:,:,:].fix()
         self.model.Sh[:,:,:,:,:].fix()
+        Re_vals = {}
+        Sc_vals = {}
+        Sh_vals = {}
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 Re = self.model.rho[age,temp,self.model.z.first(),self.model.t.first()].value* \
                     self.model.v[age,temp, self.model.z.first(), self.model.t.first()].value/60* \
                         self.model.dh.value/self.model.mu[age,temp,self.model.z.first(),self.model.t.first()].value
-                self.model.Re[age,temp,:,:].set_value(Re)
+                Re_vals.update({(age,temp,loc,time): Re for loc in z_list for time in t_list})
                 T = self.model.T[age,temp,self.model.z.first(),self.model.t.first()].value
 
                 for spec in self.model.gas_set:
@@ -1539,43 +1985,56 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.rho[age,temp,self.model.z.first(),self.model.t.first()].value/ \
                     (self.model.Dm[spec].value*exp(-887.5*((1.0/T)-(1.0/473.15))))
 
-                    self.model.Sc[spec,age,temp,:,:].set_value(Sc)
+                    Sc_vals.update({(spec,age,temp,loc,time): Sc for loc in z_list for time in t_list})
 
                     if self.isMonolith == True:
                         Sh = (0.3+(0.62*Re**0.5*Sc**0.33*(1+(0.4/Sc)**0.67)**-0.25)*(1+(Re/282000)**(5/8))**(4/5))
                     else:
                         Sh = (2+(0.4*Re**0.5+0.06*Re**0.67)*Sc**0.4)
-                    self.model.Sh[spec,age,temp,:,:].set_value(Sh)
+                    Sh_vals.update({(spec,age,temp,loc,time): Sh for loc in z_list for time in t_list})
+        self.model.Re.set_values(Re_vals)
+        self.model.Sc.set_values(Sc_vals)
+        self.model.Sh.set_values(Sh_vals)
 
         #       Initialize mass transfer rates
         self.model.km[:,:,:,:,:].fix()
+        km_vals = {}
         for spec in self.model.gas_set:
             for age in self.model.age_set:
                 for temp in self.model.T_set:
                     T = self.model.T[age,temp,self.model.z.first(),self.model.t.first()].value
                     val = self.model.Sh[spec,age,temp,self.model.z.first(),self.model.t.first()].value*self.model.ew.value**self.model.diff_factor.value* \
                             (self.model.Dm[spec].value*exp(-887.5*((1.0/T)-(1.0/473.15))))*60 / self.model.dh.value
-                    self.model.km[spec,age,temp,:,:].set_value(val)
+                    km_vals.update({(spec,age,temp,loc,time): val for loc in z_list for time in t_list})
+        self.model.km.set_values(km_vals)
 
         #       Initialize Smax
         if self.isSitesSet == True:
+            Smax_vals = {}
             for site in self.model.site_set:
                 for age in self.model.age_set:
                     val = value(self.model.Smax[site,age,self.model.z.first(),self.model.t.first()])
-                    self.model.Smax[site,age,:,:].set_value(val)
+                    Smax_vals.update({(site,age,loc,time): val for loc in z_list for time in t_list})
+            self.model.Smax.store_values(Smax_vals)
 
         #        Initialize u_C
+        u_vals = {}
         for spec in self.model.gas_set:
             for rxn in self.model.all_rxns:
-                val = value(self.model.u_C[spec,rxn,self.model.z.first()])
-                self.model.u_C[spec,rxn,:].set_value(val)
+                val = value(self.model.u_C[spec,rxn,z_list[0]])
+                for loc in z_list:
+                    u_vals[spec,rxn,loc] = val
+        self.model.u_C.store_values(u_vals)
 
         #        Initialize u_q
         if self.isSurfSpecSet == True:
+            u_vals = {}
             for spec in self.model.surf_set:
                 for rxn in self.model.all_rxns:
-                    val = value(self.model.u_q[spec,rxn,self.model.z.first()])
-                    self.model.u_q[spec,rxn,:].set_value(val)
+                    val = value(self.model.u_q[spec,rxn,z_list[0]])
+                    for loc in z_list:
+                        u_vals[spec,rxn,loc] = val
+            self.model.u_q.store_values(u_vals)
 
         # For PDE portions, fix the first time derivative at the first node
         for spec in self.model.gas_set:
@@ -1646,21 +2105,48 @@ class Isothermal_Monolith_Simulator(object):
             raise Exception("Error! Concentrations cannot be negative")
         if value < 1e-20:
             value = 1e-20
-        if spec in self.model.gas_set:
-            self.model.Cb[spec,age,temp, :, self.model.t.first()].set_value(value)
-            self.model.Cb[spec,age,temp, :, self.model.t.first()].fix()
-            self.model.C[spec,age,temp, :, self.model.t.first()].set_value(value)
-            self.model.C[spec,age,temp, :, self.model.t.first()].fix()
-            self.isInitialSet[spec][age][temp] = True
-        if self.isSurfSpecSet == True:
-            if spec in self.model.surf_set:
-                self.model.q[spec,age,temp, :, self.model.t.first()].set_value(value)
-                self.model.q[spec,age,temp, :, self.model.t.first()].fix()
+        self.set_const_ICs({(spec,age,temp): value})
+
+    # Set many constant initial conditions at once
+    #       'init_dict' is a dictionary of {(spec, age, temp): value}. This
+    #       is the same as calling 'set_const_IC' for each item, but all the
+    #       values are checked first and then each variable is set in one call.
+    def set_const_ICs(self, init_dict):
+        if self.isDiscrete == False:
+            raise Exception("Error! User should call the discretizer before setting initial conditions")
+        for key in init_dict:
+            if init_dict[key] < 0:
+                raise Exception("Error! Concentrations cannot be negative")
+        t0 = self.model.t.first()
+        z_list = list(self.model.z)
+        Cb_vals = {}
+        C_vals = {}
+        q_vals = {}
+        for (spec,age,temp), value in init_dict.items():
+            if value < 1e-20:
+                value = 1e-20
+            if spec in self.model.gas_set:
+                for loc in z_list:
+                    Cb_vals[spec,age,temp,loc,t0] = value
+                    C_vals[spec,age,temp,loc,t0] = value
                 self.isInitialSet[spec][age][temp] = True
-            if self.isSitesSet == True:
-                if spec in self.model.site_set:
-                    # Do not set this initial value (not a time dependent variable)
+            if self.isSurfSpecSet == True:
+                if spec in self.model.surf_set:
+                    for loc in z_list:
+                        q_vals[spec,age,temp,loc,t0] = value
                     self.isInitialSet[spec][age][temp] = True
+                if self.isSitesSet == True:
+                    if spec in self.model.site_set:
+                        # Do not set this initial value (not a time dependent variable)
+                        self.isInitialSet[spec][age][temp] = True
+        for (var, vals) in [(self.model.Cb, Cb_vals), (self.model.C, C_vals)]:
+            var.set_values(vals)
+            for index in vals:
+                var[index].fix()
+        if self.isSurfSpecSet == True:
+            self.model.q.set_values(q_vals)
+            for index in q_vals:
+                self.model.q[index].fix()
 
     # Set initial condition when given ppm as units
     def set_const_IC_in_ppm(self, spec, age, temp, ppm_val):
@@ -1739,6 +2225,55 @@ class Isothermal_Monolith_Simulator(object):
                     self.model.C[spec,age,temp,:, time].set_value(value)
         self.isBoundarySet[spec][age][temp] = True
 
+    # Helper function to find the BC value at each time in model.t
+    #       The value at a given time is the value of the last pair in
+    #       'time_value_pairs' whose time is <= that time (found with a
+    #       binary search over the pair times). Before the first pair,
+    #       the 'initial_value' is used. If given, 'convert(val, time)'
+    #       is applied once per pair, at the first time that pair is
+    #       active. Values are bounded below by 1e-20.
+    #
+    #       NOTE: The active pair is found by index, not by walking the list and
+    #           catching the IndexError past the last pair, so times after the
+    #           final pair cost the same as any other. As before, the pairs must
+    #           be given in order of increasing time.
+    def _time_dependent_BC_values(self, time_value_pairs, initial_value, convert=None):
+        t_list = list(self.model.t)
+        pair_times = np.array([pair[0] for pair in time_value_pairs])
+        active = np.searchsorted(pair_times, t_list, side='right') - 1
+        bc_values = []
+        current_pair = -1
+        current_bc_value = initial_value
+        for time, i in zip(t_list, active):
+            if i != current_pair:
+                current_pair = i
+                current_bc_value = time_value_pairs[i][1]
+                if convert != None:
+                    current_bc_value = convert(current_bc_value, time)
+                if current_bc_value < 1e-20:
+                    current_bc_value = 1e-20
+            bc_values.append((time, current_bc_value))
+        return bc_values
+
+    # Helper function to fix the inlet Cb to the given (time, value) list
+    #       and (optionally) initialize Cb and C along z with them
+    def _set_time_dependent_BC_values(self, spec, age, temp, bc_values, auto_init):
+        z0 = self.model.z.first()
+        z_list = list(self.model.z)
+        Cb_vals = {}
+        C_vals = {}
+        for time, val in bc_values:
+            Cb_vals[spec,age,temp,z0,time] = val
+            #This should improve convergence
+            if auto_init == True:
+                for loc in z_list:
+                    Cb_vals[spec,age,temp,loc,time] = val
+                    C_vals[spec,age,temp,loc,time] = val
+        self.model.Cb.set_values(Cb_vals)
+        self.model.C.set_values(C_vals)
+        for time, val in bc_values:
+            self.model.Cb[spec,age,temp,z0,time].fix()
+
     # Set time dependent BCs using a 'time_value_pairs' list of tuples
     #       If user does not provide an initial value, it will be assumed 1e-20
     def set_time_dependent_BC(self,spec,age,temp,time_value_pairs,initial_value=1e-20, auto_init=True):
@@ -1761,46 +2296,8 @@ class Isothermal_Monolith_Simulator(object):
         # Set the first value as given initial_value
         if initial_value < 1e-20:
             initial_value = 1e-20
-        i=0
-        current_bc_time = time_value_pairs[i][0]
-        current_bc_value = time_value_pairs[i][1]
-        for time in self.model.t:
-            if time == self.model.t.first():
-                current_bc_value = initial_value
-            if time >= current_bc_time:
-                ###
-                try:
-                    j=i
-                    while time >= time_value_pairs[j][0]:
-                        j+=1
-                    i=j-1
-                except:
-                    pass
-                ###
-                try:
-                    current_bc_value = time_value_pairs[i][1]
-                    if current_bc_value < 1e-20:
-                        current_bc_value = 1e-20
-                except:
-                    pass
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].set_value(current_bc_value)
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].fix()
-                #This should improve convergence
-                if auto_init == True:
-                    self.model.Cb[spec,age,temp,:, time].set_value(current_bc_value)
-                    self.model.C[spec,age,temp,:, time].set_value(current_bc_value)
-                i+=1
-                try:
-                    current_bc_time = time_value_pairs[i][0]
-                except:
-                    pass
-            else:
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].set_value(current_bc_value)
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].fix()
-                #This should improve convergence
-                if auto_init == True:
-                    self.model.Cb[spec,age,temp,:, time].set_value(current_bc_value)
-                    self.model.C[spec,age,temp,:, time].set_value(current_bc_value)
+        bc_values = self._time_dependent_BC_values(time_value_pairs, initial_value)
+        self._set_time_dependent_BC_values(spec, age, temp, bc_values, auto_init)
 
         self.isBoundarySet[spec][age][temp] = True
 
@@ -1828,50 +2325,15 @@ class Isothermal_Monolith_Simulator(object):
 
 
         # Set the first value as given initial_value
-        initial_value = initial_value/10**6*self.model.Pref[age,temp].value/8.3145/self.model.T[age,temp,self.model.z.first(),self.model.t.first()].value
+        Pref = self.model.Pref[age,temp].value
+        T = self.model.T
+        z0 = self.model.z.first()
+        initial_value = initial_value/10**6*Pref/8.3145/T[age,temp,z0,self.model.t.first()].value
         if initial_value < 1e-20:
             initial_value = 1e-20
-        i=0
-        current_bc_time = time_value_pairs[i][0]
-        current_bc_value = time_value_pairs[i][1]
-        for time in self.model.t:
-            if time == self.model.t.first():
-                current_bc_value = initial_value
-            if time >= current_bc_time:
-                ###
-                try:
-                    j=i
-                    while time >= time_value_pairs[j][0]:
-                        j+=1
-                    i=j-1
-                except:
-                    pass
-                ###
-                try:
-                    current_bc_value = time_value_pairs[i][1]
-                    current_bc_value = current_bc_value/10**6*self.model.Pref[age,temp].value/8.3145/self.model.T[age,temp,self.model.z.first(),time].value
-                    if current_bc_value < 1e-20:
-                        current_bc_value = 1e-20
-                except:
-                    pass
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].set_value(current_bc_value)
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].fix()
-                #This should improve convergence
-                if auto_init == True:
-                    self.model.Cb[spec,age,temp,:, time].set_value(current_bc_value)
-                    self.model.C[spec,age,temp,:, time].set_value(current_bc_value)
-                i+=1
-                try:
-                    current_bc_time = time_value_pairs[i][0]
-                except:
-                    pass
-            else:
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].set_value(current_bc_value)
-                self.model.Cb[spec,age,temp,self.model.z.first(), time].fix()
-                #This should improve convergence
-                if auto_init == True:
-                    self.model.Cb[spec,age,temp,:, time].set_value(current_bc_value)
-                    self.model.C[spec,age,temp,:, time].set_value(current_bc_value)
+        convert = lambda val, time: val/10**6*Pref/8.3145/T[age,temp,z0,time].value
+        bc_values = self._time_dependent_BC_values(time_value_pairs, initial_value, convert)
+        self._set_time_dependent_BC_values(spec, age, temp, bc_values, auto_init)
 
         self.isBoundarySet[spec][age][temp] = True
 
@@ -1883,17 +2345,23 @@ class Isothermal_Monolith_Simulator(object):
         if self.isDiscrete == False:
             raise Exception("Error! User should call the discretizer before setting a temperature ramp")
         start_temp = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
-        previous_time = self.model.t.first()
-        for time in self.model.t:
-            if time <= start_time:
-                start_temp = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
-            else:
-                if time >= end_time:
-                    self.model.T[age,temp,:,time].set_value(end_temp)
-                else:
-                    slope = (end_temp-start_temp)/(end_time-start_time)
-                    self.model.T[age,temp,:,time].set_value(start_temp+slope*(time-start_time))
-            previous_time = time
+        z_list = list(self.model.z)
+        t_list = list(self.model.t)
+
+        # Evaluate the ramp at all times at once
+        times = np.array(t_list)
+        ramp = np.full(len(t_list), float(end_temp))
+        ramping = (times > start_time) & (times < end_time)
+        if ramping.any():
+            slope = (end_temp-start_temp)/(end_time-start_time)
+            ramp[ramping] = start_temp+slope*(times[ramping]-start_time)
+
+        T_vals = {}
+        for time, T_val, after_start in zip(t_list, ramp.tolist(), (times > start_time).tolist()):
+            if after_start:
+                for loc in z_list:
+                    T_vals[age,temp,loc,time] = T_val
+        self.model.T.set_values(T_vals)
         self.isVelocityRecalculated = False
         self.isIsothermalTempSet = True
 
@@ -2031,19 +2499,24 @@ class Isothermal_Monolith_Simulator(object):
             end_loc = zone[0]
         else:
             end_loc = zone[1]
-        inside = False
-        for loc in self.model.z:
-            if loc >= start_loc and loc <= end_loc:
-                inside = True
-            else:
-                inside = False
-
-            if inside == isNotActive:
-                for spec in self.model.gas_set:
-                    self.model.u_C[spec,rxn,loc].set_value(0)
-                if self.isSurfSpecSet == True:
-                    for spec in self.model.surf_set:
-                        self.model.u_q[spec,rxn,loc].set_value(0)
+        gas_list = list(self.model.gas_set)
+        surf_list = []
+        if self.isSurfSpecSet == True:
+            surf_list = list(self.model.surf_set)
+        u_C_vals = {}
+        u_q_vals = {}
+        z_list = list(self.model.z)
+        locs = np.array(z_list)
+        inside = (locs >= start_loc) & (locs <= end_loc)
+        for loc, loc_inside in zip(z_list, inside):
+            if loc_inside == isNotActive:
+                for spec in gas_list:
+                    u_C_vals[spec,rxn,loc] = 0
+                for spec in surf_list:
+                    u_q_vals[spec,rxn,loc] = 0
+        self.model.u_C.store_values(u_C_vals)
+        if self.isSurfSpecSet == True:
+            self.model.u_q.store_values(u_q_vals)
 
     # Function to set site density by zone
     #   By default, setting a site density parameter is done across entire
@@ -2075,6 +2548,8 @@ class Isothermal_Monolith_Simulator(object):
         else:
             end_loc = zone[1]
         inside = False
+        t_list = list(self.model.t)
+        Smax_vals = {}
         for loc in self.model.z:
             if loc >= start_loc and loc <= end_loc:
                 inside = True
@@ -2082,7 +2557,9 @@ class Isothermal_Monolith_Simulator(object):
                 inside = False
 
             if inside == True:
-                self.model.Smax[site, age, loc, :].set_value(value)
+                for time in t_list:
+                    Smax_vals[site,age,loc,time] = value
+        self.model.Smax.store_values(Smax_vals)
 
     # Function to setup data for a specific data species, specific data age,
     #   specific data temperature run, at a specific location, based on a
@@ -2154,41 +2631,39 @@ class Isothermal_Monolith_Simulator(object):
         else:
             volume = self.full_length*full_area
         open_area = full_area*value(self.model.eb)
+
+        # All properties are computed in a single pass over each node so that
+        #   the values shared between properties are only looked up once
+        dh = self.model.dh.value
+        ew_factor = self.model.ew.value**self.model.diff_factor.value
+        z_last = self.model.z.last()
+        Dm = {}
+        for spec in self.model.gas_set:
+            Dm[spec] = self.model.Dm[spec].value
         for age in self.model.age_set:
             for temp in self.model.T_set:
+                Pref = value(self.model.Pref[age,temp])
+                Tref = value(self.model.Tref[age,temp])
                 for time in self.model.t:
+                    Q_ref = volume*value(self.model.space_velocity[age,temp,time])
+                    P = value(self.model.P[age,temp,z_last,time])
                     for loc in self.model.z:
-                        Q_ref = volume*value(self.model.space_velocity[age,temp,time])
-                        P = value(self.model.P[age,temp,self.model.z.last(),time])
                         T = value(self.model.T[age,temp,loc,time])
-                        Q_real = Q_ref*(value(self.model.Pref[age,temp])/P)*(T/value(self.model.Tref[age,temp]))
-                        self.model.v[age,temp,loc,time].set_value(Q_real/open_area)
+                        Q_real = Q_ref*(Pref/P)*(T/Tref)
+                        v = Q_real/open_area
+                        self.model.v[age,temp,loc,time].set_value(v)
 
-        for age in self.model.age_set:
-            for temp in self.model.T_set:
-                for time in self.model.t:
-                    for loc in self.model.z:
-                        T = self.model.T[age,temp,loc,time].value
-                        val = self.model.P[age,temp,self.model.z.last(),time].value*1000/287.058/T*1000
-                        self.model.rho[age,temp,loc,time].set_value(val/100**3)
-                        val = 0.1458*T**1.5/(110.4+T)
-                        self.model.mu[age,temp,loc,time].set_value(val/10000)
+                        rho = P*1000/287.058/T*1000/100**3
+                        self.model.rho[age,temp,loc,time].set_value(rho)
+                        mu = 0.1458*T**1.5/(110.4+T)/10000
+                        self.model.mu[age,temp,loc,time].set_value(mu)
 
-        for age in self.model.age_set:
-            for temp in self.model.T_set:
-                for time in self.model.t:
-                    for loc in self.model.z:
-                        Re = self.model.rho[age,temp,loc,time].value* \
-                            self.model.v[age,temp,loc,time].value/60* \
-                                self.model.dh.value/self.model.mu[age,temp,loc,time].value
+                        Re = rho*v/60*dh/mu
                         self.model.Re[age,temp,loc,time].set_value(Re)
-                        T = self.model.T[age,temp,loc,time].value
 
+                        diff_T = exp(-887.5*((1.0/T)-(1.0/473.15)))
                         for spec in self.model.gas_set:
-                            Sc = self.model.mu[age,temp,loc,time].value/ \
-                            self.model.rho[age,temp,loc,time].value/ \
-                            (self.model.Dm[spec].value*exp(-887.5*((1.0/T)-(1.0/473.15))))
-
+                            Sc = mu/rho/(Dm[spec]*diff_T)
                             self.model.Sc[spec,age,temp,loc,time].set_value(Sc)
                             if isMonolith == True:
                                 Sh = (0.3+(0.62*Re**0.5*Sc**0.33*(1+(0.4/Sc)**0.67)**-0.25)*(1+(Re/282000)**(5/8))**(4/5))
@@ -2196,14 +2671,7 @@ class Isothermal_Monolith_Simulator(object):
                                 Sh = (2+(0.4*Re**0.5+0.06*Re**0.67)*Sc**0.4)
                             self.model.Sh[spec,age,temp,loc,time].set_value(Sh)
 
-        for spec in self.model.gas_set:
-            for age in self.model.age_set:
-                for temp in self.model.T_set:
-                    for time in self.model.t:
-                        for loc in self.model.z:
-                            T = self.model.T[age,temp,loc,time].value
-                            val = self.model.Sh[spec,age,temp,loc,time].value*self.model.ew.value**self.model.diff_factor.value* \
-                                (self.model.Dm[spec].value*exp(-887.5*((1.0/T)-(1.0/473.15))))*60 / self.model.dh.value
+                            val = Sh*ew_factor*(Dm[spec]*diff_T)*60 / dh
                             ## TODO: Add unit conversions for time
                             ## TODO: Add unit conversions for space
                             #   val = cm/min
@@ -2234,6 +2702,12 @@ class Isothermal_Monolith_Simulator(object):
 
 
     # Function to fix all kinetic vars
+    #
+    #   NOTE: Fixed vars are written to the .nl file as numeric constants, so
+    #           the rate expressions of all fixed reactions are already
+    #           specialized (constant folded) for ipopt on every solve. There
+    #           is no need to rebuild or recompile the constraints after
+    #           fixing or unfixing reactions.
     def fix_all_reactions(self):
         for r in self.model.arrhenius_rxns:
             self.model.A[r].fix()
@@ -2275,6 +2749,13 @@ class Isothermal_Monolith_Simulator(object):
             self.model.dS[rxn].fix()
             self.rxn_list[rxn]["fixed"]=True
 
+    # Function to fix a list (or other iterable) of reactions
+    def fix_reactions(self, rxns):
+        if isinstance(rxns, str):
+            rxns = [rxns]
+        for rxn in rxns:
+            self.fix_reaction(rxn)
+
     # Function to unfix a specified reaction
     def unfix_reaction(self, rxn):
         if rxn in self.model.arrhenius_rxns:
@@ -2454,8 +2935,68 @@ class Isothermal_Monolith_Simulator(object):
             self.model.scaling_factor.set_value(self.model.dq_dt, scale_to/maxval)
 
 
+    # Helper function to list the constraints used for the scaling
+    def _scaling_cons_list(self):
+        cons_list = ['bulk_cons', 'pore_cons']
+        if self.isSurfSpecSet == True:
+            if self.isSitesSet == True:
+                cons_list.append('site_cons')
+            else:
+                cons_list.append('surf_cons')
+        return cons_list
+
+    # Helper function to find the largest constraint residuals used for scaling
+    #       Returns a dictionary of the maximum absolute residual of each
+    #       set of constraints (before any lower limits are applied)
+    def _constraint_scaling_maxima(self):
+        maxima = {}
+        for name in self._scaling_cons_list():
+            maxval = 0
+            cons = getattr(self.model, name)
+            for key in cons:
+                newval = abs(value(cons[key]))
+                if newval > maxval:
+                    maxval = newval
+            maxima[name] = maxval
+        return maxima
+
+    # Helper function to name the cache file for the constraint scaling
+    #       The name is a hash of every Var and Param of the model (names, sizes,
+    #       and current values) and of the active flags of the constraints used
+    #       for the scaling. Those are all of the inputs to the residuals, so any
+    #       change to the data, BCs, ICs, or state gives a new file.
+    #
+    #       NOTE: The values are read with 'extract_values' per component (in
+    #           model order), rather than by name per item, which keeps this
+    #           well below the cost of evaluating the constraints
+    def _scaling_cache_file(self, folder):
+        h = hashlib.blake2b(digest_size=16)
+        for comp in self.model.component_objects((Var, Param)):
+            vals = comp.extract_values()
+            h.update((comp.name+":"+str(len(vals))+"\n").encode())
+            h.update(np.array(list(vals.values()), dtype=float).tobytes())
+        for name in self._scaling_cons_list():
+            cons = getattr(self.model, name)
+            h.update((name+"\n").encode())
+            h.update(np.array([con.active for con in cons.values()], dtype=bool).tobytes())
+        return os.path.join(folder, "scaling_"+h.hexdigest()+".json")
+
+    # Helper function to keep only the newest cache files in the folder
+    def _prune_scaling_cache(self, folder):
+        files = [os.path.join(folder, f) for f in os.listdir(folder)
+                    if f.startswith("scaling_") and f.endswith(".json")]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for f in files[_SCALING_CACHE_SIZE:]:
+            os.remove(f)
+
     # Function to finialize the scaling of system variables
-    def finalize_auto_scaling(self, scale_to=1, obj_scale_to=1):
+    #       cache_folder = (optional) folder in which the constraint residuals
+    #                   used for scaling are stored (and read from) so that reruns
+    #                   of the same loaded model skip them. Entries are keyed on
+    #                   all model values (see '_scaling_cache_file'), so a changed
+    #                   model never reads another's entry. Only the newest files
+    #                   are kept. Default is None (no caching)
+    def finalize_auto_scaling(self, scale_to=1, obj_scale_to=1, cache_folder=None):
         if self.isInitialized == False:
             raise Exception("Error! Cannot automate final variable scaling if variables not initialized")
 
@@ -2584,22 +3125,28 @@ class Isothermal_Monolith_Simulator(object):
 
         # Only rescale constraints if they were not scaled before
         if self.rescaleConstraint == True:
+            maxima = None
+            if cache_folder != None:
+                cache_file = self._scaling_cache_file(cache_folder)
+                if os.path.exists(cache_file):
+                    with open(cache_file,"r") as file:
+                        maxima = json.load(file)
+            if maxima == None:
+                maxima = self._constraint_scaling_maxima()
+                if cache_folder != None:
+                    os.makedirs(cache_folder, exist_ok=True)
+                    with open(cache_file,"w") as file:
+                        json.dump(maxima, file)
+                    self._prune_scaling_cache(cache_folder)
+
             # set scaling for bulk constraints
-            maxval = 0
-            for key in self.model.bulk_cons:
-                newval = abs(value(self.model.bulk_cons[key]))
-                if newval > maxval:
-                    maxval = newval
+            maxval = maxima['bulk_cons']
             if maxval < 1e-5:
                 maxval = 1e-5
             self.model.scaling_factor.set_value(self.model.bulk_cons, scale_to/maxval)
 
             # set scaling for pore constraints
-            maxval = 0
-            for key in self.model.pore_cons:
-                newval = abs(value(self.model.pore_cons[key]))
-                if newval > maxval:
-                    maxval = newval
+            maxval = maxima['pore_cons']
             if maxval < 1e-5:
                 maxval = 1e-5
             self.model.scaling_factor.set_value(self.model.pore_cons, scale_to/maxval)
@@ -2607,21 +3154,13 @@ class Isothermal_Monolith_Simulator(object):
             # set scaling for surf constraints
             if self.isSurfSpecSet == True:
                 if self.isSitesSet == True:
-                    maxval = 0
-                    for key in self.model.site_cons:
-                        newval = abs(value(self.model.site_cons[key]))
-                        if newval > maxval:
-                            maxval = newval
+                    maxval = maxima['site_cons']
                     if maxval < 1e-2:
                         maxval = 1e-2
                     self.model.scaling_factor.set_value(self.model.site_cons, scale_to/maxval)
                     self.model.scaling_factor.set_value(self.model.surf_cons, scale_to/maxval)
                 else:
-                    maxval = 0
-                    for key in self.model.surf_cons:
-                        newval = abs(value(self.model.surf_cons[key]))
-                        if newval > maxval:
-                            maxval = newval
+                    maxval = maxima['surf_cons']
                     if maxval < 1e-2:
                         maxval = 1e-2
                     self.model.scaling_factor.set_value(self.model.surf_cons, scale_to/maxval)
@@ -2647,19 +3186,96 @@ class Isothermal_Monolith_Simulator(object):
                     for loc in self.model.z:
                         self.model.S[spec, age_solve, temp_solve, loc, time_solve].set_value(self.model.S[spec, age_solve, temp_solve, loc, time_ref].value)
 
-    # Function to initilize the simulator
-    def initialize_simulator(self, console_out=False, options={'print_user_options': 'yes',
-                                                    'linear_solver': LinearSolverMethod.MA27,
-                                                    'tol': 1e-8,
-                                                    'acceptable_tol': 1e-8,
-                                                    'compl_inf_tol': 1e-8,
-                                                    'constr_viol_tol': 1e-8,
-                                                    'max_iter': 3000,
-                                                    'obj_scaling_factor': 1,
-                                                    'diverging_iterates_tol': 1e50},
-                                                    restart_on_warning=False,
-                                                    restart_on_error=False,
-                                                    use_old_times=False):
+    # Helper function to setup the suffixes used to warm start ipopt
+    #       The '_out' suffixes hold the bound multipliers from the last solve
+    #       and the '_in' suffixes pass them back to ipopt on the next solve.
+    #       The 'dual' suffix holds the constraint multipliers and is only
+    #       exported back to ipopt when warm starting.
+    def _setup_warm_start_suffixes(self, warm_start=False):
+        if self.model.find_component('ipopt_zL_out') == None:
+            self.model.ipopt_zL_out = Suffix(direction=Suffix.IMPORT)
+            self.model.ipopt_zU_out = Suffix(direction=Suffix.IMPORT)
+            self.model.ipopt_zL_in = Suffix(direction=Suffix.EXPORT)
+            self.model.ipopt_zU_in = Suffix(direction=Suffix.EXPORT)
+            self.model.dual = Suffix(direction=Suffix.IMPORT)
+        self.model.ipopt_zL_in.clear_all_values()
+        self.model.ipopt_zU_in.clear_all_values()
+        if warm_start == True:
+            self.model.ipopt_zL_in.update(self.model.ipopt_zL_out)
+            self.model.ipopt_zU_in.update(self.model.ipopt_zU_out)
+            self.model.dual.direction = Suffix.IMPORT_EXPORT
+        else:
+            self.model.dual.direction = Suffix.IMPORT
+
+    # Helper function to check the warm start suffixes after a solve
+    #       The multipliers are only kept (for 'save_model_state') if the solve
+    #       was ok/optimal and actually returned some. Otherwise they are
+    #       cleared, so that stale or partial multipliers are never reused.
+    def _check_warm_start_results(self, results):
+        self.isWarmStartValid = False
+        if self.model.find_component('ipopt_zL_out') == None:
+            return
+        n_vals = 0
+        for suffix in ['ipopt_zL_out', 'ipopt_zU_out', 'dual']:
+            n_vals += len(self.model.component(suffix))
+        if results.solver.status == SolverStatus.ok and \
+            results.solver.termination_condition == TerminationCondition.optimal and n_vals > 0:
+            self.isWarmStartValid = True
+        else:
+            for suffix in ['ipopt_zL_out', 'ipopt_zU_out', 'dual']:
+                self.model.component(suffix).clear_all_values()
+
+    # Helper functions to fix/unfix (or activate/deactivate) every item of the
+    #       given components. The data objects are walked directly, which is
+    #       much cheaper than going through a full slice like 'Cb[:,:,:,:,:]'.
+    def _fix_all(self, components, fix=True):
+        for comp in components:
+            for obj in comp.values():
+                if fix == True:
+                    obj.fix()
+                else:
+                    obj.unfix()
+
+    def _activate_all(self, components, active=True):
+        for comp in components:
+            for obj in comp.values():
+                if active == True:
+                    obj.activate()
+                else:
+                    obj.deactivate()
+
+    # Helper function to group the data objects of the given components
+    #       by (age, temp) and then by time, as groups[(age,temp)][time]. Each
+    #       component is walked only once for all sub-problems. 'start' is the
+    #       position of 'age' in the index (with 'temp' right after it) and
+    #       time is always the last index. The items are appended to the given
+    #       'groups' (if any), and only for the given 'conditions' (if any).
+    #
+    #       NOTE: The groups are not kept between calls to the initializer. A
+    #           single pass costs about as much as the pass that fixes all of
+    #           the components before the sub-problems are solved (which must
+    #           be done on every call anyway), and the lists hold the data
+    #           objects themselves, so they would go stale if the model were
+    #           re-discretized or rebuilt.
+    def _group_by_condition(self, components, start=1, groups=None, conditions=None):
+        if groups == None:
+            groups = {}
+            for age in self.model.age_set:
+                for temp in self.model.T_set:
+                    groups[(age,temp)] = {}
+                    for time in self.model.t:
+                        groups[(age,temp)][time] = []
+        for comp in components:
+            for key, obj in comp.items():
+                cond = (key[start], key[start+1])
+                if conditions == None or cond in conditions:
+                    groups[cond][key[-1]].append(obj)
+        return groups
+
+    # Helper function to check that the BCs (and surface ICs) are set for every
+    #       species and condition before the model is initialized or solved.
+    #       Raises on the first one that is missing.
+    def _check_BCs_and_ICs(self):
         for spec in self.model.gas_set:
             for age in self.model.age_set:
                 for temp in self.model.T_set:
@@ -2674,6 +3290,22 @@ class Isothermal_Monolith_Simulator(object):
                             raise Exception("Error! Must specify initial conditions before attempting to solve. "
                                             +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
 
+    # Function to initilize the simulator
+    def initialize_simulator(self, console_out=False, options={'print_user_options': 'yes',
+                                                    'linear_solver': LinearSolverMethod.MA27,
+                                                    'tol': 1e-8,
+                                                    'acceptable_tol': 1e-8,
+                                                    'compl_inf_tol': 1e-8,
+                                                    'constr_viol_tol': 1e-8,
+                                                    'max_iter': 3000,
+                                                    'obj_scaling_factor': 1,
+                                                    'diverging_iterates_tol': 1e50},
+                                                    restart_on_warning=False,
+                                                    restart_on_error=False,
+                                                    use_old_times=False):
+        self._check_BCs_and_ICs()
+        self._check_rxn_orders()
+
         if self.isIsothermalTempSet == False:
             raise Exception("Error! Cannot initialize if temperatures are not set first")
 
@@ -2682,6 +3314,7 @@ class Isothermal_Monolith_Simulator(object):
 
         # Setup a dictionary to determine which reaction to unfix after solve
         self.initialize_time = TIME.time()
+        self._solution = None
         fixed_dict = {}
         for rxn in self.rxn_list:
             fixed_dict[rxn]=self.rxn_list[rxn]["fixed"]
@@ -2692,182 +3325,179 @@ class Isothermal_Monolith_Simulator(object):
             self.model.obj.deactivate()
 
         # Fix all times not associated with current time step
-        self.model.Cb[:, :, :, :, :].fix()
-        self.model.C[:, :, :, :, :].fix()
-        self.model.dCb_dt[:, :, :, :, :].fix()
-        self.model.dC_dt[:, :, :, :, :].fix()
-        self.model.dCb_dz[:, :, :, :, :].fix()
-        self.model.bulk_cons[:, :, :, :, :].deactivate()
-        self.model.pore_cons[:, :, :, :, :].deactivate()
-        self.model.dCb_dz_disc_eq[:, :, :, :, :].deactivate()
-        self.model.dCb_dt_disc_eq[:, :, :, :, :].deactivate()
-        self.model.dC_dt_disc_eq[:, :, :, :, :].deactivate()
+        self._fix_all([self.model.Cb, self.model.C, self.model.dCb_dt,
+                       self.model.dC_dt, self.model.dCb_dz])
+        self._activate_all([self.model.bulk_cons, self.model.pore_cons,
+                            self.model.dCb_dz_disc_eq, self.model.dCb_dt_disc_eq,
+                            self.model.dC_dt_disc_eq], active=False)
         if self.DiscType == "DiscretizationMethod.FiniteDifference":
-            self.model.dCbdz_edge[:, :, :, :].deactivate()
+            self._activate_all([self.model.dCbdz_edge], active=False)
 
         if self.isSurfSpecSet == True:
-            self.model.q[:, :, :, :, :].fix()
-            self.model.dq_dt[:, :, :, :, :].fix()
-            self.model.surf_cons[:, :, :, :, :].deactivate()
-            self.model.dq_dt_disc_eq[:, :, :, :, :].deactivate()
+            self._fix_all([self.model.q, self.model.dq_dt])
+            self._activate_all([self.model.surf_cons, self.model.dq_dt_disc_eq], active=False)
 
             if self.isSitesSet == True:
-                self.model.S[:, :, :, :, :].fix()
-                self.model.site_cons[:, :, :, :, :].deactivate()
-
-        # Loops over specific sub-problems to solve
-        age_solve_old = self.model.age_set.first()
-        temp_solve_old = self.model.T_set.first()
-        time_solve_old = self.model.t.first()
-        for age_solve in self.model.age_set:
-            for temp_solve in self.model.T_set:
-
-                # Inside age_solve && temp_solve
-                print("Initializing for " + str(age_solve) + " -> " + str(temp_solve))
-
-                i=0
-                for time_solve in self.model.t:
-                    # Solve 1 time at a time starting with the i=1 time step (since IC is known)
-                    if i > 0:
-                        start = TIME.time()
-                        print("\t... time_step " + str(time_solve))
-                        self.model.Cb[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.C[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.dCb_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.dC_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.dCb_dz[:, age_solve, temp_solve, :, time_solve].unfix()
-                        self.model.bulk_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.pore_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.dCb_dz_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.dCb_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                        self.model.dC_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                        if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                            self.model.dCbdz_edge[:, age_solve, temp_solve, time_solve].activate()
-
-                        if self.isSurfSpecSet == True:
-                            self.model.q[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.dq_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.surf_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                            self.model.dq_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-
-                            if self.isSitesSet == True:
-                                self.model.S[:, age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.site_cons[:, age_solve, temp_solve, :, time_solve].activate()
+                self._fix_all([self.model.S])
+                self._activate_all([self.model.site_cons], active=False)
 
-                        # Make sure the vars that should be fixed, are fixed
-                        #   Fix ICs, BCs, and dCb_dt @ z=0, t=0
-                        self.model.dCb_dt[:,age_solve, temp_solve,self.model.z.first(),self.model.t.first()].fix()
-                        self.model.Cb[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                        self.model.C[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                        if self.isSurfSpecSet == True:
-                            self.model.q[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                        self.model.Cb[:,age_solve, temp_solve,self.model.z.first(), :].fix()
+        # Setup the solver once for all sub-problems
+        #   (only the scaling method is changed from one time step to the next)
+        solver = SolverFactory('ipopt')
+        #solver = SolverFactory('multistart')
+        #solver = SolverFactory('trustregion')
 
-                        #Inside age_solve, temp_solve, and time_solve
-                        solver = SolverFactory('ipopt')
-                        #solver = SolverFactory('multistart')
-                        #solver = SolverFactory('trustregion')
-
-                        # Check user options
-                        for item in options:
-                            solver.options[item] = options[item]
-                        if 'print_user_options' in options:
-                            if options['print_user_options'] == "yes":
-                                solver.options['print_user_options'] = options['print_user_options']
-                        else:
-                            solver.options['print_user_options'] = 'yes'
-                        #   linear_solver -> valid options:
-                        #   -------------------------------
-                        #       Depends on installed libraries
-                        #           'mumps'  --> available on Windows AND 'idaes'
-                        #                       (Only option if NOT using 'idaes')
-                        #           'ma27' --> NOT available on Windows
-                        #                       BUT is available with 'idaes'
-                        #                       (Best for Small problems, Not parallel)
-                        #           'ma57' --> NOT available on Windows
-                        #                       BUT is available with 'idaes'
-                        #                       (Best for Medium problems, threaded blas)
-                        #           'ma77' --> NOT functional with Windows OR 'idaes'
-                        #           'ma86' --> NOT functional with Windows OR 'idaes'
-                        #           'ma97' --> NOT available on Windows
-                        #                       BUT is available with 'idaes'
-                        #                       (Best for Large problems, parallel)
-                        #           'pardiso' --> NOT functional with Windows OR 'idaes'
-                        #           'wsmp' --> NOT functional with Windows OR 'idaes'
-                        #
-                        #   NOTE: The solver libraries bundled with 'idaes' are MUCH more
-                        #           computationally efficient than the standard Windows
-                        #           solver libraries
-                        if 'linear_solver' in options:
-                            # Force the use of MUMPS if conda environment is not setup for 'idaes'
-                            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
-                                options['linear_solver'] = LinearSolverMethod.MUMPS
-                            if options['linear_solver'] == LinearSolverMethod.MUMPS:
-                                # Only available option without 'idaes' enviroment or
-                                #   another precompiled HSL library: https://www.hsl.rl.ac.uk/ipopt/
-                                solver.options['linear_solver'] = 'mumps'
-                            elif options['linear_solver'] == LinearSolverMethod.MA27:
-                                # Best for small problems (no parallelization)
-                                solver.options['linear_solver'] = 'ma27'
-                            elif options['linear_solver'] == LinearSolverMethod.MA57:
-                                # Best for medium problems (threaded BLAS)
-                                solver.options['linear_solver'] = 'ma57'
-                            elif options['linear_solver'] == LinearSolverMethod.MA97:
-                                # Best for large problems (maximizes parallelization)
-                                solver.options['linear_solver'] = 'ma97'
-                            else:
-                                print("Error! Invalid solver option")
-                                print("\tValid Options: 'LinearSolverMethod.MUMPS'")
-                                print("\t               'LinearSolverMethod.MA27'")
-                                print("\t               'LinearSolverMethod.MA57'")
-                                print("\t               'LinearSolverMethod.MA97'")
-                                raise Exception("\nNOTE: 'MA' solvers only available if 'idaes' environment is used...")
-                        else:
-                            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
-                                solver.options['linear_solver'] = 'mumps'
-                            else:
-                                solver.options['linear_solver'] = 'ma97'
-                        if 'tol' in options:
-                            solver.options['tol'] = options['tol']
-                        else:
-                            solver.options['tol'] = 1e-8
-                        if 'acceptable_tol' in options:
-                            solver.options['acceptable_tol'] = options['acceptable_tol']
-                        else:
-                            solver.options['acceptable_tol'] = 1e-8
-                        if 'compl_inf_tol' in options:
-                            solver.options['compl_inf_tol'] = options['compl_inf_tol']
-                        else:
-                            solver.options['compl_inf_tol'] = 1e-8
-                        if 'constr_viol_tol' in options:
-                            solver.options['constr_viol_tol'] = options['constr_viol_tol']
-                        else:
-                            solver.options['constr_viol_tol'] = 1e-8
-                        if 'max_iter' in options:
-                            solver.options['max_iter'] = options['max_iter']
-                        else:
-                            solver.options['max_iter'] = 3000
-                        if 'obj_scaling_factor' in options:
-                            solver.options['obj_scaling_factor'] = options['obj_scaling_factor']
-                        else:
-                            solver.options['obj_scaling_factor'] = 1
-                        if 'diverging_iterates_tol' in options:
-                            solver.options['diverging_iterates_tol'] = options['diverging_iterates_tol']
-                        else:
-                            solver.options['diverging_iterates_tol'] = 1e50
-                        if 'warm_start_init_point' in options:
-                            solver.options['warm_start_init_point'] = options['warm_start_init_point']
-                        else:
-                            solver.options['warm_start_init_point'] = 'yes'
+        # Check user options
+        for item in options:
+            solver.options[item] = options[item]
+        if 'print_user_options' in options:
+            if options['print_user_options'] == "yes":
+                solver.options['print_user_options'] = options['print_user_options']
+        else:
+            solver.options['print_user_options'] = 'yes'
+        #   linear_solver -> valid options:
+        #   -------------------------------
+        #       Depends on installed libraries
+        #           'mumps'  --> available on Windows AND 'idaes'
+        #                       (Only option if NOT using 'idaes')
+        #           'ma27' --> NOT available on Windows
+        #                       BUT is available with 'idaes'
+        #                       (Best for Small problems, Not parallel)
+        #           'ma57' --> NOT available on Windows
+        #                       BUT is available with 'idaes'
+        #                       (Best for Medium problems, threaded blas)
+        #           'ma77' --> NOT functional with Windows OR 'idaes'
+        #           'ma86' --> NOT functional with Windows OR 'idaes'
+        #           'ma97' --> NOT available on Windows
+        #                       BUT is available with 'idaes'
+        #                       (Best for Large problems, parallel)
+        #           'pardiso' --> NOT functional with Windows OR 'idaes'
+        #           'wsmp' --> NOT functional with Windows OR 'idaes'
+        #
+        #   NOTE: The solver libraries bundled with 'idaes' are MUCH more
+        #           computationally efficient than the standard Windows
+        #           solver libraries
+        if 'linear_solver' in options:
+            # Force the use of MUMPS if conda environment is not setup for 'idaes'
+            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
+                options['linear_solver'] = LinearSolverMethod.MUMPS
+            if options['linear_solver'] == LinearSolverMethod.MUMPS:
+                # Only available option without 'idaes' enviroment or
+                #   another precompiled HSL library: https://www.hsl.rl.ac.uk/ipopt/
+                solver.options['linear_solver'] = 'mumps'
+            elif options['linear_solver'] == LinearSolverMethod.MA27:
+                # Best for small problems (no parallelization)
+                solver.options['linear_solver'] = 'ma27'
+            elif options['linear_solver'] == LinearSolverMethod.MA57:
+                # Best for medium problems (threaded BLAS)
+                solver.options['linear_solver'] = 'ma57'
+            elif options['linear_solver'] == LinearSolverMethod.MA97:
+                # Best for large problems (maximizes parallelization)
+                solver.options['linear_solver'] = 'ma97'
+            else:
+                print("Error! Invalid solver option")
+                print("\tValid Options: 'LinearSolverMethod.MUMPS'")
+                print("\t               'LinearSolverMethod.MA27'")
+                print("\t               'LinearSolverMethod.MA57'")
+                print("\t               'LinearSolverMethod.MA97'")
+                raise Exception("\nNOTE: 'MA' solvers only available if 'idaes' environment is used...")
+        else:
+            if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
+                solver.options['linear_solver'] = 'mumps'
+            else:
+                solver.options['linear_solver'] = 'ma97'
+        if 'tol' in options:
+            solver.options['tol'] = options['tol']
+        else:
+            solver.options['tol'] = 1e-8
+        if 'acceptable_tol' in options:
+            solver.options['acceptable_tol'] = options['acceptable_tol']
+        else:
+            solver.options['acceptable_tol'] = 1e-8
+        if 'compl_inf_tol' in options:
+            solver.options['compl_inf_tol'] = options['compl_inf_tol']
+        else:
+            solver.options['compl_inf_tol'] = 1e-8
+        if 'constr_viol_tol' in options:
+            solver.options['constr_viol_tol'] = options['constr_viol_tol']
+        else:
+            solver.options['constr_viol_tol'] = 1e-8
+        if 'max_iter' in options:
+            solver.options['max_iter'] = options['max_iter']
+        else:
+            solver.options['max_iter'] = 3000
+        if 'obj_scaling_factor' in options:
+            solver.options['obj_scaling_factor'] = options['obj_scaling_factor']
+        else:
+            solver.options['obj_scaling_factor'] = 1
+        if 'diverging_iterates_tol' in options:
+            solver.options['diverging_iterates_tol'] = options['diverging_iterates_tol']
+        else:
+            solver.options['diverging_iterates_tol'] = 1e50
+        if 'warm_start_init_point' in options:
+            solver.options['warm_start_init_point'] = options['warm_start_init_point']
+        else:
+            solver.options['warm_start_init_point'] = 'yes'
+
+        # Run solver (tighten the bounds to force good solutions) (1e-4 was old)
+        solver.options['bound_push'] = 1e-6
+        solver.options['bound_frac'] = 1e-6
+        solver.options['mu_init'] = 1e-2
+        solver.options['slack_bound_push'] = 1e-6
+        solver.options['slack_bound_frac'] = 1e-6
+        solver.options['warm_start_init_point'] = 'yes'
+
+        # Gather the vars and constraints of every sub-problem by time step
+        #   once (in a single pass over each component), so each time step
+        #   below only touches its own items instead of re-scanning the full
+        #   components through slices
+        step_vars = [self.model.Cb, self.model.C, self.model.dCb_dt,
+                        self.model.dC_dt, self.model.dCb_dz]
+        step_cons = [self.model.bulk_cons, self.model.pore_cons,
+                        self.model.dCb_dz_disc_eq, self.model.dCb_dt_disc_eq,
+                        self.model.dC_dt_disc_eq]
+        if self.DiscType == "DiscretizationMethod.FiniteDifference":
+            step_cons.append(self.model.dCbdz_edge)
+        if self.isSurfSpecSet == True:
+            step_vars += [self.model.q, self.model.dq_dt]
+            step_cons += [self.model.surf_cons, self.model.dq_dt_disc_eq]
+            if self.isSitesSet == True:
+                step_vars.append(self.model.S)
+                step_cons.append(self.model.site_cons)
+        vars_by_condition = self._group_by_condition(step_vars)
+        cons_by_condition = self._group_by_condition(step_cons)
+
+        # Loops over specific sub-problems to solve
+        z0 = self.model.z.first()
+        gas_list = list(self.model.gas_set)
+        age_solve_old = self.model.age_set.first()
+        temp_solve_old = self.model.T_set.first()
+        time_solve_old = self.model.t.first()
+        for age_solve in self.model.age_set:
+            for temp_solve in self.model.T_set:
+
+                # Inside age_solve && temp_solve
+                print("Initializing for " + str(age_solve) + " -> " + str(temp_solve))
+                vars_at_time = vars_by_condition[(age_solve,temp_solve)]
+                cons_at_time = cons_by_condition[(age_solve,temp_solve)]
 
-                        # Run solver (tighten the bounds to force good solutions) (1e-4 was old)
-                        solver.options['bound_push'] = 1e-6
-                        solver.options['bound_frac'] = 1e-6
-                        solver.options['mu_init'] = 1e-2
-                        solver.options['slack_bound_push'] = 1e-6
-                        solver.options['slack_bound_frac'] = 1e-6
-                        solver.options['warm_start_init_point'] = 'yes'
+                i=0
+                for time_solve in self.model.t:
+                    # Solve 1 time at a time starting with the i=1 time step (since IC is known)
+                    if i > 0:
+                        start = TIME.time()
+                        print("\t... time_step " + str(time_solve))
+                        for var in vars_at_time[time_solve]:
+                            var.unfix()
+                        for con in cons_at_time[time_solve]:
+                            con.activate()
 
+                        # Make sure the vars that should be fixed, are fixed
+                        #   (ICs @ t=0 are never unfixed, so only the BCs @ z=0 need it)
+                        for spec in gas_list:
+                            self.model.Cb[spec, age_solve, temp_solve, z0, time_solve].fix()
+
+                        #Inside age_solve, temp_solve, and time_solve
                         if self.model.find_component('scaling_factor'):
                             solver.options['nlp_scaling_method'] = 'user-scaling'
                         else:
@@ -2950,28 +3580,12 @@ class Isothermal_Monolith_Simulator(object):
                                     return (results.solver.status, results.solver.termination_condition)
 
                         # Fix the steps that were just solved
-                        self.model.Cb[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.C[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.dCb_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.dC_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.dCb_dz[:, age_solve, temp_solve, :, time_solve].fix()
-                        self.model.bulk_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.pore_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.dCb_dz_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.dCb_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        self.model.dC_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                        if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                            self.model.dCbdz_edge[:, age_solve, temp_solve, time_solve].deactivate()
-
-                        if self.isSurfSpecSet == True:
-                            self.model.q[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.dq_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.surf_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            self.model.dq_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-
-                            if self.isSitesSet == True:
-                                self.model.S[:, age_solve, temp_solve, :, time_solve].fix()
-                                self.model.site_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
+                        #   (all other time steps were never unfixed, so there is nothing
+                        #   to re-apply at any other time)
+                        for var in vars_at_time[time_solve]:
+                            var.fix()
+                        for con in cons_at_time[time_solve]:
+                            con.deactivate()
 
                     else:
                         # i = 0, don't do anything
@@ -2985,28 +3599,21 @@ class Isothermal_Monolith_Simulator(object):
         # End age_solve loop
 
         # Unfix all variables
-        self.model.Cb[:, :, :, :, :].unfix()
-        self.model.C[:, :, :, :, :].unfix()
-        self.model.dCb_dt[:, :, :, :, :].unfix()
-        self.model.dC_dt[:, :, :, :, :].unfix()
-        self.model.dCb_dz[:, :, :, :, :].unfix()
-        self.model.bulk_cons[:, :, :, :, :].activate()
-        self.model.pore_cons[:, :, :, :, :].activate()
-        self.model.dCb_dz_disc_eq[:, :, :, :, :].activate()
-        self.model.dCb_dt_disc_eq[:, :, :, :, :].activate()
-        self.model.dC_dt_disc_eq[:, :, :, :, :].activate()
+        self._fix_all([self.model.Cb, self.model.C, self.model.dCb_dt,
+                       self.model.dC_dt, self.model.dCb_dz], fix=False)
+        self._activate_all([self.model.bulk_cons, self.model.pore_cons,
+                            self.model.dCb_dz_disc_eq, self.model.dCb_dt_disc_eq,
+                            self.model.dC_dt_disc_eq])
         if self.DiscType == "DiscretizationMethod.FiniteDifference":
-            self.model.dCbdz_edge[:, :, :, :].activate()
+            self._activate_all([self.model.dCbdz_edge])
 
         if self.isSurfSpecSet == True:
-            self.model.q[:, :, :, :, :].unfix()
-            self.model.dq_dt[:, :, :, :, :].unfix()
-            self.model.surf_cons[:, :, :, :, :].activate()
-            self.model.dq_dt_disc_eq[:, :, :, :, :].activate()
+            self._fix_all([self.model.q, self.model.dq_dt], fix=False)
+            self._activate_all([self.model.surf_cons, self.model.dq_dt_disc_eq])
 
             if self.isSitesSet == True:
-                self.model.S[:, :, :, :, :].unfix()
-                self.model.site_cons[:, :, :, :, :].activate()
+                self._fix_all([self.model.S], fix=False)
+                self._activate_all([self.model.site_cons])
 
         # Make sure boundaries and ICs are re-fixed
         self.model.dCb_dt[:,:,:,self.model.z.first(),self.model.t.first()].fix()
@@ -3039,20 +3646,11 @@ class Isothermal_Monolith_Simulator(object):
                                                     'constr_viol_tol': 1e-6,
                                                     'max_iter': 3000,
                                                     'obj_scaling_factor': 1,
-                                                    'diverging_iterates_tol': 1e50}):
-        for spec in self.model.gas_set:
-            for age in self.model.age_set:
-                for temp in self.model.T_set:
-                    if self.isBoundarySet[spec][age][temp] == False:
-                        raise Exception("Error! Must specify boundaries before attempting to solve. "
-                                        +str(spec)+","+str(age)+","+str(temp)+" given does not have BCs set")
-        if self.isSurfSpecSet == True:
-            for spec in self.model.surf_set:
-                for age in self.model.age_set:
-                    for temp in self.model.T_set:
-                        if self.isInitialSet[spec][age][temp] == False:
-                            raise Exception("Error! Must specify initial conditions before attempting to solve. "
-                                            +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
+                                                    'diverging_iterates_tol': 1e50},
+                                                    use_analytic_jacobian=True,
+                                                    warm_start=None):
+        self._check_BCs_and_ICs()
+        self._check_rxn_orders()
 
         if self.isIsothermalTempSet == False:
             raise Exception("Error! Cannot solve if temperatures are not set first")
@@ -3064,6 +3662,11 @@ class Isothermal_Monolith_Simulator(object):
             self.recalculate_linear_velocities(interally_called=True,isMonolith=self.isMonolith)
         self.solve_time = TIME.time()
 
+        # NOTE: ipopt runs as a separate executable, so the model is always
+        #           handed over as a new .nl file. The persistent interfaces
+        #           (e.g., appsi's Ipopt) only cache the writing of that file,
+        #           and do not export the 'scaling_factor' or the warm start
+        #           (ipopt_zL_in/ipopt_zU_in) suffixes this model relies on.
         solver = SolverFactory('ipopt')
 
         # Check user options
@@ -3158,6 +3761,29 @@ class Isothermal_Monolith_Simulator(object):
         else:
             solver.options['warm_start_init_point'] = 'yes'
 
+        #   Derivative information for ipopt:
+        #   ---------------------------------
+        #       Pyomo writes the full symbolic expression graph of every
+        #       constraint (including all Arrhenius rate terms) to the .nl
+        #       file, so ipopt evaluates exact first and second derivatives
+        #       through automatic differentiation in the ASL. This is MUCH
+        #       faster and more robust for these stiff kinetic systems than
+        #       finite differences.
+        #
+        #       use_analytic_jacobian = False will force finite-difference
+        #       Jacobians and a quasi-Newton (limited-memory) Hessian, which
+        #       is only useful for debugging derivative issues.
+        if 'jacobian_approximation' not in options:
+            if use_analytic_jacobian == True:
+                solver.options['jacobian_approximation'] = 'exact'
+            else:
+                solver.options['jacobian_approximation'] = 'finite-difference-values'
+        if 'hessian_approximation' not in options:
+            if use_analytic_jacobian == True:
+                solver.options['hessian_approximation'] = 'exact'
+            else:
+                solver.options['hessian_approximation'] = 'limited-memory'
+
         # Call the solver
         if self.isInitialized == True:
             # MORE INFO: https://coin-or.github.io/Ipopt/OPTIONS.html
@@ -3196,6 +3822,21 @@ class Isothermal_Monolith_Simulator(object):
         else:
             solver.options['nlp_scaling_method'] = 'gradient-based'
 
+        # Check if we should warm start from the multipliers of a prior solve
+        #       (by default, only if multipliers were loaded with the model)
+        self._solution = None
+        if warm_start == None:
+            warm_start = self.isWarmStartSet
+        self._setup_warm_start_suffixes(warm_start)
+        if warm_start == True:
+            solver.options['warm_start_init_point'] = 'yes'
+            if 'warm_start_bound_push' not in options:
+                solver.options['warm_start_bound_push'] = 1e-9
+            if 'warm_start_mult_bound_push' not in options:
+                solver.options['warm_start_mult_bound_push'] = 1e-9
+            if 'mu_init' not in options:
+                solver.options['mu_init'] = 1e-6
+
         results = solver.solve(self.model, tee=console_out, load_solutions=False)
         if results.solver.status == SolverStatus.ok:
             self.model.solutions.load_from(results)
@@ -3211,6 +3852,7 @@ class Isothermal_Monolith_Simulator(object):
             print("An Error has occurred!")
             print("\tStatus: " + str(results.solver.status))
             print("\tTermination Condition: " + str(results.solver.termination_condition))
+        self._check_warm_start_results(results)
 
         self.solve_time = (TIME.time() - self.solve_time)
 
@@ -3222,230 +3864,404 @@ class Isothermal_Monolith_Simulator(object):
         print()
         return (results.solver.status, results.solver.termination_condition)
 
+    # Function to run the solver with a dynamically adjusted tolerance
+    #       Solver starts from a loose tolerance and tightens the tolerance
+    #       (by 'tighten_factor') after every successful solve until the
+    #       'final_tol' is reached. If the solver stalls (max_iter), then the
+    #       tolerance is loosened (by 'loosen_factor', up to 'max_tol') and
+    #       the solve is repeated from the current iterate.
+    #
+    #       User may provide...
+    #           initial_tol = (optional) starting tolerance (default = 1e-3)
+    #           final_tol = (optional) desired final tolerance (default = 1e-6)
+    #           max_tol = (optional) loosest allowable tolerance (default = 1e-2)
+    #           max_attempts = (optional) maximum number of solver calls (default = 6)
+    #
+    #       All other args are passed to 'run_solver'
+    def run_solver_with_dynamic_tolerance(self, console_out=True, options={'print_user_options': 'yes',
+                                                    'linear_solver': LinearSolverMethod.MA97,
+                                                    'compl_inf_tol': 1e-6,
+                                                    'constr_viol_tol': 1e-6,
+                                                    'max_iter': 3000,
+                                                    'obj_scaling_factor': 1,
+                                                    'diverging_iterates_tol': 1e50},
+                                                    initial_tol=1e-3, final_tol=1e-6, max_tol=1e-2,
+                                                    max_attempts=6, tighten_factor=0.1, loosen_factor=1.1,
+                                                    use_analytic_jacobian=True, warm_start=None):
+        if initial_tol < final_tol:
+            initial_tol = final_tol
+        if max_tol < initial_tol:
+            max_tol = initial_tol
+
+        tol = initial_tol
+        attempt = 0
+        result = None
+        while attempt < max_attempts:
+            opts = dict(options)
+            opts['tol'] = tol
+            opts['acceptable_tol'] = tol
+            # After the first attempt, always restart from the prior solve
+            if attempt > 0:
+                opts['warm_start_init_point'] = 'yes'
+                warm_start = True
+            print("Attempt "+str(attempt+1)+" of "+str(max_attempts)+": tol = "+str(tol))
+            result = self.run_solver(console_out=console_out, options=opts,
+                                    use_analytic_jacobian=use_analytic_jacobian, warm_start=warm_start)
+            attempt += 1
+
+            if result[1] == TerminationCondition.optimal or result[1] == TerminationCondition.locallyOptimal:
+                if tol <= final_tol:
+                    break
+                # Snap to final_tol, so that round off does not add another solve
+                if tol*tighten_factor <= final_tol*(1+1e-6):
+                    tol = final_tol
+                else:
+                    tol = tol*tighten_factor
+            elif result[1] == TerminationCondition.maxIterations:
+                tol = min(tol*loosen_factor, max_tol)
+            else:
+                print("Warning! Unable to continue adjusting tolerance...")
+                break
+        return result
 
-    # Function to print out results of variables at all locations and times
-    def print_results_all_locations(self, spec_list, age, temp, file_name="", include_temp=False):
+
+    # Function to extract the current solution into numpy arrays
+    #   Arrays are shaped [z, t] and keyed by (var, spec, age, temp), where var
+    #   is one of 'Cb', 'C', 'q', 'S', or 'T' (with spec = None for 'T'). The
+    #   result is kept so the print_results_* functions can read from it
+    #   instead of the model. It is cleared on the next solve or load.
+    def extract_solution(self):
+        z_index = {}
+        for loc in self.model.z:
+            z_index[loc] = len(z_index)
+        t_index = {}
+        for time in self.model.t:
+            t_index[time] = len(t_index)
+        shape = (len(z_index), len(t_index))
+
+        solution = {}
+        for name in ['Cb', 'C', 'q', 'S', 'T']:
+            if not hasattr(self.model, name):
+                continue
+            for index, var in getattr(self.model, name).items():
+                if name == 'T':
+                    key = (name, None) + index[:-2]
+                else:
+                    key = (name,) + index[:-2]
+                arr = solution.get(key)
+                if arr is None:
+                    arr = np.full(shape, np.nan)
+                    solution[key] = arr
+                if var.value != None:
+                    arr[z_index[index[-2]], t_index[index[-1]]] = var.value
+        self._solution = solution
+        return solution
+
+    # Function to translate the discretized model into a casadi nlp
+    #       Each unfixed variable becomes a casadi symbol and each active
+    #       constraint (and objective) is rebuilt as a casadi expression graph.
+    #       Fixed variables and parameters are taken at their current values,
+    #       so this must be called again after changing any of them. Setting
+    #       jit=True compiles the nlp functions (and derivatives) to C, instead
+    #       of evaluating the expression trees each iteration. The 'flags'
+    #       given to the compiler default to ['-O3'] and the 'options' passed
+    #       on to casadi.nlpsol default to none.
+    #
+    #       Returns (solver, args, var_list), which can be used as...
+    #
+    #           sol = solver(**args)
+    #           for var, val in zip(var_list, sol['x'].full().flatten()):
+    #               var.set_value(val)
+    def to_casadi(self, jit=False, compiler='shell', flags=None, options=None):
+        if flags == None:
+            flags = ['-O3']
+        if options == None:
+            options = {}
+        if casadi == None:
+            raise Exception("Error! 'casadi' must be installed to use to_casadi()")
+        if self.isDiscrete == False:
+            raise Exception("Error! Model must be discretized before calling to_casadi()")
+
+        var_list = []
+        var_map = {}
+        x = []
+        x0 = []
+        lbx = []
+        ubx = []
+        for var in self.model.component_data_objects(Var):
+            if var.fixed == True:
+                continue
+            sym = casadi.SX.sym(var.name)
+            var_list.append(var)
+            var_map[id(var)] = sym
+            x.append(sym)
+            x0.append(0 if var.value == None else var.value)
+            lbx.append(-casadi.inf if var.lb == None else var.lb)
+            ubx.append(casadi.inf if var.ub == None else var.ub)
+
+        g = []
+        lbg = []
+        ubg = []
+        for con in self.model.component_data_objects(Constraint, active=True):
+            g.append(_casadi_expr(con.body, var_map))
+            lbg.append(-casadi.inf if con.lower is None else value(con.lower))
+            ubg.append(casadi.inf if con.upper is None else value(con.upper))
+
+        f = 0
+        for obj in self.model.component_data_objects(Objective, active=True):
+            if obj.sense == maximize:
+                f = f - _casadi_expr(obj.expr, var_map)
+            else:
+                f = f + _casadi_expr(obj.expr, var_map)
+
+        opts = dict(options)
+        if jit == True:
+            opts['jit'] = True
+            opts['compiler'] = compiler
+            opts['jit_options'] = {'flags': flags}
+        nlp = {'x': casadi.vertcat(*x), 'f': f, 'g': casadi.vertcat(*g)}
+        solver = casadi.nlpsol('solver', 'ipopt', nlp, opts)
+        args = {'x0': x0, 'lbx': lbx, 'ubx': ubx, 'lbg': lbg, 'ubg': ubg}
+        return solver, args, var_list
+
+    # Function to simulate each (age, temp) condition as its own model in parallel
+    #       build_func(age, temp) must be a module-level function that returns a
+    #       simulator set up like this one, but for only that condition. Since
+    #       the conditions only share parameters, each one is initialized and
+    #       solved in a separate process. The solutions are then written back
+    #       into the variables of this model and kept as its extracted solution
+    #       (see extract_solution), so the plot_*, print_* and save_* functions
+    #       all see the same results.
+    #
+    #       NOTE: Pyomo models do not pickle cleanly, so the smaller models are
+    #           built inside the workers. Processes (not threads) are used since
+    #           pyomo and ipopt are not thread-safe. If 'fork' is not available
+    #           (e.g., on Windows), then the conditions are run in serial.
+    def simulate_all_conditions(self, build_func, n_workers=None):
+        if self.isDiscrete == False:
+            raise Exception("Error! Model must be discretized before simulating all conditions")
+        conditions = []
+        for age in self.model.age_set:
+            for temp in self.model.T_set:
+                conditions.append((age, temp))
+        if n_workers == None:
+            n_workers = os.cpu_count()
+        n_workers = max(1, min(n_workers, len(conditions)))
+
+        solution = {}
+        if n_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(max_workers=n_workers,
+                                    mp_context=multiprocessing.get_context("fork")) as pool:
+                futures = [pool.submit(_simulate_condition, build_func, age, temp) for (age, temp) in conditions]
+                for future in futures:
+                    solution.update(future.result())
+        else:
+            for (age, temp) in conditions:
+                solution.update(_simulate_condition(build_func, age, temp))
+
+        shape = (len(self.model.z), len(self.model.t))
+        for key in solution:
+            if solution[key].shape != shape:
+                raise Exception("Error! Discretization of "+str(key)+" does not match this model")
+        self._store_solution(solution)
+        self._solution = solution
+        return solution
+
+    # Helper function to write an extracted solution back into the model variables
+    #   This is the reverse of extract_solution (values that are NaN, i.e., unset,
+    #   are left alone)
+    def _store_solution(self, solution):
+        z_list = list(self.model.z)
+        t_list = list(self.model.t)
+        for key, arr in solution.items():
+            var = getattr(self.model, key[0])
+            if key[1] == None:
+                index = key[2:]
+            else:
+                index = key[1:]
+            vals = {}
+            for i, loc in enumerate(z_list):
+                for j, time in enumerate(t_list):
+                    if not np.isnan(arr[i,j]):
+                        vals[index+(loc,time)] = float(arr[i,j])
+            var.set_values(vals)
+
+    # Helper function to grab the results of a variable as a numpy array
+    #   Returns an array shaped [z, t] (see extract_solution)
+    def _solution_array(self, name, spec, age, temp):
+        if self._solution != None:
+            return self._solution[(name, spec, age, temp)]
+        return np.array(self._solution_values(name, spec, age, temp), dtype=float)
+
+    # Helper function to grab the results of a variable for the printers
+    #   Returns a list of [z][t] values, or [t] values if loc is given
+    def _solution_values(self, name, spec, age, temp, loc=None):
+        if self._solution != None:
+            arr = self._solution[(name, spec, age, temp)]
+            if loc != None:
+                arr = arr[self.model.z.ord(loc)-1]
+            return arr.tolist()
+        var = getattr(self.model, name)
+        if spec == None:
+            index = (age, temp)
+        else:
+            index = (spec, age, temp)
+        # The data objects are Vars, so their values are read directly
+        #   (unset values are left as None, instead of raising in value())
+        t_list = list(self.model.t)
+        if loc != None:
+            return [var[index+(loc,time)].value for time in t_list]
+        return [[var[index+(z,time)].value for time in t_list] for z in self.model.z]
+
+    # Helper function to check the list of species given to the printers
+    #   Returns the species as a list (a tuple is also accepted). The model set
+    #   is copied into a frozenset once, so each check is a plain hash lookup.
+    def _check_spec_list(self, spec_list):
+        if type(spec_list) is tuple:
+            spec_list = list(spec_list)
         if type(spec_list) is not list:
-            raise Exception("Error! Need to provide species as a list (even if it is just one species)")
+            raise ValueError("Error! Need to provide species as a list (even if it is just one species)")
+        valid = frozenset(self.model.all_species_set)
         for spec in spec_list:
-            if spec not in self.model.all_species_set:
-                print("Error! Invalid species given!")
-                raise Exception("\t"+str(spec)+ " is not a species in the model")
+            if spec not in valid:
+                raise ValueError("Error! Invalid species given! "+str(spec)+ " is not a species in the model")
+        return spec_list
+
+    # Helper function to open the output file of the printers (in 'output/')
+    #   If no file_name is given, then it is built from the species, age, temp,
+    #   and the given suffix (e.g., NH3_NO_Unaged_250C_all_loc.txt)
+    def _open_results_file(self, file_name, spec_list, age, temp, suffix):
         if file_name == "":
-            for spec in spec_list:
-                file_name+=spec+"_"
-            file_name+=str(age)+"_"+str(temp)+"_"
-            file_name+="all_loc"
-            file_name+=".txt"
-
-        folder="output/"
-        if not os.path.exists(folder):
-            os.makedirs(folder)
+            file_name = "_".join([str(spec) for spec in spec_list] + [str(age), str(temp), suffix]) + ".txt"
+        folder = "output"
+        os.makedirs(folder, exist_ok=True)
+        return open(os.path.join(folder, file_name),"w",buffering=_OUTPUT_BUFFER_SIZE)
+
+    # Helper function to list the columns of the printers for a list of species
+    #   Returns a list of (name, spec, header), with a bulk and washcoat column
+    #   for each gas species and a single column for surface species and sites.
+    #   Thus, each species is only looked up in the model sets once per printer.
+    def _spec_columns(self, spec_list):
+        columns = []
+        for spec in spec_list:
+            if spec in self.model.gas_set:
+                columns.append(('Cb', spec, str(spec)+'_b'))
+                columns.append(('C', spec, str(spec)+'_w'))
+            elif spec in self.model.surf_set:
+                columns.append(('q', spec, str(spec)))
+            else:
+                columns.append(('S', spec, str(spec)))
+        return columns
 
-        file = open(folder+file_name,"w")
+    # Function to print out results of variables at all locations and times
+    #       If an open 'file' is given, then the results are written to it (and it
+    #       is left open), so that many results can be batched into one file
+    def print_results_all_locations(self, spec_list, age, temp, file_name="", include_temp=False, file=None):
+        spec_list = self._check_spec_list(spec_list)
+        close_file = file == None
+        if close_file == True:
+            file = self._open_results_file(file_name, spec_list, age, temp, "all_loc")
 
         # Embeddd helper function
-        def _print_all_results(model, var, spec, age, temp, file, isTemp=False):
-            tstart = model.t.first()
-            tend = model.t.last()
+        def _print_all_results(model, name, spec, age, temp, file):
+            vals = self._solution_values(name, spec, age, temp)
 
             #Print header first
+            #       (each line is joined and written at once)
+            times = [str(time) for time in model.t]
             file.write('\t'+'Times (across)'+'\n')
-            for time in model.t:
-            	if time == tend:
-            		file.write(str(time)+'\n')
-            	elif time == tstart:
-            		file.write('time ->\t'+str(time)+'\t')
-            	else:
-            		file.write(str(time)+'\t')
-
-            for time in model.t:
-            	if time == tend:
-            		file.write(str(var)+'[@t='+str(time)+']\n')
-            	elif time == tstart:
-            		file.write('Z (down)\t'+str(var)+'[@t='+str(time)+']\t')
-            	else:
-            		file.write(str(var)+'[@t='+str(time)+']\t')
+            file.write('time ->\t'+'\t'.join(times)+'\n')
+            file.write('Z (down)\t'+'\t'.join([str(name)+'[@t='+time+']' for time in times])+'\n')
 
             #Print x results
-            for loc in model.z:
-                for time in model.t:
-                    if time == tstart:
-                        if isTemp == False:
-                            file.write(str(loc)+'\t'+str(value(var[spec,age,temp,loc,time]))+'\t')
-                        else:
-                            file.write(str(loc)+'\t'+str(value(var[age,temp,loc,time]))+'\t')
-                    elif time == tend:
-                        if isTemp == False:
-                            file.write(str(value(var[spec,age,temp,loc,time]))+'\n')
-                        else:
-                            file.write(str(value(var[age,temp,loc,time]))+'\n')
-                    else:
-                        if isTemp == False:
-                            file.write(str(value(var[spec,age,temp,loc,time]))+'\t')
-                        else:
-                            file.write(str(value(var[age,temp,loc,time]))+'\t')
+            for i, loc in enumerate(model.z):
+                file.write(str(loc)+'\t'+'\t'.join(map(str, vals[i]))+'\n')
             file.write('\n')
 
         for spec in spec_list:
             if spec in self.model.gas_set:
                 file.write('Results for bulk '+str(spec)+'_b in table below'+'\n')
-                _print_all_results(self.model, self.model.Cb, spec, age, temp, file)
+                _print_all_results(self.model, 'Cb', spec, age, temp, file)
                 file.write('Results for washcoat '+str(spec)+'_w in table below'+'\n')
-                _print_all_results(self.model, self.model.C, spec, age, temp, file)
+                _print_all_results(self.model, 'C', spec, age, temp, file)
             elif spec in self.model.surf_set:
                 file.write('Results for surface '+str(spec)+' in table below'+'\n')
-                _print_all_results(self.model, self.model.q, spec, age, temp, file)
+                _print_all_results(self.model, 'q', spec, age, temp, file)
             else:
                 file.write('Results for site '+str(spec)+' in table below'+'\n')
-                _print_all_results(self.model, self.model.S, spec, age, temp, file)
+                _print_all_results(self.model, 'S', spec, age, temp, file)
         if include_temp == True:
             file.write('Results for temperature in the table below'+'\n')
-            _print_all_results(self.model, self.model.T, None, age, temp, file, include_temp)
+            _print_all_results(self.model, 'T', None, age, temp, file)
 
         file.write('\n')
-        file.close()
+        if close_file == True:
+            file.close()
 
     # Function to print a list of species at a given node for all times
-    def print_results_of_location(self, spec_list, age, temp, loc, file_name="", include_temp=False):
-        if type(spec_list) is not list:
-            raise Exception("Error! Need to provide species as a list (even if it is just one species)")
-        for spec in spec_list:
-            if spec not in self.model.all_species_set:
-                print("Error! Invalid species given!")
-                raise Exception("\t"+str(spec)+ " is not a species in the model")
-        if file_name == "":
-            for spec in spec_list:
-                file_name+=spec+"_"
-            file_name+=str(age)+"_"+str(temp)+"_"
-            file_name+="loc_z_at_"+str(loc)
-            file_name+=".txt"
-
-        folder="output/"
-        if not os.path.exists(folder):
-            os.makedirs(folder)
-
-        file = open(folder+file_name,"w")
+    #       (see print_results_all_locations for 'file')
+    def print_results_of_location(self, spec_list, age, temp, loc, file_name="", include_temp=False, file=None):
+        spec_list = self._check_spec_list(spec_list)
+        close_file = file == None
+        if close_file == True:
+            file = self._open_results_file(file_name, spec_list, age, temp, "loc_z_at_"+str(loc))
+
+        spec_columns = self._spec_columns(spec_list)
+        if include_temp == True:
+            spec_columns.append(('T', None, "T[K]"))
 
         file.write('Results for z='+str(loc)+' at in table below'+'\n')
-        file.write('Time\t')
-        for spec in spec_list:
-            if spec in self.model.gas_set:
-                file.write(str(spec)+'_b\t'+str(spec)+'_w\t')
-            elif spec in self.model.surf_set:
-                file.write(str(spec)+'\t')
-            else:
-                file.write(str(spec)+'\t')
-        if include_temp == True:
-            file.write("T[K]"+'\t')
-        file.write('\n')
-        for time in self.model.t:
-            file.write(str(time) + '\t')
-            for spec in spec_list:
-                if spec in self.model.gas_set:
-                    file.write(str(value(self.model.Cb[spec,age,temp,loc,time])) + '\t' + str(value(self.model.C[spec,age,temp,loc,time])) + '\t')
-                elif spec in self.model.surf_set:
-                    file.write(str(value(self.model.q[spec,age,temp,loc,time])) + '\t')
-                else:
-                    file.write(str(value(self.model.S[spec,age,temp,loc,time])) + '\t')
-            if include_temp == True:
-                file.write(str(value(self.model.T[age,temp,loc,time])) + '\t')
-            file.write('\n')
+        file.write('Time\t'+''.join([header+'\t' for (name, spec, header) in spec_columns])+'\n')
+        # Gather the time series of each column at this location
+        columns = []
+        for (name, spec, header) in spec_columns:
+            columns.append(self._solution_values(name, spec, age, temp, loc))
+        # Each row is joined and written at once
+        #
+        #   NOTE: np.savetxt also formats the rows in a python loop. It is only
+        #           faster with a fixed format (e.g., '%.17g'), which would change
+        #           the numbers in the files (0.1 -> 0.10000000000000001). With
+        #           '%s' (same output as str()), it is slower than the join.
+        for row in zip(self.model.t, *columns):
+            file.write('\t'.join(map(str, row)) + '\t\n')
         file.write('\n')
-        file.close()
+        if close_file == True:
+            file.close()
 
 
     # Function to print a list of species at the exit of the domain
-    def print_results_of_breakthrough(self, spec_list, age, temp, file_name="", include_temp=False):
-        self.print_results_of_location(spec_list, age, temp, self.model.z.last(), file_name, include_temp)
+    def print_results_of_breakthrough(self, spec_list, age, temp, file_name="", include_temp=False, file=None):
+        self.print_results_of_location(spec_list, age, temp, self.model.z.last(), file_name, include_temp, file)
 
     # Print integrated average results over domain for a species
-    def print_results_of_integral_average(self, spec_list, age, temp, file_name=""):
-        if type(spec_list) is not list:
-            raise Exception("Error! Need to provide species as a list (even if it is just one species)")
-        for spec in spec_list:
-            if spec not in self.model.all_species_set:
-                print("Error! Invalid species given!")
-                raise Exception("\t"+str(spec)+ " is not a species in the model")
-        if file_name == "":
-            for spec in spec_list:
-                file_name+=spec+"_"
-            file_name+=str(age)+"_"+str(temp)+"_"
-            file_name+="integral_avg"
-            file_name+=".txt"
+    #       (see print_results_all_locations for 'file')
+    def print_results_of_integral_average(self, spec_list, age, temp, file_name="", file=None):
+        spec_list = self._check_spec_list(spec_list)
+        close_file = file == None
+        if close_file == True:
+            file = self._open_results_file(file_name, spec_list, age, temp, "integral_avg")
 
-        folder="output/"
-        if not os.path.exists(folder):
-            os.makedirs(folder)
-
-        file = open(folder+file_name,"w")
+        spec_columns = self._spec_columns(spec_list)
 
         file.write('Integral average results in table below'+'\n')
-        file.write('Time\t')
-        for spec in spec_list:
-            if spec in self.model.gas_set:
-                file.write(str(spec)+'_b\t'+str(spec)+'_w\t')
-            elif spec in self.model.surf_set:
-                file.write(str(spec)+'\t')
-            else:
-                file.write(str(spec)+'\t')
-        file.write('\n')
-        for time in self.model.t:
-            file.write(str(time) + '\t')
-            for spec in spec_list:
-                if spec in self.model.gas_set:
-                    #bulk variable
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.Cb[spec,age,temp,loc,time])+value(self.model.Cb[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-
-                    # Washcoat variable
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.C[spec,age,temp,loc,time])+value(self.model.C[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-                elif spec in self.model.surf_set:
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.q[spec,age,temp,loc,time])+value(self.model.q[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-                else:
-                    total = 0
-                    i = 0
-                    for loc in self.model.z:
-                        if i == 0:
-                            loc_old = loc
-                        else:
-                            total += (loc - loc_old)*0.5*(value(self.model.S[spec,age,temp,loc,time])+value(self.model.S[spec,age,temp,loc_old,time]))
-                        i += 1
-                        loc_old = loc
-                    avg = total/(self.model.z.last()-self.model.z.first())
-                    file.write(str(avg) + '\t')
-            file.write('\n')
+        file.write('Time\t'+''.join([header+'\t' for (name, spec, header) in spec_columns])+'\n')
+        # Gather the spatial profiles of each column at all times
+        #       (shape = [column][loc][time])
+        z_arr = np.fromiter(self.model.z, dtype=float)
+        t_list = list(self.model.t)
+        columns = []
+        for (name, spec, header) in spec_columns:
+            columns.append(self._solution_array(name, spec, age, temp))
+
+        # Integrate over the domain for all columns and times at once
+        #       (shape = [time][column])
+        avgs = _trapezoid(np.stack(columns), z_arr, axis=1)
+        avgs = (avgs/(z_arr[-1]-z_arr[0])).T.tolist()
+        for time, row in zip(t_list, avgs):
+            file.write('\t'.join(map(str, [time] + row)) + '\t\n')
         file.write('\n')
-        file.close()
+        if close_file == True:
+            file.close()
 
     # Define a function to print optimal parameter information to a file
     def print_kinetic_parameter_info(self, file_name=""):
@@ -3520,7 +4336,8 @@ class Isothermal_Monolith_Simulator(object):
 
 
     # Define function to unload/save a model state
-    def save_model_state(self, file_name=""):
+    #       format = (optional) "auto" (by file extension), "json", or "msgpack"
+    def save_model_state(self, file_name="", format="auto"):
         if file_name == "":
             file_name+="saved_iso_cat_model_"
             s = str(datetime.datetime.now()).split()
@@ -3533,8 +4350,6 @@ class Isothermal_Monolith_Simulator(object):
         if not os.path.exists(folder):
             os.makedirs(folder)
 
-        file = open(folder+file_name,"w")
-
         # Now, create a dictionary in json based on current model state
         obj = {}
         # Adding time states to top of dictionary for user
@@ -3542,7 +4357,7 @@ class Isothermal_Monolith_Simulator(object):
         #   Most common will likely be the final state
         obj['valid_time_states_for_restart'] = self.model.t.get_finite_elements()
         for attr in dir(self):
-            if not callable(getattr(self, attr)) and not attr.startswith("__"):
+            if not callable(getattr(self, attr)) and not attr.startswith("_"):
                 if attr!='model' and attr!='rxn_list':
                     obj[attr] = getattr(self, attr)
                 #Special treatment is needed for enums in dictionaries
@@ -3792,15 +4607,27 @@ class Isothermal_Monolith_Simulator(object):
 
                     obj['model']['rxn_orders'] = {str(k):v for k, v in self.model.rxn_orders.extract_values().items()}
 
-        json.dump(obj,file)
-        file.close()
+        # Save the ipopt multipliers (if any) to warm start later solves
+        #       (only those of an ok/optimal solve, see '_check_warm_start_results')
+        if self.isWarmStartValid == True:
+            obj['warm_start'] = {}
+            for suffix in ['ipopt_zL_out', 'ipopt_zU_out', 'dual']:
+                obj['warm_start'][suffix] = {}
+                for comp, val in self.model.component(suffix).items():
+                    name = comp.parent_component().name
+                    if name not in obj['warm_start'][suffix]:
+                        obj['warm_start'][suffix][name] = {}
+                    obj['warm_start'][suffix][name][repr(comp.index())] = val
+
+        _dump_model_obj(obj, folder+file_name, format)
 
     # Function to load full model from json file
-    def load_model_full(self, file_name, reset_param_bounds=False):
+    #       format = (optional) "auto" (by file extension), "json", or "msgpack"
+    def load_model_full(self, file_name, reset_param_bounds=False, format="auto"):
         self.load_time = TIME.time()
         print("----------- Attempting to load model from file ------------\n")
         # Attempt to load json file
-        obj = json.load(open(file_name))
+        obj = _load_model_obj(file_name, format)
 
         # Dig into the obj dictionary and setup the model
         self.set_bulk_porosity(obj['model']['eb'])
@@ -3923,6 +4750,16 @@ class Isothermal_Monolith_Simulator(object):
         except:
             print(file_name+" does not contain proper surface data for optimization")
 
+        # Reaction orders must be set before building the rate expressions
+        for key in obj['model']['rxn_orders']:
+            self.model.rxn_orders[literal_eval(key)].set_value(obj['model']['rxn_orders'][key])
+
+        # Molar contributions must also be set before building the reaction sums
+        #       (only the locations that exist before discretization are set here)
+        self.model.u_C.store_values(_saved_values(obj['model']['u_C'], lambda index: index in self.model.u_C))
+        if self.isSurfSpecSet == True:
+            self.model.u_q.store_values(_saved_values(obj['model']['u_q'], lambda index: index in self.model.u_q))
+
         try:
             cp = 1
             dt = DiscretizationMethod.FiniteDifference
@@ -3944,8 +4781,7 @@ class Isothermal_Monolith_Simulator(object):
         print("\n........... loading time-space info for all vars ..........")
 
         # Set functions to perform AFTER discretization
-        for key in obj['model']['T']:
-            self.model.T[literal_eval(key)].set_value(obj['model']['T'][key])
+        self.model.T.set_values(_saved_values(obj['model']['T']))
         for key in obj['model']['space_velocity']:
             self.model.space_velocity[literal_eval(key)].set_value(obj['model']['space_velocity'][key])
         for key in obj['model']['v']:
@@ -3994,21 +4830,16 @@ class Isothermal_Monolith_Simulator(object):
                 self.model.q[literal_eval(key)].set_value(obj['model']['q'][key])
             for key in obj['model']['dq_dt']:
                 self.model.dq_dt[literal_eval(key)].set_value(obj['model']['dq_dt'][key])
-            for key in obj['model']['u_q']:
-                self.model.u_q[literal_eval(key)].set_value(obj['model']['u_q'][key])
+            self.model.u_q.store_values(_saved_values(obj['model']['u_q']))
 
             if self.isSitesSet == True:
                 for key in obj['model']['S']:
                     self.model.S[literal_eval(key)].set_value(obj['model']['S'][key])
-                for key in obj['model']['Smax']:
-                    self.model.Smax[literal_eval(key)].set_value(obj['model']['Smax'][key])
+                self.model.Smax.store_values(_saved_values(obj['model']['Smax']))
                 for key in obj['model']['u_S']:
                     self.model.u_S[literal_eval(key)].set_value(obj['model']['u_S'][key])
 
-        for key in obj['model']['u_C']:
-            self.model.u_C[literal_eval(key)].set_value(obj['model']['u_C'][key])
-        for key in obj['model']['rxn_orders']:
-            self.model.rxn_orders[literal_eval(key)].set_value(obj['model']['rxn_orders'][key])
+        self.model.u_C.store_values(_saved_values(obj['model']['u_C']))
 
         # Need special treatment for reaction values
         for key in obj['model']['A']:
@@ -4104,6 +4935,23 @@ class Isothermal_Monolith_Simulator(object):
                 for temp in self.model.T_set:
                     self.isBoundarySet[spec][age][temp] = True
 
+        # Reattach ipopt multipliers from the prior solve (if they were saved)
+        #       Warm starts are only turned on if some multipliers were loaded
+        if 'warm_start' in obj:
+            self._setup_warm_start_suffixes(False)
+            n_vals = 0
+            for suffix in obj['warm_start']:
+                for name in obj['warm_start'][suffix]:
+                    comp = self.model.find_component(name)
+                    if comp == None:
+                        continue
+                    for key in obj['warm_start'][suffix][name]:
+                        self.model.component(suffix)[comp[literal_eval(key)]] = obj['warm_start'][suffix][name][key]
+                        n_vals += 1
+            if n_vals > 0:
+                self.isWarmStartSet = True
+                self.isWarmStartValid = True
+
         self.isInitialized = True
         self.isIsothermalTempSet = True
 
@@ -4120,6 +4968,7 @@ class Isothermal_Monolith_Simulator(object):
     #
     #       Optional Arg:   state = time state to use as IC from the loaded model
     #                               (default = final state)
+    #                       format = "auto" (by file extension), "json", or "msgpack"
     #
     #   NOTE: User cannot provide new data at this stage. All data should have
     #           been provided in the prior model you attempt to load.
@@ -4129,12 +4978,13 @@ class Isothermal_Monolith_Simulator(object):
     #   NOTE: User MUST also provide new temperature profiles and/or space-velocities
     #           (if applicable). Simulation will otherwise assume new temperatures
     #           are the prior temperatures extended from the final state.
-    def load_model_state_as_IC(self, file_name, new_time_window, tstep=None, state=None, reset_param_bounds=False):
+    def load_model_state_as_IC(self, file_name, new_time_window, tstep=None, state=None, reset_param_bounds=False, format="auto"):
         print("----------- Attempting to load model from file ------------\n")
         self.load_time = TIME.time()
+        self._solution = None
 
         # Attempt to load json file
-        obj = json.load(open(file_name))
+        obj = _load_model_obj(file_name, format)
 
         # Check the new time window
         if type(new_time_window) is list:
@@ -4284,6 +5134,16 @@ class Isothermal_Monolith_Simulator(object):
         except:
             print(file_name+" does not contain proper surface data for optimization")
 
+        # Reaction orders must be set before building the rate expressions
+        for key in obj['model']['rxn_orders']:
+            self.model.rxn_orders[literal_eval(key)].set_value(obj['model']['rxn_orders'][key])
+
+        # Molar contributions must also be set before building the reaction sums
+        #       (only the locations that exist before discretization are set here)
+        self.model.u_C.store_values(_saved_values(obj['model']['u_C'], lambda index: index in self.model.u_C))
+        if self.isSurfSpecSet == True:
+            self.model.u_q.store_values(_saved_values(obj['model']['u_q'], lambda index: index in self.model.u_q))
+
         try:
             cp = 1
             dt = DiscretizationMethod.FiniteDifference
@@ -4304,22 +5164,18 @@ class Isothermal_Monolith_Simulator(object):
         print("\n........... loading time-space info for all vars ..........")
 
         # Set functions to perform AFTER discretization
-        for key in obj['model']['T']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.T[literal_eval(key)].set_value(obj['model']['T'][key])
-        for age in self.model.age_set:
-            for temp in self.model.T_set:
-                for loc in self.model.z:
-                    for time in self.model.t:
-                        self.model.T[age,temp,loc,time].set_value(self.model.T[age,temp,loc,IC_time].value)
-        for key in obj['model']['P']:
-            if literal_eval(key)[-1] == IC_time:
-                self.model.P[literal_eval(key)].set_value(obj['model']['P'][key])
-        for age in self.model.age_set:
-            for temp in self.model.T_set:
-                for loc in self.model.z:
-                    for time in self.model.t:
-                        self.model.P[age,temp,loc,time].set_value(self.model.P[age,temp,loc,IC_time].value)
+        #   (the T and P at IC_time are carried over to all times)
+        t_list = list(self.model.t)
+        at_IC_time = lambda index: index[-1] == IC_time
+        for var_name in ["T", "P"]:
+            var = getattr(self.model, var_name)
+            var.set_values(_saved_values(obj['model'][var_name], at_IC_time))
+            vals = {}
+            for (age,temp,loc,time), var_data in var.items():
+                if time == IC_time:
+                    for t in t_list:
+                        vals[age,temp,loc,t] = var_data.value
+            var.set_values(vals)
         for key in obj['model']['Tref']:
             self.model.Tref[literal_eval(key)].set_value(obj['model']['Tref'][key])
         for key in obj['model']['Pref']:
@@ -4358,10 +5214,7 @@ class Isothermal_Monolith_Simulator(object):
             if literal_eval(key)[-1] == IC_time:
                 self.model.dC_dt[literal_eval(key)].set_value(obj['model']['dC_dt'][key])
 
-        for key in obj['model']['u_C']:
-            self.model.u_C[literal_eval(key)].set_value(obj['model']['u_C'][key])
-        for key in obj['model']['rxn_orders']:
-            self.model.rxn_orders[literal_eval(key)].set_value(obj['model']['rxn_orders'][key])
+        self.model.u_C.store_values(_saved_values(obj['model']['u_C']))
 
         if self.isSurfSpecSet == True:
             for key in obj['model']['q']:
@@ -4370,20 +5223,18 @@ class Isothermal_Monolith_Simulator(object):
             for key in obj['model']['dq_dt']:
                 if literal_eval(key)[-1] == IC_time:
                     self.model.dq_dt[literal_eval(key)].set_value(obj['model']['dq_dt'][key])
-            for key in obj['model']['u_q']:
-                self.model.u_q[literal_eval(key)].set_value(obj['model']['u_q'][key])
+            self.model.u_q.store_values(_saved_values(obj['model']['u_q']))
 
             if self.isSitesSet == True:
                 for key in obj['model']['S']:
                     if literal_eval(key)[-1] == IC_time:
                         self.model.S[literal_eval(key)].set_value(obj['model']['S'][key])
-                for key in obj['model']['Smax']:
-                    if literal_eval(key)[-1] == IC_time:
-                        self.model.Smax[literal_eval(key)].set_value(obj['model']['Smax'][key])
+                self.model.Smax.store_values(_saved_values(obj['model']['Smax'], at_IC_time))
+                # 'set_site_density' sets all locations at once, so the value at
+                #   the first location is what is carried over
                 for site in self.model.site_set:
                     for age in self.model.age_set:
-                        for loc in self.model.z:
-                            self.set_site_density(site, age, self.model.Smax[site,age,loc,IC_time].value)
+                        self.set_site_density(site, age, self.model.Smax[site,age,self.model.z.first(),IC_time].value)
                 for key in obj['model']['u_S']:
                     self.model.u_S[literal_eval(key)].set_value(obj['model']['u_S'][key])
 
@@ -4533,7 +5384,7 @@ class Isothermal_Monolith_Simulator(object):
 
         folder="output/"
         if not os.path.exists(folder):
-            os.makedirs(folder)
+            os.makedirs(folder, exist_ok=True)
 
         if file_type != ".png" and file_type != ".pdf" and file_type != ".ps" and file_type != ".eps" and file_type != ".svg":
             print("Warning! Unsupported image file type...")
@@ -4543,7 +5394,14 @@ class Isothermal_Monolith_Simulator(object):
         full_file_name = folder+file_name+"Plots"+file_type
 
         xvals = list(self.model.t.data())
-        fig,ax = plt.subplots(figsize=(10,5))
+        # Draw on a separate Figure (instead of the global pyplot state)
+        #   so that plots can be safely generated from multiple threads
+        if display_live == True:
+            fig,ax = plt.subplots(figsize=(10,5))
+        else:
+            fig = Figure(figsize=(10,5))
+            FigureCanvasAgg(fig)
+            ax = fig.subplots()
         leg=[]
         # # TODO: These units may change later based on user input units
         x_units = "(min)"
@@ -4572,16 +5430,16 @@ class Isothermal_Monolith_Simulator(object):
                                                             +str(spec)+" given does not exist in model")
                             ax.plot(xvals,yvals)
 
-        plt.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
+        ax.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
         ax.set_xlabel("Time "+x_units)
         ax.set_ylabel(ylab1+y_units)
-        plt.tight_layout()
-        plt.savefig(full_file_name)
+        fig.tight_layout()
+        fig.savefig(full_file_name)
         if display_live == True:
             fig.show()
             print("\nDisplaying plot. Press enter to continue...(this closes the images)")
             input()
-        plt.close()
+            plt.close(fig)
 
 
 
@@ -4639,7 +5497,7 @@ class Isothermal_Monolith_Simulator(object):
 
         folder="output/"
         if not os.path.exists(folder):
-            os.makedirs(folder)
+            os.makedirs(folder, exist_ok=True)
 
         if file_type != ".png" and file_type != ".pdf" and file_type != ".ps" and file_type != ".eps" and file_type != ".svg":
             print("Warning! Unsupported image file type...")
@@ -4649,7 +5507,14 @@ class Isothermal_Monolith_Simulator(object):
         full_file_name = folder+file_name+"Plots"+file_type
 
         xvals = list(self.model.z.data())
-        fig,ax = plt.subplots(figsize=(10,5))
+        # Draw on a separate Figure (instead of the global pyplot state)
+        #   so that plots can be safely generated from multiple threads
+        if display_live == True:
+            fig,ax = plt.subplots(figsize=(10,5))
+        else:
+            fig = Figure(figsize=(10,5))
+            FigureCanvasAgg(fig)
+            ax = fig.subplots()
         leg=[]
         # # TODO: These units may change later based on user input units
         x_units = "(cm)"
@@ -4678,51 +5543,56 @@ class Isothermal_Monolith_Simulator(object):
                                                             +str(spec)+" given does not exist in model")
                             ax.plot(xvals,yvals)
 
-        plt.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
+        ax.legend(leg, loc='center left', bbox_to_anchor=(1, 0.5))
         ax.set_xlabel("Z "+x_units)
         ax.set_ylabel(ylab1+y_units)
-        plt.tight_layout()
-        plt.savefig(full_file_name)
+        fig.tight_layout()
+        fig.savefig(full_file_name)
         if display_live == True:
             fig.show()
             print("\nDisplaying plot. Press enter to continue...(this closes the images)")
             input()
-        plt.close()
+            plt.close(fig)
 
 
-    # Function to plot a species for all times at a series of locations
+    # Function to gather the model and data trajectories of a list of species
+    #   at a single location (for use with plot_vs_data)
     #   User must provide...
-    #       spec = nams of species to plot (must be a gas species)
-    #       age = name of ages to plot
-    #       temp = name of isothermal temperatures to plot
+    #       spec_list = list of species names (gas or surface species with data)
+    #       age = name of ages to gather
+    #       temp = name of isothermal temperatures to gather
     #       loc = value of location for variables and data
-    #       display_live = (optional) If true, plots will be shown to user during runtime
-    #       file_name = (optional) name of file to save
-    #       file_type = (optional) type of image file to save as
-    def plot_vs_data(self, spec, age, temp, loc,
-                    display_live=False, file_name="", file_type=".png"):
-        if spec not in self.model.gas_set:
-            if self.isSurfSpecSet == True:
-                if spec not in self.model.surf_set:
-                    raise Exception("Error! Species name not found in set of model surfaces. "
-                                +str(spec)+" given is not in model.surf_set")
+    #
+    #   Returns a dictionary of tuples for each species as
+    #       traj[spec] = (xvals_model, yvals_model, xvals_data, yvals_data)
+    def gather_trajectories(self, spec_list, age, temp, loc):
+        if type(spec_list) is tuple:
+            spec_list = list(spec_list)
+        if type(spec_list) is not list:
+            raise Exception("Error! Need to provide species as a list (even if it is just one species)")
+        for spec in spec_list:
+            if spec not in self.model.gas_set:
+                if self.isSurfSpecSet == True:
+                    if spec not in self.model.surf_set:
+                        raise Exception("Error! Species name not found in set of model surfaces. "
+                                    +str(spec)+" given is not in model.surf_set")
+                else:
+                    raise Exception("Error! Species name not found in set of model gases. "
+                                +str(spec)+" given is not in model.gas_set")
+            if self.isDataGasSpecSet == True:
+                if spec not in self.model.data_gas_set:
+                    if self.isSurfSpecSet == True:
+                        if spec not in self.model.data_surface_set:
+                            raise Exception("Error! Species name not found in set of data surfaces. "
+                                        +str(spec)+" given is not in model.data_surface_set")
+                    else:
+                        raise Exception("Error! Species name not found in set of data gases. "
+                                    +str(spec)+" given is not in model.data_gas_set")
             else:
-                raise Exception("Error! Species name not found in set of model gases. "
-                            +str(spec)+" given is not in model.gas_set")
-        if self.isDataGasSpecSet == True:
-            if spec not in self.model.data_gas_set:
                 if self.isSurfSpecSet == True:
                     if spec not in self.model.data_surface_set:
                         raise Exception("Error! Species name not found in set of data surfaces. "
                                     +str(spec)+" given is not in model.data_surface_set")
-                else:
-                    raise Exception("Error! Species name not found in set of data gases. "
-                                +str(spec)+" given is not in model.data_gas_set")
-        else:
-            if self.isSurfSpecSet == True:
-                if spec not in self.model.data_surface_set:
-                    raise Exception("Error! Species name not found in set of data surfaces. "
-                                +str(spec)+" given is not in model.data_surface_set")
 
         if age not in self.model.age_set:
             raise Exception("Error! Age name not found in set of model ages. "
@@ -4749,13 +5619,48 @@ class Isothermal_Monolith_Simulator(object):
             #true_loc = self.model.z[nearest_loc_index]
             true_loc = self.model.z.at(nearest_loc_index)
 
+        xvals_model = list(self.model.t.data())
+        xvals_data = list(self.model.t_data.data())
+        traj = {}
+        for spec in spec_list:
+            yvals_data = []
+            if self.isDataGasSpecSet == True:
+                if spec in self.model.data_gas_set:
+                    yvals_data = list(self.model.Cb_data[spec,age,temp,true_data_loc,:].value)
+            if self.isDataSurfSpecSet == True:
+                if spec in self.model.data_surface_set:
+                    yvals_data = list(self.model.q_data[spec,age,temp,true_data_loc,:].value)
+            if spec in self.model.gas_set:
+                yvals_model = list(self.model.Cb[spec,age,temp,true_loc,:].value)
+            else:
+                yvals_model = list(self.model.q[spec,age,temp,true_loc,:].value)
+            traj[spec] = (xvals_model, yvals_model, xvals_data, yvals_data)
+        return traj
+
+    # Function to plot a species for all times at a series of locations
+    #   User must provide...
+    #       spec = nams of species to plot (must be a gas species)
+    #       age = name of ages to plot
+    #       temp = name of isothermal temperatures to plot
+    #       loc = value of location for variables and data
+    #       display_live = (optional) If true, plots will be shown to user during runtime
+    #       file_name = (optional) name of file to save
+    #       file_type = (optional) type of image file to save as
+    #       traj = (optional) tuple of trajectories for spec from gather_trajectories
+    #               (if not given, the trajectories are read from the model)
+    def plot_vs_data(self, spec, age, temp, loc,
+                    display_live=False, file_name="", file_type=".png", traj=None):
+        if traj == None:
+            traj = self.gather_trajectories([spec], age, temp, loc)[spec]
+        (xvals_model, yvals_model, xvals_data, yvals_data) = traj
+
         #Check file name and type
         if file_name == "":
             file_name+=spec+"_"+age+"_"+temp+"_at_"+str(loc)
 
         folder="output/"
         if not os.path.exists(folder):
-            os.makedirs(folder)
+            os.makedirs(folder, exist_ok=True)
 
         if file_type != ".png" and file_type != ".pdf" and file_type != ".ps" and file_type != ".eps" and file_type != ".svg":
             print("Warning! Unsupported image file type...")
@@ -4764,9 +5669,14 @@ class Isothermal_Monolith_Simulator(object):
 
         full_file_name = folder+file_name+"ComparisonPlots"+file_type
 
-        xvals_model = list(self.model.t.data())
-        xvals_data = list(self.model.t_data.data())
-        fig,ax = plt.subplots(figsize=(10,5))
+        # Draw on a separate Figure (instead of the global pyplot state)
+        #   so that plots can be safely generated from multiple threads
+        if display_live == True:
+            fig,ax = plt.subplots(figsize=(10,5))
+        else:
+            fig = Figure(figsize=(10,5))
+            FigureCanvasAgg(fig)
+            ax = fig.subplots()
         leg=[]
         x_units = "(min)"
         y_units = "(mol/L)"
@@ -4774,31 +5684,21 @@ class Isothermal_Monolith_Simulator(object):
         xlab = "Time "+x_units
 
         leg.append(spec+"_Data")
-        if self.isDataGasSpecSet == True:
-            if spec in self.model.data_gas_set:
-                yvals_data = list(self.model.Cb_data[spec,age,temp,true_data_loc,:].value)
-        if self.isDataSurfSpecSet == True:
-            if spec in self.model.data_surface_set:
-                yvals_data = list(self.model.q_data[spec,age,temp,true_data_loc,:].value)
         ax.plot(xvals_data,yvals_data,'or')
 
         leg.append(spec+"_Model")
-        if spec in self.model.gas_set:
-            yvals_model = list(self.model.Cb[spec,age,temp,true_loc,:].value)
-        else:
-            yvals_model = list(self.model.q[spec,age,temp,true_loc,:].value)
         ax.plot(xvals_model,yvals_model,'-k')
 
-        plt.legend(leg, loc='best')
+        ax.legend(leg, loc='best')
         ax.set_xlabel(xlab)
         ax.set_ylabel(ylab)
-        plt.tight_layout()
-        plt.savefig(full_file_name)
+        fig.tight_layout()
+        fig.savefig(full_file_name)
         if display_live == True:
             fig.show()
             print("\nDisplaying plot. Press enter to continue...(this closes the images)")
             input()
-        plt.close()
+            plt.close(fig)
 
 
 
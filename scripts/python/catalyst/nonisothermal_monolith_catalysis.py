@@ -190,78 +190,82 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
     # # TODO: Customize the weight factors in the norm such that temperature
     #           fits will have same weight (on average) as concentration fits
 
+    # Define the inverse of the catalyst temperature
+    #       This is shared by the rate constants of all reactions at a node
+    #       (as an Expression), so 1/Tc is only evaluated once per node
+    def inverse_cat_temp(self, m, age, temp, z, t):
+        return 1/m.Tc[age,temp,z,t]
+
     # Define a single arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
-    def arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
+    def arrhenius_rate_func(self, rxn, model, age, temp, loc, time, T=None, invT=None):
         r = 0
-        k = arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], model.Tc[age,temp,loc,time])
+        if T is None:
+            T = model.Tc[age,temp,loc,time]
+        if invT is None:
+            invT = model.invTc[age,temp,loc,time]
+        k = arrhenius_rate_const(model.A[rxn], model.B[rxn], model.E[rxn], T, invT=invT)
         r=k
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                r=r*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    r=r*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        r=r*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        for (var, spec, order) in self._rxn_rate_terms(rxn, "reactants"):
+            if order is None:
+                r=r*var[spec,age,temp,loc,time]
+            else:
+                r=r*var[spec,age,temp,loc,time]**order
         return r
 
     # Define a single equilibrium arrhenius rate function to be used in the model
     #       This function assumes the reaction index (rxn) is valid
-    def equilibrium_arrhenius_rate_func(self, rxn, model, age, temp, loc, time):
+    def equilibrium_arrhenius_rate_func(self, rxn, model, age, temp, loc, time, T=None, invT=None):
         r = 0
+        if T is None:
+            T = model.Tc[age,temp,loc,time]
+        if invT is None:
+            invT = model.invTc[age,temp,loc,time]
         (Ar, Er) = equilibrium_arrhenius_consts(model.Af[rxn], model.Ef[rxn], model.dH[rxn], model.dS[rxn])
-        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], model.Tc[age,temp,loc,time])
-        kr = arrhenius_rate_const(Ar, 0, Er, model.Tc[age,temp,loc,time])
+        kf = arrhenius_rate_const(model.Af[rxn], 0, model.Ef[rxn], T, invT=invT)
+        kr = arrhenius_rate_const(Ar, 0, Er, T, invT=invT)
         rf=kf
         rr=kr
-        for spec in model.component(rxn+"_reactants"):
-            if spec in model.gas_set:
-                rf=rf*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-            if self.isSurfSpecSet == True:
-                if spec in model.surf_set:
-                    rf=rf*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                if self.isSitesSet == True:
-                    if spec in model.site_set:
-                        rf=rf*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-        for spec in model.component(rxn+"_products"):
-             if spec in model.gas_set:
-                 rr=rr*model.C[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-             if self.isSurfSpecSet == True:
-                 if spec in model.surf_set:
-                     rr=rr*model.q[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
-                 if self.isSitesSet == True:
-                     if spec in model.site_set:
-                         rr=rr*model.S[spec,age,temp,loc,time]**model.rxn_orders[rxn,spec]
+        for (var, spec, order) in self._rxn_rate_terms(rxn, "reactants"):
+            if order is None:
+                rf=rf*var[spec,age,temp,loc,time]
+            else:
+                rf=rf*var[spec,age,temp,loc,time]**order
+        for (var, spec, order) in self._rxn_rate_terms(rxn, "products"):
+            if order is None:
+                rr=rr*var[spec,age,temp,loc,time]
+            else:
+                rr=rr*var[spec,age,temp,loc,time]**order
         r = rf-rr
         return r
 
     # Define a function for the reaction sum for gas species
     def reaction_sum_gas(self, gas_spec, model, age, temp, loc, time):
         r_sum=0
-        for r in model.arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
-        for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_C[gas_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+        (arr_rxns, equ_rxns) = self._rxn_nonzero(model.u_C, gas_spec)
+        for r in arr_rxns:
+            r_sum += model.u_C[gas_spec,r,loc]*model.rxn_rate[r,age,temp,loc,time]
+        for re in equ_rxns:
+            r_sum += model.u_C[gas_spec,re,loc]*model.rxn_rate[re,age,temp,loc,time]
         return r_sum
 
     # Define a function for the reaction sum for surface species
     def reaction_sum_surf(self, surf_spec, model, age, temp, loc, time):
         r_sum=0
-        for r in model.arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
-        for re in model.equ_arrhenius_rxns:
-            r_sum += model.u_q[surf_spec,re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+        (arr_rxns, equ_rxns) = self._rxn_nonzero(model.u_q, surf_spec)
+        for r in arr_rxns:
+            r_sum += model.u_q[surf_spec,r,loc]*model.rxn_rate[r,age,temp,loc,time]
+        for re in equ_rxns:
+            r_sum += model.u_q[surf_spec,re,loc]*model.rxn_rate[re,age,temp,loc,time]
         return r_sum
 
     # Define a function for the reaction sum for energy balance
     def reaction_sum_heats(self, model, age, temp, loc, time):
         r_sum=0
         for r in model.arrhenius_rxns:
-            r_sum += -model.dHrxn[r]*model.d_rxn[r,loc]*self.arrhenius_rate_func(r, model, age, temp, loc, time)
+            r_sum += -model.dHrxn[r]*model.d_rxn[r,loc]*model.rxn_rate[r,age,temp,loc,time]
         for re in model.equ_arrhenius_rxns:
-            r_sum += -model.dHrxn[re]*model.d_rxn[re,loc]*self.equilibrium_arrhenius_rate_func(re, model, age, temp, loc, time)
+            r_sum += -model.dHrxn[re]*model.d_rxn[re,loc]*model.rxn_rate[re,age,temp,loc,time]
         return r_sum
 
     # Define a function for the site sum
@@ -273,15 +277,19 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
     # Bulk mass balance constraint
     def bulk_mb_constraint(self, m, gas, age, temp, z, t):
-        return m.eb*m.dCb_dt[gas, age, temp, z, t] + m.eb*m.v[age,temp,z,t]*m.dCb_dz[gas, age, temp, z, t] == -(1-m.eb)*m.Ga*m.km[gas, age, temp, z, t]*(m.Cb[gas, age, temp, z, t] - m.C[gas, age, temp, z, t])
+        eb = m.eb
+        idx = (gas, age, temp, z, t)
+        return eb*m.dCb_dt[idx] + eb*m.v[age,temp,z,t]*m.dCb_dz[idx] == -(1-eb)*m.Ga*m.km[idx]*(m.Cb[idx] - m.C[idx])
 
     # Washcoat mass balance constraint
     def pore_mb_constraint(self, m, gas, age, temp, z, t):
         rxn_sum=self.reaction_sum_gas(gas, m, age, temp, z, t)
+        eb = m.eb
+        idx = (gas, age, temp, z, t)
         if self.isReactionSetByTotalVolume == False:
-            return m.ew*(1-m.eb)*m.dC_dt[gas, age, temp, z, t] == (1-m.eb)*m.Ga*m.km[gas, age, temp, z, t]*(m.Cb[gas, age, temp, z, t] - m.C[gas, age, temp, z, t]) + (1-m.eb)*rxn_sum
+            return m.ew*(1-eb)*m.dC_dt[idx] == (1-eb)*m.Ga*m.km[idx]*(m.Cb[idx] - m.C[idx]) + (1-eb)*rxn_sum
         else:
-            return m.ew*(1-m.eb)*m.dC_dt[gas, age, temp, z, t] == (1-m.eb)*m.Ga*m.km[gas, age, temp, z, t]*(m.Cb[gas, age, temp, z, t] - m.C[gas, age, temp, z, t]) + rxn_sum
+            return m.ew*(1-eb)*m.dC_dt[idx] == (1-eb)*m.Ga*m.km[idx]*(m.Cb[idx] - m.C[idx]) + rxn_sum
 
     # Adsorption/surface mass balance constraint
     def surf_mb_constraint(self, m, surf, age, temp, z, t):
@@ -344,6 +352,12 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             if self.isRxnBuilt[rxn] == False:
                 raise Exception("Error! Cannot build constraints until reaction info is set. "
                                 +str(rxn)+ " given has not yet been constructed")
+        self._build_rxn_caches()
+        self.model.invTc = Expression(self.model.age_set, self.model.T_set,
+                                self.model.z, self.model.t, rule=self.inverse_cat_temp)
+        self.model.rxn_rate = Expression(self.model.all_rxns, self.model.age_set,
+                                self.model.T_set, self.model.z,
+                                self.model.t, rule=self.reaction_rate)
         self.model.bulk_cons = Constraint(self.model.gas_set, self.model.age_set,
                                 self.model.T_set, self.model.z,
                                 self.model.t, rule=self.bulk_mb_constraint)
@@ -375,8 +389,8 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         self.isConBuilt = True
 
     # Override 'discretize_model'
-    def discretize_model(self, method=DiscretizationMethod.FiniteDifference,
-                        elems=20, tstep=100, colpoints=2):
+    def discretize_model(self, method=DiscretizationMethod.OrthogonalCollocation,
+                        elems=10, tstep=100, colpoints=3):
         Isothermal_Monolith_Simulator.discretize_model(self, method=method,
                         elems=elems, tstep=tstep, colpoints=colpoints)
 
@@ -397,18 +411,27 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         self.model.Ta[:,:,:,:].fix()
         self.model.cpg[:,:,:].fix()
         #       Initialize Tc and cpg
+        #           (values are set with one set_values call per Var, see base class)
+        z_list = list(self.model.z)
+        t_list = list(self.model.t)
+        T_vals = {}
+        cpg_vals = {}
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 T = value(self.model.T[age,temp,self.model.z.first(),self.model.t.first()])
-                self.model.Tc[age,temp,:,:].set_value(T)
-                self.model.Tw[age,temp,:,:].set_value(T)
-                self.model.cpg[age,temp,:].set_value(spec_heat_of_air(T))
+                T_vals.update({(age,temp,loc,time): T for loc in z_list for time in t_list})
+                cpg_vals.update({(age,temp,time): spec_heat_of_air(T) for time in t_list})
+        self.model.Tc.set_values(T_vals)
+        self.model.Tw.set_values(T_vals)
+        self.model.cpg.set_values(cpg_vals)
 
         #       Initialize Kronecker delta
         self.model.d_rxn.fix()
+        d_vals = {}
         for rxn in self.model.all_rxns:
             val = value(self.model.d_rxn[rxn,self.model.z.first()])
-            self.model.d_rxn[rxn,:].set_value(val)
+            d_vals.update({(rxn,loc): val for loc in z_list})
+        self.model.d_rxn.set_values(d_vals)
 
         #       Fix ICs for temperatures
         self.model.T[:,:, :, self.model.t.first()].fix()
@@ -453,10 +476,15 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         self.isBoundaryTempSet[age][temp] = True
         self.isAmbTempSet[age][temp] = True
         self.isIsothermal[age][temp] = True
+        z0 = self.model.z.first()
+        z_list = list(self.model.z)
+        T_vals = {}
         for time in self.model.t:
-            T = value(self.model.T[age,temp,self.model.z.first(),time])
-            self.model.Tc[age,temp,:,time].set_value(T)
-            self.model.Tw[age,temp,:,time].set_value(T)
+            T = value(self.model.T[age,temp,z0,time])
+            for loc in z_list:
+                T_vals[age,temp,loc,time] = T
+        self.model.Tc.set_values(T_vals)
+        self.model.Tw.set_values(T_vals)
 
     # Override 'set_isothermal_temp' (Fix Tc to T)
     def set_isothermal_temp(self,age,temp,value):
@@ -922,19 +950,8 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                                                                 console_out=console_out,
                                                                 options=options)
         else:
-            for spec in self.model.gas_set:
-                for age in self.model.age_set:
-                    for temp in self.model.T_set:
-                        if self.isBoundarySet[spec][age][temp] == False:
-                            raise Exception("Error! Must specify boundaries before attempting to solve. "
-                                            +str(spec)+","+str(age)+","+str(temp)+" given does not have BCs set")
-            if self.isSurfSpecSet == True:
-                for spec in self.model.surf_set:
-                    for age in self.model.age_set:
-                        for temp in self.model.T_set:
-                            if self.isInitialSet[spec][age][temp] == False:
-                                raise Exception("Error! Must specify initial conditions before attempting to solve. "
-                                                +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
+            self._check_BCs_and_ICs()
+            self._check_rxn_orders()
             for age in self.model.age_set:
                 for temp in self.model.T_set:
                     if self.isBoundaryTempSet[age][temp] == False:
@@ -949,6 +966,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
 
             # Setup a dictionary to determine which reaction to unfix after solve
             self.initialize_time = TIME.time()
+            self._solution = None
             fixed_dict = {}
             fixed_heat_dict = {}
             for rxn in self.rxn_list:
@@ -976,59 +994,191 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                 self.model.obj.deactivate()
 
             # Fix all times not associated with current time step
-            self.model.Cb[:, :, :, :, :].fix()
-            self.model.C[:, :, :, :, :].fix()
-            self.model.dCb_dt[:, :, :, :, :].fix()
-            self.model.dC_dt[:, :, :, :, :].fix()
-            self.model.dCb_dz[:, :, :, :, :].fix()
-            self.model.bulk_cons[:, :, :, :, :].deactivate()
-            self.model.pore_cons[:, :, :, :, :].deactivate()
-            self.model.dCb_dz_disc_eq[:, :, :, :, :].deactivate()
-            self.model.dCb_dt_disc_eq[:, :, :, :, :].deactivate()
-            self.model.dC_dt_disc_eq[:, :, :, :, :].deactivate()
+            self._fix_all([self.model.Cb, self.model.C, self.model.dCb_dt,
+                           self.model.dC_dt, self.model.dCb_dz])
+            self._activate_all([self.model.bulk_cons, self.model.pore_cons,
+                                self.model.dCb_dz_disc_eq, self.model.dCb_dt_disc_eq,
+                                self.model.dC_dt_disc_eq], active=False)
             if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                self.model.dCbdz_edge[:, :, :, :].deactivate()
-                self.model.dTdz_edge[:, :, :].deactivate()
-                self.model.d2Tcdz2_back[:,:,:].deactivate()
-                self.model.d2Twdz2_back[:,:,:].deactivate()
-
-            self.model.Tc[:,:,:,:].fix()
-            self.model.Tw[:,:,:,:].fix()
-            self.model.T[:,:,:,:].fix()
-            self.model.dTc_dt[:,:,:,:].fix()
-            self.model.dTw_dt[:,:,:,:].fix()
-            self.model.dT_dt[:,:,:,:].fix()
-            self.model.dT_dz[:,:,:,:].fix()
-            self.model.d2Tc_dz2[:,:,:,:].fix()
-            self.model.d2Tw_dz2[:,:,:,:].fix()
-            self.model.gas_energy[:,:,:,:].deactivate()
-            self.model.solid_energy[:,:,:,:].deactivate()
-            self.model.wall_energy[:,:,:,:].deactivate()
-            self.model.dTc_dt_disc_eq[:,:,:,:].deactivate()
-            self.model.dTw_dt_disc_eq[:,:,:,:].deactivate()
-            self.model.dT_dt_disc_eq[:,:,:,:].deactivate()
-            self.model.dT_dz_disc_eq[:,:,:,:].deactivate()
-            self.model.d2Tc_dz2_disc_eq[:,:,:,:].deactivate()
-            self.model.d2Tw_dz2_disc_eq[:,:,:,:].deactivate()
-            self.model.d2Tcdz2_front[:,:,:].deactivate()
-            self.model.d2Twdz2_front[:,:,:].deactivate()
+                self._activate_all([self.model.dCbdz_edge, self.model.dTdz_edge,
+                                    self.model.d2Tcdz2_back, self.model.d2Twdz2_back], active=False)
+
+            self._fix_all([self.model.Tc, self.model.Tw, self.model.T,
+                           self.model.dTc_dt, self.model.dTw_dt, self.model.dT_dt,
+                           self.model.dT_dz, self.model.d2Tc_dz2,
+                           self.model.d2Tw_dz2])
+            self._activate_all([self.model.gas_energy, self.model.solid_energy,
+                                self.model.wall_energy, self.model.dTc_dt_disc_eq,
+                                self.model.dTw_dt_disc_eq, self.model.dT_dt_disc_eq,
+                                self.model.dT_dz_disc_eq,
+                                self.model.d2Tc_dz2_disc_eq,
+                                self.model.d2Tw_dz2_disc_eq,
+                                self.model.d2Tcdz2_front, self.model.d2Twdz2_front], active=False)
 
             if self.isSurfSpecSet == True:
-                self.model.q[:, :, :, :, :].fix()
-                self.model.dq_dt[:, :, :, :, :].fix()
-                self.model.surf_cons[:, :, :, :, :].deactivate()
-                self.model.dq_dt_disc_eq[:, :, :, :, :].deactivate()
+                self._fix_all([self.model.q, self.model.dq_dt])
+                self._activate_all([self.model.surf_cons, self.model.dq_dt_disc_eq], active=False)
 
                 if self.isSitesSet == True:
-                    self.model.S[:, :, :, :, :].fix()
-                    self.model.site_cons[:, :, :, :, :].deactivate()
+                    self._fix_all([self.model.S])
+                    self._activate_all([self.model.site_cons], active=False)
+
+            # Setup the solver once for all sub-problems
+            #   (only the scaling method is changed from one time step to the next)
+            solver = SolverFactory('ipopt')
+
+            # Check user options
+            for item in options:
+                solver.options[item] = options[item]
+            if 'print_user_options' in options:
+                if options['print_user_options'] == "yes":
+                    solver.options['print_user_options'] = options['print_user_options']
+            else:
+                solver.options['print_user_options'] = 'yes'
+            #   linear_solver -> valid options:
+            #   -------------------------------
+            #       Depends on installed libraries
+            #           'mumps'  --> available on Windows AND 'idaes'
+            #                       (Only option if NOT using 'idaes')
+            #           'ma27' --> NOT available on Windows
+            #                       BUT is available with 'idaes'
+            #                       (Best for Small problems, Not parallel)
+            #           'ma57' --> NOT available on Windows
+            #                       BUT is available with 'idaes'
+            #                       (Best for Medium problems, threaded blas)
+            #           'ma77' --> NOT functional with Windows OR 'idaes'
+            #           'ma86' --> NOT functional with Windows OR 'idaes'
+            #           'ma97' --> NOT available on Windows
+            #                       BUT is available with 'idaes'
+            #                       (Best for Large problems, parallel)
+            #           'pardiso' --> NOT functional with Windows OR 'idaes'
+            #           'wsmp' --> NOT functional with Windows OR 'idaes'
+            #
+            #   NOTE: The solver libraries bundled with 'idaes' are MUCH more
+            #           computationally efficient than the standard Windows
+            #           solver libraries
+            if 'linear_solver' in options:
+                # Force the use of MUMPS if conda environment is not setup for 'idaes'
+                if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
+                    options['linear_solver'] = LinearSolverMethod.MUMPS
+                if options['linear_solver'] == LinearSolverMethod.MUMPS:
+                    # Only available option without 'idaes' enviroment or
+                    #   another precompiled HSL library: https://www.hsl.rl.ac.uk/ipopt/
+                    solver.options['linear_solver'] = 'mumps'
+                elif options['linear_solver'] == LinearSolverMethod.MA27:
+                    # Best for small problems (no parallelization)
+                    solver.options['linear_solver'] = 'ma27'
+                elif options['linear_solver'] == LinearSolverMethod.MA57:
+                    # Best for medium problems (threaded BLAS)
+                    solver.options['linear_solver'] = 'ma57'
+                elif options['linear_solver'] == LinearSolverMethod.MA97:
+                    # Best for large problems (maximizes parallelization)
+                    solver.options['linear_solver'] = 'ma97'
+                else:
+                    print("Error! Invalid solver option")
+                    print("\tValid Options: 'LinearSolverMethod.MUMPS'")
+                    print("\t               'LinearSolverMethod.MA27'")
+                    print("\t               'LinearSolverMethod.MA57'")
+                    print("\t               'LinearSolverMethod.MA97'")
+                    raise Exception("\nNOTE: 'MA' solvers only available if 'idaes' environment is used...")
+            else:
+                if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
+                    solver.options['linear_solver'] = 'mumps'
+                else:
+                    solver.options['linear_solver'] = 'ma97'
+            if 'tol' in options:
+                solver.options['tol'] = options['tol']
+            else:
+                solver.options['tol'] = 1e-8
+            if 'acceptable_tol' in options:
+                solver.options['acceptable_tol'] = options['acceptable_tol']
+            else:
+                solver.options['acceptable_tol'] = 1e-8
+            if 'compl_inf_tol' in options:
+                solver.options['compl_inf_tol'] = options['compl_inf_tol']
+            else:
+                solver.options['compl_inf_tol'] = 1e-8
+            if 'constr_viol_tol' in options:
+                solver.options['constr_viol_tol'] = options['constr_viol_tol']
+            else:
+                solver.options['constr_viol_tol'] = 1e-8
+            if 'max_iter' in options:
+                solver.options['max_iter'] = options['max_iter']
+            else:
+                solver.options['max_iter'] = 3000
+            if 'obj_scaling_factor' in options:
+                solver.options['obj_scaling_factor'] = options['obj_scaling_factor']
+            else:
+                solver.options['obj_scaling_factor'] = 1
+            if 'diverging_iterates_tol' in options:
+                solver.options['diverging_iterates_tol'] = options['diverging_iterates_tol']
+            else:
+                solver.options['diverging_iterates_tol'] = 1e50
+            if 'warm_start_init_point' in options:
+                solver.options['warm_start_init_point'] = options['warm_start_init_point']
+            else:
+                solver.options['warm_start_init_point'] = 'yes'
+
+            # Run solver (tighten the bounds to force good solutions)
+            solver.options['bound_push'] = 1e-2
+            solver.options['bound_frac'] = 1e-2
+            solver.options['slack_bound_push'] = 1e-2
+            solver.options['slack_bound_frac'] = 1e-2
+            solver.options['warm_start_init_point'] = 'yes'
+
+            # Gather the vars and constraints of every sub-problem by time step
+            #   once (in a single pass over each component), so each time step
+            #   below only touches its own items instead of re-scanning the full
+            #   components through slices
+            step_vars = [self.model.Cb, self.model.C, self.model.dCb_dt,
+                            self.model.dC_dt, self.model.dCb_dz]
+            step_cons = [self.model.bulk_cons, self.model.pore_cons,
+                            self.model.dCb_dz_disc_eq, self.model.dCb_dt_disc_eq,
+                            self.model.dC_dt_disc_eq]
+            if self.DiscType == "DiscretizationMethod.FiniteDifference":
+                step_cons.append(self.model.dCbdz_edge)
+            if self.isSurfSpecSet == True:
+                step_vars += [self.model.q, self.model.dq_dt]
+                step_cons += [self.model.surf_cons, self.model.dq_dt_disc_eq]
+                if self.isSitesSet == True:
+                    step_vars.append(self.model.S)
+                    step_cons.append(self.model.site_cons)
+            vars_by_condition = self._group_by_condition(step_vars)
+            cons_by_condition = self._group_by_condition(step_cons)
+
+            # Temperature items are indexed starting with (age, temp, ...)
+            #   (the energy balances are only solved for the non-isothermal runs)
+            if self.DiscType == "DiscretizationMethod.FiniteDifference":
+                self._group_by_condition([self.model.dTdz_edge, self.model.d2Tcdz2_back,
+                                self.model.d2Twdz2_back], start=0, groups=cons_by_condition)
+            nonisothermal = set()
+            for age in self.model.age_set:
+                for temp in self.model.T_set:
+                    if self.isIsothermal[age][temp] == False:
+                        nonisothermal.add((age,temp))
+            if len(nonisothermal) > 0:
+                temp_vars = [self.model.T, self.model.Tc, self.model.Tw,
+                                self.model.dT_dt, self.model.dTc_dt, self.model.dTw_dt,
+                                self.model.dT_dz, self.model.d2Tc_dz2, self.model.d2Tw_dz2]
+                temp_cons = [self.model.gas_energy, self.model.solid_energy,
+                                self.model.wall_energy, self.model.dT_dz_disc_eq,
+                                self.model.dT_dt_disc_eq, self.model.dTc_dt_disc_eq,
+                                self.model.dTw_dt_disc_eq, self.model.d2Tc_dz2_disc_eq,
+                                self.model.d2Tw_dz2_disc_eq, self.model.d2Tcdz2_front,
+                                self.model.d2Twdz2_front]
+                self._group_by_condition(temp_vars, start=0, groups=vars_by_condition, conditions=nonisothermal)
+                self._group_by_condition(temp_cons, start=0, groups=cons_by_condition, conditions=nonisothermal)
 
             # Loops over specific sub-problems to solve
+            z0 = self.model.z.first()
+            gas_list = list(self.model.gas_set)
             for age_solve in self.model.age_set:
                 for temp_solve in self.model.T_set:
 
                     # Inside age_solve && temp_solve
                     print("Initializing for " + str(age_solve) + " -> " + str(temp_solve))
+                    vars_at_time = vars_by_condition[(age_solve,temp_solve)]
+                    cons_at_time = cons_by_condition[(age_solve,temp_solve)]
 
                     i=0
                     for time_solve in self.model.t:
@@ -1036,172 +1186,18 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                         if i > 0:
                             start = TIME.time()
                             print("\t... time_step " + str(time_solve))
-                            self.model.Cb[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.C[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.dCb_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.dC_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.dCb_dz[:, age_solve, temp_solve, :, time_solve].unfix()
-                            self.model.bulk_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                            self.model.pore_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                            self.model.dCb_dz_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                            self.model.dCb_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                            self.model.dC_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-                            if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                                self.model.dCbdz_edge[:, age_solve, temp_solve, time_solve].activate()
-                                self.model.dTdz_edge[age_solve, temp_solve, time_solve].activate()
-                                self.model.d2Tcdz2_back[age_solve, temp_solve, time_solve].activate()
-                                self.model.d2Twdz2_back[age_solve, temp_solve, time_solve].activate()
-
-                            if self.isIsothermal[age_solve][temp_solve] == False:
-                                self.model.T[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.Tc[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.Tw[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.dT_dt[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.dTc_dt[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.dTw_dt[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.dT_dz[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.d2Tc_dz2[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.d2Tw_dz2[age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.gas_energy[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.solid_energy[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.wall_energy[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.dT_dz_disc_eq[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.dT_dt_disc_eq[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.dTc_dt_disc_eq[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.dTw_dt_disc_eq[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.d2Tc_dz2_disc_eq[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.d2Tw_dz2_disc_eq[age_solve, temp_solve, :, time_solve].activate()
-                                self.model.d2Tcdz2_front[age_solve, temp_solve, time_solve].activate()
-                                self.model.d2Twdz2_front[age_solve, temp_solve, time_solve].activate()
-
-
-                            if self.isSurfSpecSet == True:
-                                self.model.q[:, age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.dq_dt[:, age_solve, temp_solve, :, time_solve].unfix()
-                                self.model.surf_cons[:, age_solve, temp_solve, :, time_solve].activate()
-                                self.model.dq_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].activate()
-
-                                if self.isSitesSet == True:
-                                    self.model.S[:, age_solve, temp_solve, :, time_solve].unfix()
-                                    self.model.site_cons[:, age_solve, temp_solve, :, time_solve].activate()
+                            for var in vars_at_time[time_solve]:
+                                var.unfix()
+                            for con in cons_at_time[time_solve]:
+                                con.activate()
 
                             # Make sure the vars that should be fixed, are fixed
-                            #   Fix ICs, BCs, and dCb_dt @ z=0, t=0
-                            self.model.dCb_dt[:,age_solve, temp_solve,self.model.z.first(),self.model.t.first()].fix()
-                            self.model.Cb[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                            self.model.C[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                            if self.isSurfSpecSet == True:
-                                self.model.q[:,age_solve, temp_solve, :, self.model.t.first()].fix()
-                            self.model.Cb[:,age_solve, temp_solve,self.model.z.first(), :].fix()
-
-                            self.model.dT_dt[age_solve, temp_solve,self.model.z.first(),self.model.t.first()].fix()
-                            self.model.T[age_solve, temp_solve, :, self.model.t.first()].fix()
-                            self.model.Tc[age_solve, temp_solve, :, self.model.t.first()].fix()
-                            self.model.Tw[age_solve, temp_solve, :, self.model.t.first()].fix()
-                            self.model.T[age_solve, temp_solve,self.model.z.first(), :].fix()
+                            #   (ICs @ t=0 are never unfixed, so only the BCs @ z=0 need it)
+                            for spec in gas_list:
+                                self.model.Cb[spec, age_solve, temp_solve, z0, time_solve].fix()
+                            self.model.T[age_solve, temp_solve, z0, time_solve].fix()
 
                             #Inside age_solve, temp_solve, and time_solve
-                            solver = SolverFactory('ipopt')
-
-                            # Check user options
-                            for item in options:
-                                solver.options[item] = options[item]
-                            if 'print_user_options' in options:
-                                if options['print_user_options'] == "yes":
-                                    solver.options['print_user_options'] = options['print_user_options']
-                            else:
-                                solver.options['print_user_options'] = 'yes'
-                            #   linear_solver -> valid options:
-                            #   -------------------------------
-                            #       Depends on installed libraries
-                            #           'mumps'  --> available on Windows AND 'idaes'
-                            #                       (Only option if NOT using 'idaes')
-                            #           'ma27' --> NOT available on Windows
-                            #                       BUT is available with 'idaes'
-                            #                       (Best for Small problems, Not parallel)
-                            #           'ma57' --> NOT available on Windows
-                            #                       BUT is available with 'idaes'
-                            #                       (Best for Medium problems, threaded blas)
-                            #           'ma77' --> NOT functional with Windows OR 'idaes'
-                            #           'ma86' --> NOT functional with Windows OR 'idaes'
-                            #           'ma97' --> NOT available on Windows
-                            #                       BUT is available with 'idaes'
-                            #                       (Best for Large problems, parallel)
-                            #           'pardiso' --> NOT functional with Windows OR 'idaes'
-                            #           'wsmp' --> NOT functional with Windows OR 'idaes'
-                            #
-                            #   NOTE: The solver libraries bundled with 'idaes' are MUCH more
-                            #           computationally efficient than the standard Windows
-                            #           solver libraries
-                            if 'linear_solver' in options:
-                                # Force the use of MUMPS if conda environment is not setup for 'idaes'
-                                if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
-                                    options['linear_solver'] = LinearSolverMethod.MUMPS
-                                if options['linear_solver'] == LinearSolverMethod.MUMPS:
-                                    # Only available option without 'idaes' enviroment or
-                                    #   another precompiled HSL library: https://www.hsl.rl.ac.uk/ipopt/
-                                    solver.options['linear_solver'] = 'mumps'
-                                elif options['linear_solver'] == LinearSolverMethod.MA27:
-                                    # Best for small problems (no parallelization)
-                                    solver.options['linear_solver'] = 'ma27'
-                                elif options['linear_solver'] == LinearSolverMethod.MA57:
-                                    # Best for medium problems (threaded BLAS)
-                                    solver.options['linear_solver'] = 'ma57'
-                                elif options['linear_solver'] == LinearSolverMethod.MA97:
-                                    # Best for large problems (maximizes parallelization)
-                                    solver.options['linear_solver'] = 'ma97'
-                                else:
-                                    print("Error! Invalid solver option")
-                                    print("\tValid Options: 'LinearSolverMethod.MUMPS'")
-                                    print("\t               'LinearSolverMethod.MA27'")
-                                    print("\t               'LinearSolverMethod.MA57'")
-                                    print("\t               'LinearSolverMethod.MA97'")
-                                    raise Exception("\nNOTE: 'MA' solvers only available if 'idaes' environment is used...")
-                            else:
-                                if "idaes" not in os.environ['CONDA_DEFAULT_ENV']:
-                                    solver.options['linear_solver'] = 'mumps'
-                                else:
-                                    solver.options['linear_solver'] = 'ma97'
-                            if 'tol' in options:
-                                solver.options['tol'] = options['tol']
-                            else:
-                                solver.options['tol'] = 1e-8
-                            if 'acceptable_tol' in options:
-                                solver.options['acceptable_tol'] = options['acceptable_tol']
-                            else:
-                                solver.options['acceptable_tol'] = 1e-8
-                            if 'compl_inf_tol' in options:
-                                solver.options['compl_inf_tol'] = options['compl_inf_tol']
-                            else:
-                                solver.options['compl_inf_tol'] = 1e-8
-                            if 'constr_viol_tol' in options:
-                                solver.options['constr_viol_tol'] = options['constr_viol_tol']
-                            else:
-                                solver.options['constr_viol_tol'] = 1e-8
-                            if 'max_iter' in options:
-                                solver.options['max_iter'] = options['max_iter']
-                            else:
-                                solver.options['max_iter'] = 3000
-                            if 'obj_scaling_factor' in options:
-                                solver.options['obj_scaling_factor'] = options['obj_scaling_factor']
-                            else:
-                                solver.options['obj_scaling_factor'] = 1
-                            if 'diverging_iterates_tol' in options:
-                                solver.options['diverging_iterates_tol'] = options['diverging_iterates_tol']
-                            else:
-                                solver.options['diverging_iterates_tol'] = 1e50
-                            if 'warm_start_init_point' in options:
-                                solver.options['warm_start_init_point'] = options['warm_start_init_point']
-                            else:
-                                solver.options['warm_start_init_point'] = 'yes'
-
-                            # Run solver (tighten the bounds to force good solutions)
-                            solver.options['bound_push'] = 1e-2
-                            solver.options['bound_frac'] = 1e-2
-                            solver.options['slack_bound_push'] = 1e-2
-                            solver.options['slack_bound_frac'] = 1e-2
-                            solver.options['warm_start_init_point'] = 'yes'
-
                             if self.model.find_component('scaling_factor'):
                                 solver.options['nlp_scaling_method'] = 'user-scaling'
                             else:
@@ -1221,53 +1217,10 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                                 print("\tTermination Condition: " + str(results.solver.termination_condition))
 
                             # Fix the steps that were just solved
-                            self.model.Cb[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.C[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.dCb_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.dC_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.dCb_dz[:, age_solve, temp_solve, :, time_solve].fix()
-                            self.model.bulk_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            self.model.pore_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            self.model.dCb_dz_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            self.model.dCb_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            self.model.dC_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-                            if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                                self.model.dCbdz_edge[:, age_solve, temp_solve, time_solve].deactivate()
-                                self.model.dTdz_edge[age_solve, temp_solve, time_solve].deactivate()
-                                self.model.d2Tcdz2_back[age_solve, temp_solve, time_solve].deactivate()
-                                self.model.d2Twdz2_back[age_solve, temp_solve, time_solve].deactivate()
-
-                            if self.isIsothermal[age_solve][temp_solve] == False:
-                                self.model.T[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.Tc[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.Tw[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.dT_dt[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.dTc_dt[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.dTw_dt[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.dT_dz[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.d2Tc_dz2[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.d2Tw_dz2[age_solve, temp_solve, :, time_solve].fix()
-                                self.model.gas_energy[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.solid_energy[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.wall_energy[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.dT_dz_disc_eq[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.dT_dt_disc_eq[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.dTc_dt_disc_eq[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.dTw_dt_disc_eq[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.d2Tc_dz2_disc_eq[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.d2Tw_dz2_disc_eq[age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.d2Tcdz2_front[age_solve, temp_solve, time_solve].deactivate()
-                                self.model.d2Twdz2_front[age_solve, temp_solve, time_solve].deactivate()
-
-                            if self.isSurfSpecSet == True:
-                                self.model.q[:, age_solve, temp_solve, :, time_solve].fix()
-                                self.model.dq_dt[:, age_solve, temp_solve, :, time_solve].fix()
-                                self.model.surf_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
-                                self.model.dq_dt_disc_eq[:, age_solve, temp_solve, :, time_solve].deactivate()
-
-                                if self.isSitesSet == True:
-                                    self.model.S[:, age_solve, temp_solve, :, time_solve].fix()
-                                    self.model.site_cons[:, age_solve, temp_solve, :, time_solve].deactivate()
+                            for var in vars_at_time[time_solve]:
+                                var.fix()
+                            for con in cons_at_time[time_solve]:
+                                con.deactivate()
 
                         else:
                             # i = 0, don't do anything
@@ -1278,19 +1231,13 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             # End age_solve loop
 
             # Unfix all variables
-            self.model.Cb[:, :, :, :, :].unfix()
-            self.model.C[:, :, :, :, :].unfix()
-            self.model.dCb_dt[:, :, :, :, :].unfix()
-            self.model.dC_dt[:, :, :, :, :].unfix()
-            self.model.dCb_dz[:, :, :, :, :].unfix()
-            self.model.bulk_cons[:, :, :, :, :].activate()
-            self.model.pore_cons[:, :, :, :, :].activate()
-            self.model.dCb_dz_disc_eq[:, :, :, :, :].activate()
-            self.model.dCb_dt_disc_eq[:, :, :, :, :].activate()
-            self.model.dC_dt_disc_eq[:, :, :, :, :].activate()
+            self._fix_all([self.model.Cb, self.model.C, self.model.dCb_dt,
+                           self.model.dC_dt, self.model.dCb_dz], fix=False)
+            self._activate_all([self.model.bulk_cons, self.model.pore_cons,
+                                self.model.dCb_dz_disc_eq, self.model.dCb_dt_disc_eq,
+                                self.model.dC_dt_disc_eq])
             if self.DiscType == "DiscretizationMethod.FiniteDifference":
-                self.model.dCbdz_edge[:, :, :, :].activate()
-                self.model.dTdz_edge[:, :, :].activate()
+                self._activate_all([self.model.dCbdz_edge, self.model.dTdz_edge])
 
             for age in self.model.age_set:
                 for temp in self.model.T_set:
@@ -1320,14 +1267,12 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                         self.model.d2Twdz2_front[age, temp, :].activate()
 
             if self.isSurfSpecSet == True:
-                self.model.q[:, :, :, :, :].unfix()
-                self.model.dq_dt[:, :, :, :, :].unfix()
-                self.model.surf_cons[:, :, :, :, :].activate()
-                self.model.dq_dt_disc_eq[:, :, :, :, :].activate()
+                self._fix_all([self.model.q, self.model.dq_dt], fix=False)
+                self._activate_all([self.model.surf_cons, self.model.dq_dt_disc_eq])
 
                 if self.isSitesSet == True:
-                    self.model.S[:, :, :, :, :].unfix()
-                    self.model.site_cons[:, :, :, :, :].activate()
+                    self._fix_all([self.model.S], fix=False)
+                    self._activate_all([self.model.site_cons])
 
             # Make sure boundaries and ICs are re-fixed
             self.model.dCb_dt[:,:,:,self.model.z.first(),self.model.t.first()].fix()
@@ -1387,20 +1332,11 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
                                                     'constr_viol_tol': 1e-6,
                                                     'max_iter': 3000,
                                                     'obj_scaling_factor': 1,
-                                                    'diverging_iterates_tol': 1e50}):
-        for spec in self.model.gas_set:
-            for age in self.model.age_set:
-                for temp in self.model.T_set:
-                    if self.isBoundarySet[spec][age][temp] == False:
-                        raise Exception("Error! Must specify boundaries before attempting to solve. "
-                                        +str(spec)+","+str(age)+","+str(temp)+" given does not have BCs set")
-        if self.isSurfSpecSet == True:
-            for spec in self.model.surf_set:
-                for age in self.model.age_set:
-                    for temp in self.model.T_set:
-                        if self.isInitialSet[spec][age][temp] == False:
-                            raise Exception("Error! Must specify initial conditions before attempting to solve. "
-                                            +str(spec)+","+str(age)+","+str(temp)+" given does not have ICs set")
+                                                    'diverging_iterates_tol': 1e50},
+                                                    use_analytic_jacobian=True,
+                                                    warm_start=None):
+        self._check_BCs_and_ICs()
+        self._check_rxn_orders()
         for age in self.model.age_set:
             for temp in self.model.T_set:
                 if self.isBoundaryTempSet[age][temp] == False:
@@ -1513,6 +1449,29 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         else:
             solver.options['warm_start_init_point'] = 'yes'
 
+        #   Derivative information for ipopt:
+        #   ---------------------------------
+        #       Pyomo writes the full symbolic expression graph of every
+        #       constraint (including all Arrhenius rate terms) to the .nl
+        #       file, so ipopt evaluates exact first and second derivatives
+        #       through automatic differentiation in the ASL. This is MUCH
+        #       faster and more robust for these stiff kinetic systems than
+        #       finite differences.
+        #
+        #       use_analytic_jacobian = False will force finite-difference
+        #       Jacobians and a quasi-Newton (limited-memory) Hessian, which
+        #       is only useful for debugging derivative issues.
+        if 'jacobian_approximation' not in options:
+            if use_analytic_jacobian == True:
+                solver.options['jacobian_approximation'] = 'exact'
+            else:
+                solver.options['jacobian_approximation'] = 'finite-difference-values'
+        if 'hessian_approximation' not in options:
+            if use_analytic_jacobian == True:
+                solver.options['hessian_approximation'] = 'exact'
+            else:
+                solver.options['hessian_approximation'] = 'limited-memory'
+
         # Call the solver
         if self.isInitialized == True:
             # MORE INFO: https://coin-or.github.io/Ipopt/OPTIONS.html
@@ -1551,6 +1510,21 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
         else:
             solver.options['nlp_scaling_method'] = 'gradient-based'
 
+        # Check if we should warm start from the multipliers of a prior solve
+        #       (by default, only if multipliers were loaded with the model)
+        self._solution = None
+        if warm_start == None:
+            warm_start = self.isWarmStartSet
+        self._setup_warm_start_suffixes(warm_start)
+        if warm_start == True:
+            solver.options['warm_start_init_point'] = 'yes'
+            if 'warm_start_bound_push' not in options:
+                solver.options['warm_start_bound_push'] = 1e-9
+            if 'warm_start_mult_bound_push' not in options:
+                solver.options['warm_start_mult_bound_push'] = 1e-9
+            if 'mu_init' not in options:
+                solver.options['mu_init'] = 1e-6
+
         results = solver.solve(self.model, tee=console_out, load_solutions=False)
         if results.solver.status == SolverStatus.ok:
             self.model.solutions.load_from(results)
@@ -1563,6 +1537,7 @@ class Nonisothermal_Monolith_Simulator(Isothermal_Monolith_Simulator):
             print("An Error has occurred!")
             print("\tStatus: " + str(results.solver.status))
             print("\tTermination Condition: " + str(results.solver.termination_condition))
+        self._check_warm_start_results(results)
 
         self.solve_time = (TIME.time() - self.solve_time)
 
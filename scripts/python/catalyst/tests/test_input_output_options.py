@@ -4,6 +4,8 @@ sys.path.append('../..')
 
 import unittest
 import pytest
+import json
+from pyomo.opt import SolverResults
 from catalyst.isothermal_monolith_catalysis import *
 
 import logging
@@ -479,6 +481,15 @@ class TestIsothermalCatalystInputOutputOptions():
         test.print_results_of_integral_average(["q1","S1"], "Unaged", "250C", file_name="")
         assert path.exists("output/q1_S1_Unaged_250C_integral_avg.txt") == True
 
+        test.print_results_of_breakthrough(("NH3",), "Unaged", "250C", file_name="NH3_tuple_breakthrough.txt")
+        assert path.exists("output/NH3_tuple_breakthrough.txt") == True
+
+        solution = test.extract_solution()
+        assert solution[("Cb","NH3","Unaged","250C")].shape == (len(test.model.z), len(test.model.t))
+        assert ("T",None,"Unaged","250C") in solution.keys()
+        test.print_results_of_breakthrough(["NH3"], "Unaged", "250C", file_name="NH3_cached_breakthrough.txt")
+        assert open("output/NH3_cached_breakthrough.txt").read() == open("output/NH3_tuple_breakthrough.txt").read()
+
     @pytest.mark.unit
     def test_print_kinetics(self, isothermal_io_object):
         test = isothermal_io_object
@@ -680,6 +691,13 @@ class TestIsothermalCatalystInputOutputOptions():
         test5.plot_vs_data("q1", "Unaged", "250C", 0.05, display_live=False,
                             file_name="surface_plot_v_data_mid")
         assert path.exists("output/surface_plot_v_data_midComparisonPlots.png") == True
+
+        traj = test5.gather_trajectories(["q1"], "Unaged", "250C", 0.05)
+        assert len(traj["q1"][0]) == len(traj["q1"][1])
+        assert len(traj["q1"][2]) == len(traj["q1"][3])
+        test5.plot_vs_data("q1", "Unaged", "250C", 0.05, display_live=False,
+                            file_name="surface_plot_v_data_traj", traj=traj["q1"])
+        assert path.exists("output/surface_plot_v_data_trajComparisonPlots.png") == True
         assert pytest.approx(test5.model.q["q1","Unaged","250C",0.05,9].value, 1e-3) == 0.054099103442522944
 
         # Test loading of a model state
@@ -717,3 +735,289 @@ class TestIsothermalCatalystInputOutputOptions():
 
         assert pytest.approx(137931.0344827586, rel=1e-3) == test.model.w["NH3","Unaged","250C", test.model.t_data.first()].value
         assert pytest.approx(0, rel=1e-3) == test.model.w["NH3","Unaged","250C", test.model.t_data.last()].value
+
+        test.set_weight_mask(["NH3","q1"], time_window=(0,7), age_list=["Unaged"], temp_list=["250C"])
+
+        assert pytest.approx(0, rel=1e-3) == test.model.w["NH3","Unaged","250C", test.model.t_data.first()].value
+        assert pytest.approx(0, rel=1e-3) == test.model.w["NH3","Unaged","250C", 5.0].value
+        assert pytest.approx(137931.0344827586, rel=1e-3) == test.model.w["NH3","Unaged","250C", 10.0].value
+        assert pytest.approx(8.440922883914233, rel=1e-3) == test.model.wq["q1","Unaged","250C", 10.0].value
+
+    @pytest.mark.unit
+    def test_to_casadi(self):
+        if casadi == None:
+            pytest.skip("casadi is not installed")
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model_with_surface.json')
+        solver, args, var_list = test.to_casadi()
+
+        assert len(var_list) == len(args['x0'])
+        assert len(args['lbg']) == len(list(test.model.component_data_objects(Constraint, active=True)))
+
+        # Constraint residuals must match those of the pyomo model
+        g = solver.get_function('nlp_g')(args['x0'], []).full().flatten()
+        i = 0
+        for con in test.model.component_data_objects(Constraint, active=True):
+            assert pytest.approx(value(con.body), rel=1e-10, abs=1e-14) == g[i]
+            i += 1
+
+    @pytest.mark.unit
+    def test_update_parameters_only(self):
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model.json')
+        con = test.model.pore_cons["NH3","Unaged","250C",2.5,5.75]
+        old_res = value(con.body)
+        old_lb = value(test.model.A["r1"].lb)
+
+        test.update_parameters_only({"r1": {"A": test.model.A["r1"].value*2, "E_lb": 100, "E_ub": 1e6,
+                                        "E": test.model.E["r1"].value}})
+
+        assert pytest.approx(value(test.model.A["r1"].lb), rel=1e-10) == old_lb
+        assert pytest.approx(value(test.model.E["r1"].lb), rel=1e-10) == 100
+        assert pytest.approx(value(test.model.E["r1"].ub), rel=1e-10) == 1e6
+        assert value(con.body) != old_res
+
+        with pytest.raises(Exception):
+            test.update_parameters_only({"r1": {"dH": 0}})
+
+    @pytest.mark.unit
+    def test_rxn_order_changed_after_build(self):
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model.json')
+
+        # First order factors are built into the rate expressions
+        test.model.rxn_orders["r1","NH3"].set_value(2)
+        with pytest.raises(Exception, match="Reaction order of NH3 in r1"):
+            test.initialize_simulator()
+
+    @pytest.mark.unit
+    def test_molar_contribution_changed_after_build(self, tmp_path):
+        # Save a copy of the model where NH3 has no contribution to r1
+        with open('output/sample_model.json') as file:
+            obj = json.load(file)
+        for key in obj['model']['u_C']:
+            obj['model']['u_C'][key] = 0
+        with open(tmp_path/"zero_u_C.json", "w") as file:
+            json.dump(obj, file)
+
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full(str(tmp_path/"zero_u_C.json"))
+        con = test.model.pore_cons["NH3","Unaged","250C",2.5,5.75]
+        old_res = value(con.body)
+
+        # NH3 is still a declared reactant, so its term was built
+        test.model.u_C["NH3","r1",2.5].set_value(-1)
+        assert value(con.body) != old_res
+
+    @pytest.mark.unit
+    def test_scaling_cache(self, tmp_path, monkeypatch):
+        folder = str(tmp_path)
+
+        def load():
+            test = Isothermal_Monolith_Simulator()
+            test.load_model_full('output/sample_model.json')
+            # The saved model is unsolved, so give the derivatives a nonzero scale
+            for name in ['dCb_dz','dCb_dt','dC_dt','dq_dt']:
+                for var in getattr(test.model, name).values():
+                    var.set_value(1.0)
+            return test
+
+        def scaling(test):
+            return {k.name: v for k, v in test.model.scaling_factor.items()}
+
+        def no_maxima():
+            raise AssertionError("constraint residuals should come from the cache")
+
+        test = load()
+        test.finalize_auto_scaling(cache_folder=folder)
+        assert len(os.listdir(folder)) == 1
+        expected = scaling(test)
+
+        # The same model reads the residuals back from the cache
+        test = load()
+        test._constraint_scaling_maxima = no_maxima
+        test.finalize_auto_scaling(cache_folder=folder)
+        assert scaling(test) == expected
+        assert len(os.listdir(folder)) == 1
+
+        # A changed BC misses the cache
+        test = load()
+        bc = test.model.Cb["NH3","Unaged","250C",0,2.75]
+        bc.set_value(2*bc.value+1)
+        test.finalize_auto_scaling(cache_folder=folder)
+        assert len(os.listdir(folder)) == 2
+
+        # A changed IC misses the cache
+        test = load()
+        ic = test.model.C["NH3","Unaged","250C",0.5,0]
+        ic.set_value(2*ic.value+1)
+        test.finalize_auto_scaling(cache_folder=folder)
+        assert len(os.listdir(folder)) == 3
+
+        # Only the newest files are kept
+        monkeypatch.setattr(sys.modules[Isothermal_Monolith_Simulator.__module__], "_SCALING_CACHE_SIZE", 2)
+        test = load()
+        ic = test.model.C["NH3","Unaged","250C",0.5,0]
+        ic.set_value(ic.value+2)
+        test.finalize_auto_scaling(cache_folder=folder)
+        assert len(os.listdir(folder)) == 2
+
+    @pytest.mark.unit
+    def test_warm_start_only_saved_after_optimal_solve(self):
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model.json')
+        assert test.isWarmStartSet == False
+
+        # Multipliers as if returned from a solve
+        test._setup_warm_start_suffixes(False)
+        var = test.model.Cb["NH3","Unaged","250C",2.5,5.75]
+        con = test.model.bulk_cons["NH3","Unaged","250C",2.5,5.75]
+
+        results = SolverResults()
+        results.solver.status = SolverStatus.warning
+        results.solver.termination_condition = TerminationCondition.maxIterations
+        test.model.ipopt_zL_out[var] = 0.5
+        test.model.dual[con] = 2.0
+        test._check_warm_start_results(results)
+        assert len(test.model.ipopt_zL_out) == 0
+        assert len(test.model.dual) == 0
+
+        test.save_model_state(file_name="warm_start_failed.json")
+        with open("output/warm_start_failed.json") as file:
+            assert 'warm_start' not in json.load(file)
+        test2 = Isothermal_Monolith_Simulator()
+        test2.load_model_full("output/warm_start_failed.json")
+        assert test2.isWarmStartSet == False
+
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        test.model.ipopt_zL_out[var] = 0.5
+        test.model.dual[con] = 2.0
+        test._check_warm_start_results(results)
+        test.save_model_state(file_name="warm_start_optimal.json")
+        test2 = Isothermal_Monolith_Simulator()
+        test2.load_model_full("output/warm_start_optimal.json")
+        assert test2.isWarmStartSet == True
+        assert test2.model.ipopt_zL_out[test2.model.Cb["NH3","Unaged","250C",2.5,5.75]] == 0.5
+        assert test2.model.dual[test2.model.bulk_cons["NH3","Unaged","250C",2.5,5.75]] == 2.0
+
+    @pytest.mark.solver
+    def test_warm_start_round_trip(self):
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model.json')
+        (stat, cond) = test.run_solver()
+        assert cond == TerminationCondition.optimal
+        assert test.isWarmStartValid == True
+        test.save_model_state(file_name="warm_start_round_trip.json")
+
+        # The saved multipliers turn on the warm start for the default solve
+        test2 = Isothermal_Monolith_Simulator()
+        test2.load_model_full("output/warm_start_round_trip.json")
+        assert test2.isWarmStartSet == True
+        assert len(test2.model.ipopt_zL_out) == len(test.model.ipopt_zL_out)
+        (stat, cond) = test2.run_solver()
+        assert cond == TerminationCondition.optimal
+        assert pytest.approx(value(test.model.Cb["NH3","Unaged","250C",5,5.75]), rel=1e-4) == \
+            value(test2.model.Cb["NH3","Unaged","250C",5,5.75])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("format", ["json", "msgpack"])
+    def test_save_and_load_format(self, format):
+        if format == "msgpack":
+            pytest.importorskip("msgpack")
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model.json')
+        # Non-finite values must survive the round trip (not come back as None)
+        test.model.Cb["NH3","Unaged","250C",2.5,5.75].set_value(float('nan'))
+        test.model.C["NH3","Unaged","250C",2.5,5.75].set_value(float('inf'))
+        test.save_model_state(file_name="format_test."+format, format=format)
+
+        test2 = Isothermal_Monolith_Simulator()
+        test2.load_model_full("output/format_test."+format, format=format)
+        assert np.isnan(test2.model.Cb["NH3","Unaged","250C",2.5,5.75].value)
+        assert test2.model.C["NH3","Unaged","250C",2.5,5.75].value == float('inf')
+        assert test2.model.A["r1"].value == test.model.A["r1"].value
+        assert test2.model.C["NH3","Unaged","250C",5,5.75].value == \
+            test.model.C["NH3","Unaged","250C",5,5.75].value
+
+    @pytest.mark.unit
+    def test_run_solver_with_dynamic_tolerance(self):
+        # Stand-in for 'run_solver' that returns the given termination conditions
+        def stub_solver(test, conditions):
+            calls = []
+            def run_solver(console_out=True, options={}, use_analytic_jacobian=True, warm_start=None):
+                calls.append((options['tol'], options.get('warm_start_init_point'), warm_start))
+                return (SolverStatus.ok, conditions[len(calls)-1])
+            test.run_solver = run_solver
+            return calls
+
+        opt = TerminationCondition.optimal
+        maxit = TerminationCondition.maxIterations
+
+        # Tightens by 10x after each solve down to final_tol, warm starting after the first
+        test = Isothermal_Monolith_Simulator()
+        calls = stub_solver(test, [opt]*6)
+        options = {'max_iter': 10}
+        result = test.run_solver_with_dynamic_tolerance(options=options)
+        assert result[1] == opt
+        assert [c[0] for c in calls] == pytest.approx([1e-3, 1e-4, 1e-5, 1e-6])
+        assert calls[0][1:] == (None, None)
+        assert all(c[1:] == ('yes', True) for c in calls[1:])
+        assert options == {'max_iter': 10}
+
+        # Loosens the tolerance after hitting max_iter, then tightens again
+        test = Isothermal_Monolith_Simulator()
+        calls = stub_solver(test, [opt, maxit, opt, opt, opt, opt])
+        test.run_solver_with_dynamic_tolerance(options={})
+        assert [c[0] for c in calls] == pytest.approx([1e-3, 1e-4, 1.1e-4, 1.1e-5, 1.1e-6, 1e-6])
+
+        # Loosening is capped at max_tol and limited by max_attempts
+        test = Isothermal_Monolith_Simulator()
+        calls = stub_solver(test, [maxit]*6)
+        result = test.run_solver_with_dynamic_tolerance(options={}, initial_tol=1e-2, max_tol=1.2e-2,
+                                                        max_attempts=4)
+        assert result[1] == maxit
+        assert [c[0] for c in calls] == pytest.approx([1e-2, 1.1e-2, 1.2e-2, 1.2e-2])
+
+        # Any other failure stops right away
+        test = Isothermal_Monolith_Simulator()
+        calls = stub_solver(test, [opt, TerminationCondition.infeasible, opt])
+        result = test.run_solver_with_dynamic_tolerance(options={})
+        assert result[1] == TerminationCondition.infeasible
+        assert len(calls) == 2
+
+    @pytest.mark.unit
+    def test_print_results_bad_species(self):
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model_with_surface.json')
+
+        # Bad species lists raise (instead of exiting), so the object is still usable
+        with pytest.raises(ValueError, match="XYZ is not a species in the model"):
+            test.print_results_of_breakthrough(["XYZ"], "Unaged", "250C", file_name="XYZ_breakthrough.txt")
+        with pytest.raises(ValueError, match="Need to provide species as a list"):
+            test.print_results_all_locations("NH3", "Unaged", "250C", file_name="NH3_all_loc.txt")
+        with pytest.raises(ValueError, match="XYZ is not a species in the model"):
+            test.print_results_of_integral_average(["q1","XYZ"], "Unaged", "250C", file_name="XYZ_integral_avg.txt")
+
+        test.print_results_of_breakthrough(["NH3"], "Unaged", "250C", file_name="NH3_after_error_breakthrough.txt")
+
+    @pytest.mark.unit
+    def test_print_results_to_open_file(self):
+        test = Isothermal_Monolith_Simulator()
+        test.load_model_full('output/sample_model_with_surface.json')
+
+        # Several results batched into a single file that stays open
+        with open('output/batched_results.txt', 'w') as file:
+            test.print_results_of_breakthrough(["NH3"], "Unaged", "250C", file=file)
+            test.print_results_of_integral_average(["q1","S1"], "Unaged", "250C", file=file)
+            test.print_results_all_locations(["NH3"], "Unaged", "250C", file=file)
+            assert file.closed == False
+
+        test.print_results_of_breakthrough(["NH3"], "Unaged", "250C", file_name="NH3_single_breakthrough.txt")
+        with open('output/batched_results.txt', 'r') as file:
+            batched = file.read()
+        with open('output/NH3_single_breakthrough.txt', 'r') as file:
+            single = file.read()
+        assert batched.startswith(single)
+        assert 'Integral average results in table below' in batched
+        assert 'Results for bulk NH3_b in table below' in batched
@@ -12,6 +12,48 @@ __author__ = "Austin Ladshaw"
 
 _log = logging.getLogger(__name__)
 
+# Build a discretized NH3 adsorption model for the given temperatures
+#   (module-level, so that it can be passed to 'simulate_all_conditions')
+def build_NH3_adsorption(temp_list):
+    obj = Isothermal_Monolith_Simulator()
+    obj.add_axial_dim(0,5)
+    obj.add_temporal_dim(0,20)
+    obj.add_age_set("Unaged")
+    obj.add_temperature_set(temp_list)
+    obj.add_gas_species("NH3")
+    obj.add_surface_species("ZNH4")
+    obj.add_surface_sites("ZH")
+    obj.add_reactions({"r1": ReactionType.EquilibriumArrhenius})
+
+    obj.set_bulk_porosity(0.3309)
+    obj.set_cell_density(62)
+    obj.set_washcoat_porosity(0.4)
+    obj.set_reactor_radius(1)
+    obj.set_site_density("ZH","Unaged",0.1152619)
+    obj.set_site_balance("ZH",{"mol_occupancy": {"ZNH4": 1}})
+    obj.set_reaction_info("r1", {"parameters": {"A": 250000, "E": 0, "dH": -54000, "dS": 30},
+                                "mol_reactants": {"ZH": 1, "NH3": 1},
+                                "mol_products": {"ZNH4": 1},
+                                "rxn_orders": {"ZH": 1, "NH3": 1, "ZNH4": 1}})
+    for temp in temp_list:
+        obj.set_isothermal_temp("Unaged",temp,float(temp[:-1])+273.15)
+
+    obj.build_constraints()
+    obj.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                        tstep=5,elems=5,colpoints=2)
+
+    for temp in temp_list:
+        obj.set_const_IC("NH3","Unaged",temp,0)
+        obj.set_const_IC("ZNH4","Unaged",temp,0)
+        obj.set_time_dependent_BC("NH3","Unaged",temp,
+                                    time_value_pairs=[(4,6.9762939977887255e-06)],
+                                    initial_value=0)
+    return obj
+
+# Build the model of a single condition (age is always "Unaged" here)
+def build_NH3_adsorption_condition(age, temp):
+    return build_NH3_adsorption([temp])
+
 # Start test class
 class TestIsothermalCatalystBuildOptions():
     @pytest.fixture(scope="class")
@@ -49,6 +91,11 @@ class TestIsothermalCatalystBuildOptions():
         obj = Isothermal_Monolith_Simulator()
         return obj
 
+    @pytest.fixture(scope="class")
+    def bulk_ICs(self):
+        obj = Isothermal_Monolith_Simulator()
+        return obj
+
     @pytest.mark.build
     def test_temperature_ramping(self, temperature_ramp):
         test = temperature_ramp
@@ -284,6 +331,23 @@ class TestIsothermalCatalystBuildOptions():
         assert value(test.model.rxn_orders["r4","A"]) == 2
         assert value(test.model.rxn_orders["r4","x"]) == 1
 
+        test.set_reaction_param_bounds_bulk({"r1": ("dH", 0.5, 2),
+                                             "r2": ("A", 0.5, 2),
+                                             "r4": ("A", 0.8, 6)})
+
+        assert pytest.approx(-55373.27775*2, rel=1e-3) == test.model.dH["r1"].lb
+        assert pytest.approx(-55373.27775*0.5, rel=1e-3) == test.model.dH["r1"].ub
+        assert pytest.approx(125000, rel=1e-3) == test.model.A["r2"].lb
+        assert pytest.approx(500000, rel=1e-3) == test.model.A["r2"].ub
+        assert pytest.approx(200000, rel=1e-3) == test.model.A["r4"].lb
+        assert pytest.approx(1500000, rel=1e-3) == test.model.A["r4"].ub
+
+        test.fix_reactions(["r1","r2"])
+        assert test.model.dH["r1"].fixed == True
+        assert test.model.A["r2"].fixed == True
+        assert test.model.A["r4"].fixed == False
+        test.unfix_all_reactions()
+
     @pytest.mark.build
     def test_ppm_BCs_with_ramp(self, ppm_BCs_with_temp_ramp):
         test = ppm_BCs_with_temp_ramp
@@ -725,3 +789,76 @@ class TestIsothermalCatalystBuildOptions():
         assert test.model.Smax["k","Unaged",3,3].value == 0.2
         assert test.model.Smax["k","Unaged",4,4].value == 0.1
         assert test.model.Smax["k","Unaged",5,5].value == 0.1
+
+    @pytest.mark.build
+    def test_set_const_ICs(self, bulk_ICs):
+        test = bulk_ICs
+        test.add_axial_dim(0,5)
+        test.add_temporal_dim(0,10)
+
+        test.add_age_set(["Unaged","2hr"])
+        test.add_temperature_set("150C")
+        test.add_gas_species(["NH3","NO"])
+        test.add_surface_species(["q1"])
+        test.add_surface_sites(["S1"])
+
+        test.set_bulk_porosity(0.3309)
+        test.set_washcoat_porosity(0.4)
+        test.set_reactor_radius(1)
+        test.set_space_velocity_all_runs(500)
+        test.set_cell_density(62)
+        test.set_site_density("S1","Unaged",0.1)
+        test.set_site_density("S1","2hr",0.1)
+
+        test.add_reactions({})
+        test.set_isothermal_temp("Unaged","150C",150+273.15)
+        test.set_isothermal_temp("2hr","150C",150+273.15)
+
+        test.build_constraints()
+        test.discretize_model(method=DiscretizationMethod.FiniteDifference,
+                            tstep=10,elems=5,colpoints=2)
+
+        with pytest.raises(Exception):
+            test.set_const_ICs({("NH3","Unaged","150C"): 1e-3, ("NO","Unaged","150C"): -1})
+        assert test.isInitialSet["NH3"]["Unaged"]["150C"] == False
+
+        test.set_const_ICs({("NH3","Unaged","150C"): 1e-3,
+                            ("NO","2hr","150C"): 0,
+                            ("q1","Unaged","150C"): 0.5,
+                            ("S1","Unaged","150C"): 0})
+
+        for loc in test.model.z:
+            assert value(test.model.Cb["NH3","Unaged","150C",loc,0]) == 1e-3
+            assert value(test.model.C["NH3","Unaged","150C",loc,0]) == 1e-3
+            assert value(test.model.Cb["NO","2hr","150C",loc,0]) == 1e-20
+            assert value(test.model.q["q1","Unaged","150C",loc,0]) == 0.5
+            assert test.model.Cb["NH3","Unaged","150C",loc,0].fixed == True
+            assert test.model.C["NO","2hr","150C",loc,0].fixed == True
+            assert test.model.q["q1","Unaged","150C",loc,0].fixed == True
+            assert test.model.Cb["NH3","Unaged","150C",loc,1].fixed == False
+
+        assert test.isInitialSet["NH3"]["Unaged"]["150C"] == True
+        assert test.isInitialSet["NO"]["2hr"]["150C"] == True
+        assert test.isInitialSet["q1"]["Unaged"]["150C"] == True
+        assert test.isInitialSet["S1"]["Unaged"]["150C"] == True
+        assert test.isInitialSet["NO"]["Unaged"]["150C"] == False
+
+    @pytest.mark.solver
+    def test_simulate_all_conditions(self):
+        test = build_NH3_adsorption(["250C","300C"])
+        solution = test.simulate_all_conditions(build_NH3_adsorption_condition, n_workers=1)
+
+        ref = build_NH3_adsorption(["250C","300C"])
+        ref.initialize_simulator()
+        (stat, cond) = ref.run_solver()
+        assert cond == TerminationCondition.optimal
+        expected = ref.extract_solution()
+
+        # Both the extracted solution and the model itself hold the results
+        assert set(solution.keys()) == set(expected.keys())
+        for key in expected:
+            assert np.allclose(solution[key], expected[key], rtol=1e-4, atol=1e-10, equal_nan=True)
+        for name in ['Cb','C','q','S']:
+            for index, var in getattr(ref.model, name).items():
+                assert pytest.approx(var.value, rel=1e-4, abs=1e-10) == \
+                    value(getattr(test.model, name)[index])
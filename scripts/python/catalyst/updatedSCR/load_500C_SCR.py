@@ -4,7 +4,14 @@
 
 import sys
 sys.path.append('../..')
-from catalyst.isothermal_monolith_catalysis import *
+from catalyst.isothermal_monolith_catalysis import Isothermal_Monolith_Simulator, LinearSolverMethod
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Species printed out for each aging condition
+GAS = ("NH3","NO","NO2","N2O","O2","N2","H2O")
+ADS = ("Z1CuOH-NH3","Z2Cu-NH3","Z2Cu-(NH3)2","ZNH4",
+        "Z1CuOH-NH4NO3", "Z2Cu-NH4NO3", "ZH-NH4NO3")
 
 # Create a simulator object and Load a full model from json
 run = "05"                              #update this number to reflect changes in runs
@@ -16,12 +23,7 @@ sim = Isothermal_Monolith_Simulator()
 sim.load_model_full(readfile, reset_param_bounds=True)
 
 sim.unfix_all_reactions()
-sim.fix_reaction("r1")
-sim.fix_reaction("r2a")
-sim.fix_reaction("r2b")
-sim.fix_reaction("r3")
-sim.fix_reaction("r4a")
-sim.fix_reaction("r4b")
+sim.fix_reactions(["r1","r2a","r2b","r3","r4a","r4b"])
 
 # NOTE: This downward bias helps tremendously with the fits (try at higher temps as well)
 old_rxns = ["r5f","r5r","r6f","r6r","r7","r8","r9","r13","r14","r15","r18","r19"]
@@ -30,36 +32,14 @@ new_oxd_rxns = ["r10","r11","r12"]
 cuo_rxns = ["r34","r35","r36"]
 n2o_rxns = ["r37","r38","r39"]
 
-upper = 1+1
-lower = 1-0.5
-for rxn in old_rxns:
-    sim.set_reaction_param_bounds(rxn, "A", bounds=(sim.model.A[rxn].value*lower,sim.model.A[rxn].value*upper))
-    #sim.fix_reaction(rxn)
-
-upper = 1+1
-lower = 1-0.5
-for rxn in new_rxns:
-    sim.set_reaction_param_bounds(rxn, "A", bounds=(sim.model.A[rxn].value*lower,sim.model.A[rxn].value*upper))
-    #sim.fix_reaction(rxn)
-
-upper_val = 20000
-lower_val = 10000
-upper = 1+5
-lower = 1-0.2
-for rxn in new_oxd_rxns:
-    #sim.set_reaction_param_bounds(rxn, "A", bounds=(lower_val,upper_val))
-    sim.set_reaction_param_bounds(rxn, "A", bounds=(sim.model.A[rxn].value*lower,sim.model.A[rxn].value*upper))
-    #sim.fix_reaction(rxn)
+# Bounds relative to the current values of A: (param, lower, upper)
+bounds_dict = {}
+for rxn in old_rxns + new_rxns:
+    bounds_dict[rxn] = ("A", 1-0.5, 1+1)
+for rxn in new_oxd_rxns + cuo_rxns:
+    bounds_dict[rxn] = ("A", 1-0.2, 1+5)
+sim.set_reaction_param_bounds_bulk(bounds_dict)
 #sim.set_reaction_param_bounds("r12", "A", bounds=(350,700))
-
-upper_val = 400000
-lower_val = 100000
-upper = 1+5
-lower = 1-0.2
-for rxn in cuo_rxns:
-    #sim.set_reaction_param_bounds(rxn, "A", bounds=(lower_val,upper_val))
-    sim.set_reaction_param_bounds(rxn, "A", bounds=(sim.model.A[rxn].value*lower,sim.model.A[rxn].value*upper))
-    #sim.fix_reaction(rxn)
 #sim.set_reaction_param_bounds("r36", "A", bounds=(10000,40000))
 
 upper_val = 10000
@@ -119,47 +99,38 @@ sim.ignore_weight_factor("NO2","16hr","500C",time_window=(118,130))
 sim.ignore_weight_factor("N2O","16hr","500C",time_window=(118,130))
 
 sim.finalize_auto_scaling()
-sim.run_solver()
-
-sim.print_results_of_breakthrough(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "Unaged", "500C", file_name="Unaged_SCR_500C_breakthrough.txt")
-sim.print_results_of_location(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "Unaged", "500C", 0, file_name="Unaged_SCR_500C_bypass.txt")
-sim.print_results_of_integral_average(["Z1CuOH-NH3","Z2Cu-NH3","Z2Cu-(NH3)2","ZNH4",
-                                        "Z1CuOH-NH4NO3", "Z2Cu-NH4NO3", "ZH-NH4NO3"],
-                                        "Unaged", "500C", file_name="Unaged_SCR_500C_average_ads.txt")
-
-sim.print_results_of_breakthrough(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "2hr", "500C", file_name="2hr_SCR_500C_breakthrough.txt")
-sim.print_results_of_location(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "2hr", "500C", 0, file_name="2hr_SCR_500C_bypass.txt")
-sim.print_results_of_integral_average(["Z1CuOH-NH3","Z2Cu-NH3","Z2Cu-(NH3)2","ZNH4",
-                                        "Z1CuOH-NH4NO3", "Z2Cu-NH4NO3", "ZH-NH4NO3"],
-                                        "2hr", "500C", file_name="2hr_SCR_500C_average_ads.txt")
-
-sim.print_results_of_breakthrough(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "4hr", "500C", file_name="4hr_SCR_500C_breakthrough.txt")
-sim.print_results_of_location(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "4hr", "500C", 0, file_name="4hr_SCR_500C_bypass.txt")
-sim.print_results_of_integral_average(["Z1CuOH-NH3","Z2Cu-NH3","Z2Cu-(NH3)2","ZNH4",
-                                        "Z1CuOH-NH4NO3", "Z2Cu-NH4NO3", "ZH-NH4NO3"],
-                                        "4hr", "500C", file_name="4hr_SCR_500C_average_ads.txt")
-
-sim.print_results_of_breakthrough(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "8hr", "500C", file_name="8hr_SCR_500C_breakthrough.txt")
-sim.print_results_of_location(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "8hr", "500C", 0, file_name="8hr_SCR_500C_bypass.txt")
-sim.print_results_of_integral_average(["Z1CuOH-NH3","Z2Cu-NH3","Z2Cu-(NH3)2","ZNH4",
-                                        "Z1CuOH-NH4NO3", "Z2Cu-NH4NO3", "ZH-NH4NO3"],
-                                        "8hr", "500C", file_name="8hr_SCR_500C_average_ads.txt")
-
-sim.print_results_of_breakthrough(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "16hr", "500C", file_name="16hr_SCR_500C_breakthrough.txt")
-sim.print_results_of_location(["NH3","NO","NO2","N2O","O2","N2","H2O"],
-                                        "16hr", "500C", 0, file_name="16hr_SCR_500C_bypass.txt")
-sim.print_results_of_integral_average(["Z1CuOH-NH3","Z2Cu-NH3","Z2Cu-(NH3)2","ZNH4",
-                                        "Z1CuOH-NH4NO3", "Z2Cu-NH4NO3", "ZH-NH4NO3"],
-                                        "16hr", "500C", file_name="16hr_SCR_500C_average_ads.txt")
+# NOTE: The cost of this solve is dominated by the sparse linear solves inside
+#       ipopt. For this (larger) model, the linear solver is the knob to turn.
+#       This call already defaults to LinearSolverMethod.MA97; pass, e.g.,
+#       options={'linear_solver': LinearSolverMethod.MA57, ...} to try another. The
+#       model is a fully discretized DAE, so it cannot be handed off to an
+#       ODE integrator (e.g., CVODES) without rebuilding it.
+sim.run_solver_with_dynamic_tolerance()
+
+# Pull the solution out of the model once for all the printing below
+sim.extract_solution()
+
+# Post-processing for each aging condition is independent of the others, so
+#   each is dumped in its own process. The solved model is inherited by the
+#   workers through 'fork' (Pyomo models do not pickle cleanly), which is only
+#   available on Linux/Mac. Otherwise, we fall back to running them in serial.
+def dump_aging(label):
+    sim.print_results_of_breakthrough(GAS, label, "500C", file_name=label+"_SCR_500C_breakthrough.txt")
+    sim.print_results_of_location(GAS, label, "500C", 0, file_name=label+"_SCR_500C_bypass.txt")
+    sim.print_results_of_integral_average(ADS, label, "500C", file_name=label+"_SCR_500C_average_ads.txt")
+    return label
+
+aging_labels = ["Unaged","2hr","4hr","8hr","16hr"]
+
+if __name__ == "__main__":
+    if "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=len(aging_labels),
+                                mp_context=multiprocessing.get_context("fork")) as pool:
+            for label in pool.map(dump_aging, aging_labels):
+                print("Finished printing results for "+label)
+    else:
+        for label in aging_labels:
+            dump_aging(label)
 
 sim.print_kinetic_parameter_info(file_name="500C_opt_params"+run+".txt")
 sim.save_model_state(file_name=writefile)